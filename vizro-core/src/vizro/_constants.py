@@ -3,6 +3,8 @@
 ALL_OPTION = "ALL"
 NONE_OPTION = "NONE"
 STATIC_URL_PREFIX = "vizro"
+DOWNLOAD_URL_PREFIX = "vizro-download"
+METRICS_URL_PATH = "vizro-metrics"
 MODULE_PAGE_404 = "not_found_404"
 EMPTY_SPACE_CONST = -1
 ON_PAGE_LOAD_ACTION_PREFIX = "on_page_load_action"
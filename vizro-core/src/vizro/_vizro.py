@@ -1,13 +1,15 @@
 import logging
 from pathlib import Path
-from typing import List
+from typing import List, Optional, Union
 
 import dash
 import flask
 
-from vizro._constants import STATIC_URL_PREFIX
+from vizro._constants import DOWNLOAD_URL_PREFIX, METRICS_URL_PATH, STATIC_URL_PREFIX
 from vizro.managers import data_manager, model_manager
-from vizro.models import Dashboard
+from vizro.managers._figure_cache import FigureCache
+from vizro.managers._metrics import Metrics, _observe_serialisation, _serve_metrics
+from vizro.models import Action, Dashboard
 
 logger = logging.getLogger(__name__)
 
@@ -15,14 +17,42 @@ logger = logging.getLogger(__name__)
 class Vizro:
     """The main class of the `vizro` package."""
 
-    def __init__(self, **kwargs):
+    def __init__(
+        self,
+        figure_workers: Optional[int] = None,
+        figure_cache_size: Optional[int] = None,
+        metrics: bool = False,
+        data_workers: Optional[int] = None,
+        export_dir: Optional[Union[str, Path]] = None,
+        **kwargs,
+    ):
         """Initializes Dash app, stored in `self.dash`.
 
         Args:
+            figure_workers: If set, the figures updated by a filter, parameter or page load are built concurrently by
+                this number of threads. A figure that fails to build is then left unchanged rather than failing the
+                update of all other figures. Defaults to `None`, which builds figures one after the other.
+            figure_cache_size: If set, `Graph` and `Table` figures are cached up to this maximum memory in bytes, so
+                that a figure is only built once for the same data, filters, parameters and theme. The memory used by a
+                figure is estimated from the arrays, strings and numbers it contains. The least recently used figures
+                are evicted first. Defaults to `None`, which disables the cache.
+            metrics: Whether to time each stage of actions (e.g. data loading, filtering and building figures) and
+                serve the timings as Prometheus histograms at the route `/vizro-metrics`. Defaults to `False`.
+            data_workers: If set, all datasets added to the data manager as a callable that are used by the dashboard
+                are loaded concurrently by this number of threads when the dashboard is built, and the time taken to
+                load each dataset is logged. Defaults to `None`, which loads each dataset on its first use.
+            export_dir: Directory that `export_data(streaming=True)` writes exported files to. It must be private to the
+                user that runs the dashboard, and shared by all processes that serve the dashboard, e.g. a volume
+                mounted on all of them. It is created if it does not exist. Defaults to `None`, which uses a directory
+                in the system's temporary directory that is shared by all processes on the same machine.
             kwargs: Passed through to `Dash.__init__`, e.g. `assets_folder`, `url_base_pathname`. See
                 [Dash documentation](https://dash.plotly.com/reference#dash.dash) for possible arguments.
         """
         self.dash = dash.Dash(**kwargs, use_pages=True, pages_folder="", title="Vizro")
+        self.dash.server.config["VIZRO_FIGURE_WORKERS"] = figure_workers
+        self.dash.server.config["VIZRO_DATA_WORKERS"] = data_workers
+        if figure_cache_size is not None:
+            self.dash.server.extensions["vizro_figure_cache"] = FigureCache(maxsize=figure_cache_size)
         self.dash.config.external_stylesheets.append(
             "https://fonts.googleapis.com/css2?family=Material+Symbols+Outlined"
         )
@@ -52,6 +82,27 @@ class Vizro:
             )
         )
 
+        # Serve files exported by export_data(streaming=True).
+        from vizro.actions import _export_utils
+        from vizro.actions._export_utils import _serve_export
+
+        _export_utils._export_dir = Path(export_dir) if export_dir is not None else None
+
+        self.dash.server.add_url_rule(
+            f"{self.dash.config.routes_pathname_prefix}{DOWNLOAD_URL_PREFIX}/<export_file>/<filename>",
+            endpoint=f"{blueprint_prefix}vizro_download",
+            view_func=_serve_export,
+        )
+
+        if metrics:
+            self.dash.server.extensions["vizro_metrics"] = Metrics()
+            self.dash.server.after_request(_observe_serialisation)
+            self.dash.server.add_url_rule(
+                f"{self.dash.config.routes_pathname_prefix}{METRICS_URL_PATH}",
+                endpoint=f"{blueprint_prefix}vizro_metrics",
+                view_func=_serve_metrics,
+            )
+
     def build(self, dashboard: Dashboard):
         """Builds the dashboard.
 
@@ -65,9 +116,32 @@ class Vizro:
         if dashboard.title:
             self.dash.title = dashboard.title
 
+        # Load data before pre_build, which would otherwise load each dataset in turn on first use.
+        data_workers = self.dash.server.config["VIZRO_DATA_WORKERS"]
+        if data_workers:
+            data_manager._load_lazy_datasets(workers=data_workers)
+
         # Note that model instantiation and pre_build are independent of Dash.
         self._pre_build()
 
+        if self.dash._background_manager is None and any(
+            action.background for _, action in model_manager._items_with_type(Action)
+        ):
+            raise ValueError(
+                "Actions with `background=True` require a background callback manager, e.g. "
+                "`Vizro(background_callback_manager=dash.DiskcacheManager())`."
+            )
+
+        # Filters and parameters are only complete once all models are pre-built.
+        from vizro.actions._actions_utils import _get_target_plans
+
+        _get_target_plans.cache_clear()
+        _get_target_plans()
+
+        # Figures cached for a previously built dashboard might have the same component IDs as this one.
+        if "vizro_figure_cache" in self.dash.server.extensions:
+            self.dash.server.extensions["vizro_figure_cache"].clear()
+
         self.dash.layout = dashboard.build()
 
         return self
@@ -100,8 +174,11 @@ class Vizro:
     @staticmethod
     def _reset():
         """Private method that clears all state in the vizro app."""
+        from vizro.actions._actions_utils import _get_target_plans
+
         data_manager._clear()
         model_manager._clear()
+        _get_target_plans.cache_clear()
         dash._callback.GLOBAL_CALLBACK_LIST = []
         dash._callback.GLOBAL_CALLBACK_MAP = {}
         dash._callback.GLOBAL_INLINE_SCRIPTS = []
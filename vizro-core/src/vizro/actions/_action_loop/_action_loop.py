@@ -5,6 +5,7 @@ from dash import html
 from vizro.actions._action_loop._action_loop_utils import _get_actions_on_registered_pages
 from vizro.actions._action_loop._build_action_loop_callbacks import _build_action_loop_callbacks
 from vizro.actions._action_loop._get_action_loop_components import _get_action_loop_components
+from vizro.managers import model_manager
 
 
 class ActionLoop:
@@ -34,5 +35,8 @@ class ActionLoop:
         Returns:
             List of required components for each `Action` in the `Dashboard` e.g. List[dcc.Download]
         """
+        # Relations between actions, the models that trigger them and their pages are found once for all actions,
+        # after all models have been pre-built, rather than relying on relations found while models were still changing.
+        model_manager._get_relations(refresh=True)
         actions = _get_actions_on_registered_pages()
         return html.Div([action.build() for action in actions], id="app_action_models_components_div", hidden=True)
@@ -2,20 +2,48 @@
 
 from __future__ import annotations
 
+import contextvars
+import logging
+import threading
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
-from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, TypedDict, Union
-
+from functools import lru_cache
+from itertools import chain
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Literal,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TypedDict,
+    Union,
+)
+
+import flask
+import numpy as np
 import pandas as pd
+from dash import ctx, no_update
+from dash.exceptions import MissingCallbackContextException
 
 from vizro._constants import ALL_OPTION, NONE_OPTION
 from vizro.managers import data_manager, model_manager
+from vizro.managers._data_index import CategoryIndex, SortedIndex
+from vizro.managers._figure_cache import FigureCache
+from vizro.managers._metrics import _time_stage
 from vizro.managers._model_manager import ModelID
 from vizro.models.types import MultiValueType, SelectorType, SingleValueType
 
 if TYPE_CHECKING:
     from vizro.models import Action, VizroBaseModel
 
+logger = logging.getLogger(__name__)
+
 ValidatedNoneValueType = Union[SingleValueType, MultiValueType, None, List[None]]
 
 
@@ -46,38 +74,106 @@ def _get_component_actions(component) -> List[Action]:
     )
 
 
-def _apply_filters(
-    data_frame: pd.DataFrame,
-    ctds_filters: List[CallbackTriggerDict],
-    target: str,
+class FilterCondition(NamedTuple):
+    """Condition that rows of a target's data must meet, as given by a filter or a filter interaction."""
+
+    column: str
+    filter_function: Callable[[pd.Series, Any], pd.Series]
+    value: Any
+
+
+def _get_indexed_filter_mask(data_frame: pd.DataFrame, target: str, condition: FilterCondition) -> Optional[np.ndarray]:
+    """Returns the mask of `condition` using a precomputed index if there is one that is aligned with `data_frame`."""
+    from vizro.models._controls.filter import _filter_between, _filter_isin
+
+    if condition.filter_function is _filter_isin:
+        category_index = data_manager._get_filter_index(target, condition.column, CategoryIndex)
+        if (
+            category_index is not None
+            and category_index.is_aligned(data_frame)
+            and category_index.can_lookup(condition.value)
+        ):
+            return category_index.isin(condition.value)
+
+    if condition.filter_function is _filter_between:
+        sorted_index = data_manager._get_filter_index(target, condition.column, SortedIndex)
+        if sorted_index is not None and sorted_index.is_aligned(data_frame):
+            return sorted_index.between(condition.value[0], condition.value[1])
+
+    return None
+
+
+def _estimate_selectivity(condition: FilterCondition) -> float:
+    """Roughly estimates the fraction of rows that meet `condition`, to evaluate the most selective conditions first."""
+    from vizro.models._controls.filter import _filter_isin
+
+    # Selecting fewer categories typically selects fewer rows. Ranges have no cheap estimate, so come last.
+    return len(condition.value) if condition.filter_function is _filter_isin else float("inf")
+
+
+def _get_scan_filter_mask(series: pd.Series, condition: FilterCondition) -> np.ndarray:
+    """Returns the mask of `condition` evaluated on `series`, where a missing result does not meet the condition."""
+    # Nullable dtypes such as Int64 give a boolean result that contains NA rather than a plain bool array.
+    return pd.Series(condition.filter_function(series, condition.value)).to_numpy(dtype=bool, na_value=False)
+
+
+def _apply_filter_conditions(
+    data_frame: pd.DataFrame, target: str, filter_conditions: List[FilterCondition]
 ) -> pd.DataFrame:
+    """Filters `data_frame` to the rows that meet all `filter_conditions`, creating the filtered data_frame only once.
+
+    Conditions with a precomputed index are evaluated first since they do not need to scan their column. The remaining
+    conditions are evaluated from the most to the least selective, each only on the rows that still remain when these
+    are few enough that selecting them first is cheaper than scanning the whole column.
+    """
+    mask: Optional[np.ndarray] = None
+    scan_conditions = []
+    for condition in filter_conditions:
+        condition_mask = _get_indexed_filter_mask(data_frame, target, condition)
+        if condition_mask is None:
+            scan_conditions.append(condition)
+        else:
+            mask = condition_mask if mask is None else mask & condition_mask
+
+    for condition in sorted(scan_conditions, key=_estimate_selectivity):
+        if mask is None:
+            mask = _get_scan_filter_mask(data_frame[condition.column], condition)
+            continue
+        positions = np.flatnonzero(mask)
+        if len(positions) < len(mask) // 2:
+            mask[positions] = _get_scan_filter_mask(data_frame[condition.column].iloc[positions], condition)
+        else:
+            mask &= _get_scan_filter_mask(data_frame[condition.column], condition)
+
+    return data_frame if mask is None else data_frame[mask]
+
+
+def _get_filter_conditions(ctds_filters: List[CallbackTriggerDict], target: str) -> List[FilterCondition]:
+    if not ctds_filters:
+        return []
+
+    target_filters = _get_target_plan(ModelID(target)).filters
+    filter_conditions = []
     for ctd in ctds_filters:
         selector_value = ctd["value"]
         selector_value = selector_value if isinstance(selector_value, list) else [selector_value]
-        selector_actions = _get_component_actions(model_manager[ctd["id"]])
-
-        for action in selector_actions:
-            if (
-                action.function._function.__name__ != "_filter"
-                or target not in action.function["targets"]
-                or ALL_OPTION in selector_value
-            ):
-                continue
+        if ALL_OPTION in selector_value:
+            continue
 
-            _filter_function = action.function["filter_function"]
-            _filter_column = action.function["filter_column"]
-            _filter_value = selector_value
-            data_frame = data_frame[_filter_function(data_frame[_filter_column], _filter_value)]
+        for filter_column, filter_function in target_filters.get(ctd["id"], []):
+            filter_conditions.append(FilterCondition(filter_column, filter_function, selector_value))
 
-    return data_frame
+    return filter_conditions
 
 
-def _apply_graph_filter_interaction(
-    data_frame: pd.DataFrame, target: str, ctd_filter_interaction: Dict[str, CallbackTriggerDict]
-) -> pd.DataFrame:
+def _get_graph_filter_interaction_conditions(
+    target: str, ctd_filter_interaction: Dict[str, CallbackTriggerDict]
+) -> List[FilterCondition]:
+    from vizro.models._controls.filter import _filter_isin
+
     ctd_click_data = ctd_filter_interaction["clickData"]
     if not ctd_click_data["value"]:
-        return data_frame
+        return []
 
     source_graph_id: ModelID = ctd_click_data["id"]
     source_graph_actions = _get_component_actions(model_manager[source_graph_id])
@@ -88,72 +184,66 @@ def _apply_graph_filter_interaction(
 
     customdata = ctd_click_data["value"]["points"][0]["customdata"]
 
+    filter_conditions = []
     for action in source_graph_actions:
         if action.function._function.__name__ != "filter_interaction" or target not in action.function["targets"]:
             continue
         for custom_data_idx, column in enumerate(custom_data_columns):
-            data_frame = data_frame[data_frame[column].isin([customdata[custom_data_idx]])]
+            filter_conditions.append(FilterCondition(column, _filter_isin, [customdata[custom_data_idx]]))
 
-    return data_frame
+    return filter_conditions
 
 
 def _get_parent_vizro_model(_underlying_callable_object_id: str) -> VizroBaseModel:
-    from vizro.models import VizroBaseModel
+    vizro_base_model = model_manager._get_callable_object_model(_underlying_callable_object_id)
+    if vizro_base_model is None:
+        raise KeyError(
+            f"No parent Vizro model found for underlying callable object with id: {_underlying_callable_object_id}."
+        )
+    return vizro_base_model
 
-    for _, vizro_base_model in model_manager._items_with_type(VizroBaseModel):
-        if (
-            hasattr(vizro_base_model, "_callable_object_id")
-            and vizro_base_model._callable_object_id == _underlying_callable_object_id
-        ):
-            return vizro_base_model
-    raise KeyError(
-        f"No parent Vizro model found for underlying callable object with id: {_underlying_callable_object_id}."
-    )
 
+def _get_table_filter_interaction_conditions(
+    target: str, ctd_filter_interaction: Dict[str, CallbackTriggerDict]
+) -> List[FilterCondition]:
+    from vizro.models._controls.filter import _filter_isin
 
-def _apply_table_filter_interaction(
-    data_frame: pd.DataFrame, target: str, ctd_filter_interaction: Dict[str, CallbackTriggerDict]
-) -> pd.DataFrame:
     ctd_active_cell = ctd_filter_interaction["active_cell"]
     ctd_derived_viewport_data = ctd_filter_interaction["derived_viewport_data"]
     if not ctd_active_cell["value"] or not ctd_derived_viewport_data["value"]:
-        return data_frame
+        return []
 
     # ctd_active_cell["id"] represents the underlying table id, so we need to fetch its parent Vizro Table actions.
     source_table_actions = _get_component_actions(_get_parent_vizro_model(ctd_active_cell["id"]))
 
+    filter_conditions = []
     for action in source_table_actions:
         if action.function._function.__name__ != "filter_interaction" or target not in action.function["targets"]:
             continue
         column = ctd_active_cell["value"]["column_id"]
         derived_viewport_data_row = ctd_active_cell["value"]["row"]
         clicked_data = ctd_derived_viewport_data["value"][derived_viewport_data_row][column]
-        data_frame = data_frame[data_frame[column].isin([clicked_data])]
+        filter_conditions.append(FilterCondition(column, _filter_isin, [clicked_data]))
 
-    return data_frame
+    return filter_conditions
 
 
-def _apply_filter_interaction(
-    data_frame: pd.DataFrame,
-    ctds_filter_interaction: List[Dict[str, CallbackTriggerDict]],
-    target: str,
-) -> pd.DataFrame:
+def _get_filter_interaction_conditions(
+    ctds_filter_interaction: List[Dict[str, CallbackTriggerDict]], target: str
+) -> List[FilterCondition]:
+    filter_conditions = []
     for ctd_filter_interaction in ctds_filter_interaction:
         if "clickData" in ctd_filter_interaction:
-            data_frame = _apply_graph_filter_interaction(
-                data_frame=data_frame,
-                target=target,
-                ctd_filter_interaction=ctd_filter_interaction,
+            filter_conditions.extend(
+                _get_graph_filter_interaction_conditions(target=target, ctd_filter_interaction=ctd_filter_interaction)
             )
 
         if "active_cell" in ctd_filter_interaction and "derived_viewport_data" in ctd_filter_interaction:
-            data_frame = _apply_table_filter_interaction(
-                data_frame=data_frame,
-                target=target,
-                ctd_filter_interaction=ctd_filter_interaction,
+            filter_conditions.extend(
+                _get_table_filter_interaction_conditions(target=target, ctd_filter_interaction=ctd_filter_interaction)
             )
 
-    return data_frame
+    return filter_conditions
 
 
 def _validate_selector_value_none(value: Union[SingleValueType, MultiValueType]) -> ValidatedNoneValueType:
@@ -198,7 +288,11 @@ def _get_parametrized_config(
         if "data_frame" in graph_config:
             graph_config.pop("data_frame")
 
+        target_parameters = _get_target_plan(target).parameters if parameters else {}
         for ctd in parameters:
+            if ctd["id"] not in target_parameters:
+                continue
+
             selector_value = ctd[
                 "value"
             ]  # TODO: needs to be refactored so that it is independent of implementation details
@@ -206,50 +300,212 @@ def _get_parametrized_config(
                 selector: SelectorType = model_manager[ctd["id"]]
                 selector_value = selector.options
             selector_value = _validate_selector_value_none(selector_value)
-            selector_actions = _get_component_actions(model_manager[ctd["id"]])
 
-            for action in selector_actions:
-                action_targets = _create_target_arg_mapping(action.function["targets"])
+            for action_targets_arg in target_parameters[ctd["id"]]:
+                graph_config = _update_nested_graph_properties(
+                    graph_config=graph_config, dot_separated_string=action_targets_arg, value=selector_value
+                )
+
+        parameterized_config[target] = graph_config
+
+    return parameterized_config
 
-                if action.function._function.__name__ != "_parameter" or target not in action_targets:
-                    continue
 
-                for action_targets_arg in action_targets[target]:
-                    graph_config = _update_nested_graph_properties(
-                        graph_config=graph_config, dot_separated_string=action_targets_arg, value=selector_value
+class _TargetPlan(NamedTuple):
+    """Filters and parameters that apply to a target, found once from the model tree rather than in every callback."""
+
+    # Column and filter function of each filter action that targets the target, by the ID of its selector.
+    filters: Dict[ModelID, List[Tuple[str, Callable[[pd.Series, Any], pd.Series]]]]
+    # Dot-separated paths of the arguments of the target that each parameter action sets, by the ID of its selector.
+    parameters: Dict[ModelID, List[str]]
+
+
+_EMPTY_TARGET_PLAN = _TargetPlan(filters={}, parameters={})
+
+
+def _compile_target_plans() -> Dict[ModelID, _TargetPlan]:
+    """Finds the filters and parameters that apply to each target. Must be called once all models are pre-built."""
+    from vizro.models import Filter, Parameter
+
+    target_plans: Dict[ModelID, _TargetPlan] = defaultdict(lambda: _TargetPlan(filters={}, parameters={}))
+    for _, control in chain(model_manager._items_with_type(Filter), model_manager._items_with_type(Parameter)):
+        # Callbacks receive the values of the selectors of controls, so the plans are keyed by selector ID.
+        selector_id = ModelID(str(control.selector.id))
+        for action in _get_component_actions(control.selector):
+            if action.function._function.__name__ == "_filter":
+                for target in action.function["targets"]:
+                    target_plans[target].filters.setdefault(selector_id, []).append(
+                        (action.function["filter_column"], action.function["filter_function"])
                     )
+            elif action.function._function.__name__ == "_parameter":
+                for target, target_args in _create_target_arg_mapping(action.function["targets"]).items():
+                    target_plans[ModelID(target)].parameters.setdefault(selector_id, []).extend(target_args)
+    return dict(target_plans)
 
-        parameterized_config[target] = graph_config
 
-    return parameterized_config
+@lru_cache(maxsize=1)
+def _get_target_plans() -> Dict[ModelID, _TargetPlan]:
+    """Returns the plans of all targets, which are compiled once and then used by all callbacks.
+
+    `Vizro.build` compiles the plans once all models are pre-built, and `Vizro._reset` discards them. They are kept in
+    this module rather than in the Flask app so that actions running as background jobs without an app context use the
+    same plans. If the dashboard has not been built, e.g. when an action function is called directly, the plans are
+    compiled on first use.
+    """
+    return _compile_target_plans()
+
+
+def _get_target_plan(target: ModelID) -> _TargetPlan:
+    """Returns the plan of `target` compiled when the dashboard was built."""
+    return _get_target_plans().get(target, _EMPTY_TARGET_PLAN)
 
 
 # Helper functions used in pre-defined actions ----
+def _get_target_filter_conditions(
+    target: ModelID,
+    ctds_filters: List[CallbackTriggerDict],
+    ctds_filter_interaction: List[Dict[str, CallbackTriggerDict]],
+) -> List[FilterCondition]:
+    filter_conditions = _get_filter_conditions(ctds_filters=ctds_filters, target=target)
+    filter_conditions += _get_filter_interaction_conditions(
+        ctds_filter_interaction=ctds_filter_interaction, target=target
+    )
+    return filter_conditions
+
+
 def _get_filtered_data(
     targets: List[ModelID],
     ctds_filters: List[CallbackTriggerDict],
     ctds_filter_interaction: List[Dict[str, CallbackTriggerDict]],
 ) -> Dict[ModelID, pd.DataFrame]:
     filtered_data = {}
+    # Targets that use the same dataset and are affected by the same filter conditions share one filtered data_frame,
+    # which is filtered only once and then copied for each further target.
+    shared_filtered_data: Dict[Hashable, pd.DataFrame] = {}
     for target in targets:
-        data_frame = data_manager._get_component_data(target)
-
-        data_frame = _apply_filters(
-            data_frame=data_frame,
-            ctds_filters=ctds_filters,
-            target=target,
-        )
-        data_frame = _apply_filter_interaction(
-            data_frame=data_frame,
-            ctds_filter_interaction=ctds_filter_interaction,
-            target=target,
+        # Filter plan: gather the conditions of all filters and filter interactions, then apply them in one go.
+        filter_conditions = _get_target_filter_conditions(
+            target=target, ctds_filters=ctds_filters, ctds_filter_interaction=ctds_filter_interaction
         )
 
-        filtered_data[target] = data_frame
+        shared_key = _get_shared_filtered_data_key(target, filter_conditions)
+        if shared_key is not None and shared_key in shared_filtered_data:
+            filtered_data[target] = data_manager._copy_data(shared_filtered_data[shared_key])
+            continue
+
+        # Filtered data is also cached across callbacks. Unfiltered data is not cached since that would only
+        # duplicate the original data.
+        dataset_name = data_manager._get_component_dataset(target)
+        cache_key = None
+        if shared_key is not None and filter_conditions and data_manager.filtered_data_cache_size is not None:
+            cache_key = (data_manager._get_dataset_version(dataset_name), shared_key)
+            cached_filtered_data = data_manager._get_cached_filtered_data(cache_key)
+            if cached_filtered_data is not None:
+                filtered_data[target] = shared_filtered_data[shared_key] = cached_filtered_data
+                continue
+
+        with _time_stage("data_load", target=target):
+            data_frame = data_manager._get_component_data(target)
+        with _time_stage("filter", target=target):
+            filtered_data[target] = _apply_filter_conditions(
+                data_frame=data_frame, target=target, filter_conditions=filter_conditions
+            )
+        if cache_key is not None:
+            data_manager._cache_filtered_data(cache_key, dataset_name, filtered_data[target])
+            filtered_data[target] = data_manager._copy_data(filtered_data[target])
+        if shared_key is not None:
+            shared_filtered_data[shared_key] = filtered_data[target]
 
     return filtered_data
 
 
+def _get_shared_filtered_data_key(target: ModelID, filter_conditions: List[FilterCondition]) -> Optional[Hashable]:
+    """Returns a key that is equal for targets that have the same filtered data, or None if there is no such key."""
+    shared_key = (
+        data_manager._get_component_dataset(target),
+        tuple((condition.column, condition.filter_function, tuple(condition.value)) for condition in filter_conditions),
+    )
+    try:
+        hash(shared_key)
+    except TypeError:
+        # Values clicked in a filter interaction can be unhashable, e.g. lists given as custom_data.
+        return None
+    return shared_key
+
+
+# Thread pools used to build figures concurrently, shared by all callbacks and keyed by their number of workers.
+_figure_executors: Dict[int, ThreadPoolExecutor] = {}
+_figure_executors_lock = threading.Lock()
+
+
+def _get_figure_executor() -> Optional[ThreadPoolExecutor]:
+    """Returns the thread pool to build figures with if `Vizro(figure_workers=...)` is set, otherwise None."""
+    if not flask.has_app_context():
+        return None
+    figure_workers = flask.current_app.config.get("VIZRO_FIGURE_WORKERS")
+    if not figure_workers:
+        return None
+
+    with _figure_executors_lock:
+        if figure_workers not in _figure_executors:
+            _figure_executors[figure_workers] = ThreadPoolExecutor(
+                max_workers=figure_workers, thread_name_prefix="vizro_figure"
+            )
+        return _figure_executors[figure_workers]
+
+
+def _get_figure_cache() -> Optional[FigureCache]:
+    """Returns the figure cache if `Vizro(figure_cache_size=...)` is set, otherwise None."""
+    if not flask.has_app_context():
+        return None
+    return flask.current_app.extensions.get("vizro_figure_cache")
+
+
+def _get_theme_selector_value() -> Optional[bool]:
+    try:
+        return ctx.args_grouping.get("external", {}).get("theme_selector", {}).get("value")
+    except MissingCallbackContextException:
+        return None
+
+
+def _freeze(value: Any) -> Hashable:
+    """Converts dictionaries and lists nested in `value` to tuples so that it can be hashed."""
+    if isinstance(value, dict):
+        return tuple((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _get_figure_cache_key(
+    target: ModelID,
+    ctds_filters: List[CallbackTriggerDict],
+    ctds_filter_interaction: List[Dict[str, CallbackTriggerDict]],
+    target_config: Dict[str, Any],
+) -> Optional[Hashable]:
+    """Returns a key that identifies the figure built for `target`, or None if the figure cannot be cached."""
+    from vizro.models import Graph, Table
+
+    if not isinstance(model_manager[target], (Graph, Table)):
+        return None
+
+    # The version must be looked up before the figure is built so that it is never newer than the data in the figure.
+    dataset_version = data_manager._get_dataset_version(data_manager._get_component_dataset(target))
+    filter_conditions = _get_target_filter_conditions(
+        target=target, ctds_filters=ctds_filters, ctds_filter_interaction=ctds_filter_interaction
+    )
+    shared_key = _get_shared_filtered_data_key(target, filter_conditions)
+    if shared_key is None:
+        return None
+
+    figure_cache_key = (target, dataset_version, shared_key, _freeze(target_config), _get_theme_selector_value())
+    try:
+        hash(figure_cache_key)
+    except TypeError:
+        return None
+    return figure_cache_key
+
+
 def _get_modified_page_figures(
     ctds_filter: List[CallbackTriggerDict],
     ctds_filter_interaction: List[Dict[str, CallbackTriggerDict]],
@@ -258,19 +514,84 @@ def _get_modified_page_figures(
 ) -> Dict[str, Any]:
     if not targets:
         targets = []
-    filtered_data = _get_filtered_data(
-        targets=targets,
-        ctds_filters=ctds_filter,
-        ctds_filter_interaction=ctds_filter_interaction,
-    )
 
-    parameterized_config = _get_parametrized_config(
-        targets=targets,
-        parameters=ctds_parameters,
+    with _time_stage("parametrized_config"):
+        parameterized_config = _get_parametrized_config(
+            targets=targets,
+            parameters=ctds_parameters,
+        )
+
+    # Figures found in the figure cache need neither their data to be filtered nor to be built again.
+    cached_figures: Dict[ModelID, Any] = {}
+    figure_cache_keys: Dict[ModelID, Hashable] = {}
+    figure_cache = _get_figure_cache()
+    if figure_cache is not None:
+        for target in targets:
+            figure_cache_key = _get_figure_cache_key(
+                target=target,
+                ctds_filters=ctds_filter,
+                ctds_filter_interaction=ctds_filter_interaction,
+                target_config=parameterized_config[target],
+            )
+            if figure_cache_key is None:
+                continue
+            figure = figure_cache.get(figure_cache_key)
+            if figure is None:
+                figure_cache_keys[target] = figure_cache_key
+            else:
+                cached_figures[target] = figure
+
+    built_targets = [target for target in targets if target not in cached_figures]
+    built_figures = _build_figures(
+        targets=built_targets,
+        filtered_data=_get_filtered_data(
+            targets=built_targets,
+            ctds_filters=ctds_filter,
+            ctds_filter_interaction=ctds_filter_interaction,
+        ),
+        parameterized_config=parameterized_config,
     )
 
-    outputs: Dict[str, Any] = {}
-    for target in targets:
-        outputs[target] = model_manager[target](data_frame=filtered_data[target], **parameterized_config[target])
+    if figure_cache is not None:
+        for target, figure_cache_key in figure_cache_keys.items():
+            if built_figures[target] is not no_update:
+                figure_cache.set(figure_cache_key, built_figures[target])
+
+    return {target: cached_figures[target] if target in cached_figures else built_figures[target] for target in targets}
+
+
+def _build_figures(
+    targets: List[ModelID], filtered_data: Dict[ModelID, pd.DataFrame], parameterized_config: Dict[ModelID, Any]
+) -> Dict[ModelID, Any]:
+    outputs: Dict[ModelID, Any] = {}
+    figure_executor = _get_figure_executor()
+    if figure_executor is None:
+        for target in targets:
+            outputs[target] = _build_figure(target, filtered_data[target], parameterized_config[target])
+        return outputs
+
+    # Each figure is built in a copy of the current context so that it still has access to the Dash callback context
+    # (e.g. for the theme). A figure that fails to build is left unchanged rather than failing the whole callback.
+    futures = {
+        target: figure_executor.submit(
+            contextvars.copy_context().run,
+            _build_figure,
+            target,
+            filtered_data[target],
+            parameterized_config[target],
+        )
+        for target in targets
+    }
+    for target, future in futures.items():
+        try:
+            outputs[target] = future.result()
+        except Exception:
+            logger.exception("Building figure for target %s failed.", target)
+            outputs[target] = no_update
 
     return outputs
+
+
+def _build_figure(target: ModelID, data_frame: pd.DataFrame, target_config: Dict[str, Any]) -> Any:
+    with _time_stage("figure_build", target=target):
+        return model_manager[target](data_frame=data_frame, **target_config)
@@ -1,9 +1,9 @@
 """Contains utilities to create the action_callback_mapping."""
 
 from itertools import chain
-from typing import Any, Callable, Dict, List, NamedTuple
+from typing import Any, Callable, Dict, List, Union
 
-from dash import Output, State, dcc
+from dash import ClientsideFunction, Input, Output, State, clientside_callback, dcc
 
 from vizro.actions import _on_page_load, _parameter, export_data, filter_interaction
 from vizro.managers import data_manager, model_manager
@@ -14,11 +14,6 @@ from vizro.models._controls import Filter, Parameter
 from vizro.models.types import ControlType
 
 
-class ModelActionsChains(NamedTuple):
-    model: VizroBaseModel
-    actions_chains: List[ActionsChain]
-
-
 def _get_actions(model) -> List[ActionsChain]:
     """Gets the list of trigger action chains in the `action` parameter for any model."""
     if hasattr(model, "selector"):
@@ -28,42 +23,14 @@ def _get_actions(model) -> List[ActionsChain]:
     return []
 
 
-def _get_all_actions_chains_on_page(page: Page) -> chain:  # type: ignore[type-arg]
-    """Creates an itertools chain of all ActionsChains present on selected Page."""
-    return chain(*(_get_actions(page_item) for page_item in chain([page], page.components, page.controls)))
-
-
-def _get_model_actions_chains_mapping(page: Page) -> Dict[str, ModelActionsChains]:
-    """Creates a mapping of model ids and ModelActionsChains for selected Page."""
-    model_actions_chains_mapping = {}
-    for page_item in chain([page], page.components, page.controls):
-        model_actions_chains_mapping[page_item.id] = ModelActionsChains(
-            model=page_item, actions_chains=_get_actions(page_item)
-        )
-    return model_actions_chains_mapping
-
-
-def _get_triggered_page(action_id: ModelID) -> Page:  # type: ignore[return]
+def _get_triggered_page(action_id: ModelID) -> Page:
     """Gets the page where the provided `action_id` has been triggered."""
-    for _, page in model_manager._items_with_type(Page):
-        if any(
-            action.id == action_id
-            for actions_chain in _get_all_actions_chains_on_page(page)
-            for action in actions_chain.actions
-        ):
-            return page
+    return model_manager._get_action_page(action_id)  # type: ignore[return-value]
 
 
-def _get_triggered_model(action_id: ModelID) -> VizroBaseModel:  # type: ignore[return]
+def _get_triggered_model(action_id: ModelID) -> VizroBaseModel:
     """Gets the model where the provided `action_id` has been triggered."""
-    for _, page in model_manager._items_with_type(Page):
-        for model_id, model_actions_chains in _get_model_actions_chains_mapping(page).items():
-            if any(
-                action.id == action_id
-                for actions_chain in model_actions_chains.actions_chains
-                for action in actions_chain.actions
-            ):
-                return model_actions_chains.model
+    return model_manager._get_action_model(action_id)  # type: ignore[return-value]
 
 
 def _get_components_with_data(action_id: ModelID) -> List[str]:
@@ -76,7 +43,8 @@ def _get_matching_actions_by_function(page: Page, action_function: Callable[[Any
     """Gets list of Actions on triggered page that match the provided action function."""
     return [
         action
-        for actions_chain in _get_all_actions_chains_on_page(page)
+        for page_item in chain([page], page.components, page.controls)
+        for actions_chain in _get_actions(page_item)
         for action in actions_chain.actions
         if action.function._function == action_function
     ]
@@ -216,8 +184,12 @@ def _get_export_data_callback_outputs(action_id: ModelID) -> Dict[str, List[Stat
 
 
 # CALLBACK COMPONENTS --------------
-def _get_export_data_callback_components(action_id: ModelID) -> List[dcc.Download]:
-    """Creates dcc.Downloads for target components of the `export_data` action."""
+def _get_export_data_callback_components(action_id: ModelID) -> List[Union[dcc.Download, dcc.Store]]:
+    """Creates dcc.Downloads for target components of the `export_data` action.
+
+    When exporting with `streaming=True`, the action instead returns the URLs to download the files from, which are
+    stored in a dcc.Store for each target and then downloaded by a clientside callback.
+    """
     action = model_manager[action_id]
 
     try:
@@ -228,6 +200,23 @@ def _get_export_data_callback_components(action_id: ModelID) -> List[dcc.Downloa
     if not targets:
         targets = _get_components_with_data(action_id=action_id)
 
+    try:
+        streaming = action.function["streaming"]
+    except KeyError:
+        streaming = False
+
+    if streaming:
+        download_url_stores = []
+        for target in targets:
+            download_url_store_id = {"type": "download_dataframe", "action_id": action_id, "target_id": target}
+            clientside_callback(
+                ClientsideFunction(namespace="clientside", function_name="download_url"),
+                Output(download_url_store_id, "clear_data"),
+                Input(download_url_store_id, "data"),
+            )
+            download_url_stores.append(dcc.Store(id=download_url_store_id))
+        return download_url_stores
+
     return [
         dcc.Download(
             id={
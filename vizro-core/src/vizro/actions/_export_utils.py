@@ -0,0 +1,203 @@
+"""Contains utilities to export data to files that are downloaded from a dedicated route rather than a callback."""
+
+import contextlib
+import gzip
+import io
+import logging
+import os
+import re
+import secrets
+import stat
+import tempfile
+import time
+import zipfile
+from itertools import chain
+from pathlib import Path
+from typing import IO, Dict, Iterator, Optional, Tuple, Union
+
+import flask
+import pandas as pd
+from dash import get_relative_path
+
+from vizro._constants import DOWNLOAD_URL_PREFIX
+from vizro.managers._model_manager import ModelID
+
+logger = logging.getLogger(__name__)
+
+# Exported files are written to a directory shared by all processes of the same user on the machine, so that a file
+# can be downloaded from a different worker process than the one that exported it.
+EXPORT_DIR = Path(tempfile.gettempdir()) / (
+    f"vizro_exports_{os.getuid()}" if hasattr(os, "getuid") else "vizro_exports"
+)
+# Time in seconds after which an exported file can no longer be downloaded and is removed.
+EXPORT_EXPIRY = 600
+# Number of rows written to an exported file at once.
+EXPORT_CHUNK_SIZE = 100_000
+
+# Compression used by pandas to write each compressed CSV file format.
+_CSV_COMPRESSIONS = {"csv.gz": "gzip", "csv.zst": "zstd"}
+
+# Name of an exported file in the export directory: a random token followed by the file extensions, e.g. `Ab3_x.csv`.
+_EXPORT_FILE_PATTERN = re.compile(r"^[A-Za-z0-9_-]+(\.[A-Za-z0-9]+)*$")
+
+
+# Directory set by `Vizro(export_dir=...)` that is used instead of EXPORT_DIR. This is a module attribute rather than
+# part of the Flask app config so that it is also available to actions that run as background jobs.
+_export_dir: Optional[Path] = None
+
+
+def _get_export_dir() -> Path:
+    """Returns the directory that exported files are written to, creating it if it does not exist.
+
+    Anyone who can read the directory can read the exported data, so it must be private to the user that runs the
+    dashboard.
+    """
+    export_dir = _export_dir or EXPORT_DIR
+    export_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+    export_dir_stat = export_dir.lstat()
+    if hasattr(os, "getuid") and (
+        not stat.S_ISDIR(export_dir_stat.st_mode)
+        or export_dir_stat.st_uid != os.getuid()
+        or export_dir_stat.st_mode & (stat.S_IRWXG | stat.S_IRWXO)
+    ):
+        raise PermissionError(
+            f"Directory {export_dir} for exported data must be owned by and only accessible to the user that runs the "
+            f"dashboard. Set `Vizro(export_dir=...)` to a private directory instead."
+        )
+    return export_dir
+
+
+def _remove_expired_exports(export_dir: Path):
+    for path in export_dir.glob("*"):
+        try:
+            if time.time() - path.stat().st_mtime > EXPORT_EXPIRY:
+                path.unlink()
+        except FileNotFoundError:
+            # Another process removed the file in the meantime.
+            pass
+
+
+def _iter_chunks(data_frame: pd.DataFrame) -> Iterator[pd.DataFrame]:
+    """Yields consecutive chunks of at most EXPORT_CHUNK_SIZE rows of `data_frame`, and at least one chunk."""
+    for start in range(0, max(len(data_frame), 1), EXPORT_CHUNK_SIZE):
+        yield data_frame.iloc[start : start + EXPORT_CHUNK_SIZE]
+
+
+def _write_arrow_in_chunks(data_frame: pd.DataFrame, file_format: str, file: IO[bytes]):
+    """Writes `data_frame` to `file` as a Parquet or Feather file with one row group or record batch per chunk."""
+    import pyarrow as pa
+    from pyarrow import parquet
+
+    chunks = _iter_chunks(data_frame)
+    first_chunk = next(chunks)
+    schema = pa.Schema.from_pandas(first_chunk, preserve_index=False)
+    # Columns whose values are all missing in the first chunk have no type yet, so it is found from all rows.
+    for position, field in enumerate(schema):
+        if pa.types.is_null(field.type):
+            column_type = pa.infer_type(data_frame.iloc[:, position].to_numpy(), from_pandas=True)
+            schema = schema.set(position, field.with_type(column_type))
+
+    if file_format == "parquet":
+        writer = parquet.ParquetWriter(file, schema)
+    else:
+        # Same compression as pandas.DataFrame.to_feather.
+        compression = "lz4" if pa.Codec.is_available("lz4") else None
+        writer = pa.ipc.new_file(file, schema, options=pa.ipc.IpcWriteOptions(compression=compression))
+    with writer:
+        for chunk in chain([first_chunk], chunks):
+            writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+
+
+def _write_data_frame_in_chunks(data_frame: pd.DataFrame, file_format: str, file: Union[Path, IO[bytes]]):
+    """Writes `data_frame` to `file` in `file_format` in chunks of rows, so that the whole file is never held in memory.
+
+    xlsx files cannot be written in chunks, which is checked when the `export_data` action is created.
+    """
+    with contextlib.ExitStack() as stack:
+        binary_file = stack.enter_context(file.open("wb")) if isinstance(file, Path) else file
+        if file_format in {"parquet", "feather"}:
+            _write_arrow_in_chunks(data_frame, file_format, binary_file)
+            return
+
+        csv_file: Union[IO[bytes], gzip.GzipFile] = binary_file
+        if file_format == "csv.gz":
+            csv_file = stack.enter_context(gzip.GzipFile(fileobj=binary_file, mode="wb"))
+        elif file_format == "csv.zst":
+            import zstandard
+
+            csv_file = stack.enter_context(zstandard.ZstdCompressor().stream_writer(binary_file))
+        text_file = stack.enter_context(io.TextIOWrapper(csv_file, encoding="utf-8", newline=""))
+        for position, chunk in enumerate(_iter_chunks(data_frame)):
+            chunk.to_csv(text_file, header=position == 0, index=False)
+
+
+def _write_data_frame(data_frame: pd.DataFrame, file_format: str, file: Union[Path, IO[bytes]]):
+    """Writes `data_frame` to `file`, which is either a path or a binary file-like object, in `file_format`."""
+    if file_format == "csv":
+        data_frame.to_csv(file, index=False)
+    elif file_format in _CSV_COMPRESSIONS:
+        data_frame.to_csv(file, index=False, compression=_CSV_COMPRESSIONS[file_format])
+    elif file_format == "xlsx":
+        data_frame.to_excel(file, index=False)
+    elif file_format == "parquet":
+        data_frame.to_parquet(file, index=False)
+    elif file_format == "feather":
+        # Feather cannot store an index other than the default one, which filtered data does not usually have.
+        data_frame.reset_index(drop=True).to_feather(file)
+    # Invalid file_format should be caught by Action validation
+
+
+def _write_zip(
+    data_frames: Dict[ModelID, pd.DataFrame], file_format: str, file: Union[Path, IO[bytes]], in_chunks: bool = False
+):
+    """Writes each of `data_frames` to a file named after its key in a zip archive written to `file`.
+
+    If `in_chunks` is True then each file is written with `_write_data_frame_in_chunks`.
+    """
+    # All formats other than plain CSV are compressed already, so compressing them again is only slower.
+    compression = zipfile.ZIP_DEFLATED if file_format == "csv" else zipfile.ZIP_STORED
+    with zipfile.ZipFile(file, "w", compression=compression) as zip_file:
+        for name, data_frame in data_frames.items():
+            with zip_file.open(f"{name}.{file_format}", "w") as member:
+                if in_chunks:
+                    _write_data_frame_in_chunks(data_frame, file_format, member)
+                else:
+                    _write_data_frame(data_frame, file_format, member)
+
+
+def _create_export_file(file_extension: str) -> Tuple[str, Path]:
+    """Returns the name and path of a new file in the export directory, and removes expired files from it."""
+    export_dir = _get_export_dir()
+    _remove_expired_exports(export_dir)
+    export_file = f"{secrets.token_urlsafe(16)}.{file_extension}"
+    return export_file, export_dir / export_file
+
+
+def _export_to_file(data_frame: pd.DataFrame, file_format: str, filename: str) -> str:
+    """Writes `data_frame` to a temporary file in chunks and returns the URL to download it from as `filename`."""
+    export_file, path = _create_export_file(file_format)
+    _write_data_frame_in_chunks(data_frame, file_format, path)
+    logger.debug("Exported data to %s", path)
+    return get_relative_path(f"/{DOWNLOAD_URL_PREFIX}/{export_file}/{filename}")
+
+
+def _export_zip_to_file(data_frames: Dict[ModelID, pd.DataFrame], file_format: str, filename: str) -> str:
+    """Writes `data_frames` to a temporary zip file in chunks of rows and returns the URL to download it from."""
+    export_file, path = _create_export_file("zip")
+    _write_zip(data_frames, file_format, path, in_chunks=True)
+    logger.debug("Exported data to %s", path)
+    return get_relative_path(f"/{DOWNLOAD_URL_PREFIX}/{export_file}/{filename}")
+
+
+def _serve_export(export_file: str, filename: str) -> flask.Response:
+    """Flask view that serves `export_file` as an attachment named `filename`."""
+    if not _EXPORT_FILE_PATTERN.match(export_file):
+        flask.abort(404)
+    path = _get_export_dir() / export_file
+    try:
+        if time.time() - path.stat().st_mtime > EXPORT_EXPIRY:
+            flask.abort(404)
+    except FileNotFoundError:
+        flask.abort(404)
+    # send_file streams the file in blocks rather than reading it into memory.
+    return flask.send_file(path, as_attachment=True, download_name=filename, max_age=0)
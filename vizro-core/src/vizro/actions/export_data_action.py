@@ -2,12 +2,13 @@
 
 from typing import Any, Dict, List, Optional
 
-from dash import ctx, dcc
+from dash import ctx, dcc, no_update
 from typing_extensions import Literal
 
 from vizro.actions._actions_utils import (
     _get_filtered_data,
 )
+from vizro.actions._export_utils import _export_to_file, _export_zip_to_file, _write_data_frame, _write_zip
 from vizro.managers import model_manager
 from vizro.managers._model_manager import ModelID
 from vizro.models.types import capture
@@ -16,14 +17,22 @@ from vizro.models.types import capture
 @capture("action")
 def export_data(
     targets: Optional[List[ModelID]] = None,
-    file_format: Literal["csv", "xlsx"] = "csv",
+    file_format: Literal["csv", "xlsx", "parquet", "feather", "csv.gz", "csv.zst"] = "csv",
+    streaming: bool = False,
+    bundle: bool = False,
     **inputs: Dict[str, Any],
 ) -> Dict[str, Any]:
     """Exports visible data of target charts/components on page after being triggered.
 
     Args:
         targets: List of target component ids to download data from. Defaults to `None`.
-        file_format: Format of downloaded files. Defaults to `csv`.
+        file_format: Format of downloaded files. `parquet` and `feather` are much faster to write and smaller than
+            `csv` and `xlsx` for large data. `csv.gz` and `csv.zst` are compressed CSV files. Defaults to `csv`.
+        streaming: Whether to write files to the server's disk in chunks of rows and download them from there rather
+            than sending them through the callback. This uses much less memory for large data. Cannot be used with
+            `xlsx`. Defaults to `False`.
+        bundle: Whether to download the data of all targets as files in a single zip file named `data.zip`.
+            Defaults to `False`.
         inputs: Dict mapping action function names with their inputs e.g.
             inputs = {'filters': [], 'parameters': ['gdpPercap'], 'filter_interaction': [], 'theme_selector': True}
 
@@ -50,13 +59,39 @@ def export_data(
         ctds_filter_interaction=ctx.args_grouping["external"]["filter_interaction"],
     )
 
+    if bundle:
+        # The zip file is downloaded through the first target's download component; the others are not used.
+        outputs = {f"download_dataframe_{target_id}": no_update for target_id in targets}
+        if targets:
+            if streaming:
+                download = _export_zip_to_file(data_frames, file_format=file_format, filename="data.zip")
+            else:
+                download = dcc.send_bytes(
+                    lambda file: _write_zip(data_frames, file_format=file_format, file=file), filename="data.zip"
+                )
+            outputs[f"download_dataframe_{targets[0]}"] = download
+        return outputs
+
     outputs = {}
     for target_id in targets:
+        if streaming:
+            outputs[f"download_dataframe_{target_id}"] = _export_to_file(
+                data_frames[target_id], file_format=file_format, filename=f"{target_id}.{file_format}"
+            )
+            continue
+
         if file_format == "csv":
             writer = data_frames[target_id].to_csv
         elif file_format == "xlsx":
             writer = data_frames[target_id].to_excel
-        # Invalid file_format should be caught by Action validation
+        else:
+            outputs[f"download_dataframe_{target_id}"] = dcc.send_bytes(
+                lambda file, data_frame=data_frames[target_id]: _write_data_frame(
+                    data_frame, file_format=file_format, file=file
+                ),
+                filename=f"{target_id}.{file_format}",
+            )
+            continue
 
         outputs[f"download_dataframe_{target_id}"] = dcc.send_data_frame(
             writer=writer, filename=f"{target_id}.{file_format}", index=False
@@ -0,0 +1,109 @@
+"""Indexes over columns of the original data that speed up filtering."""
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, Tuple, TypeVar
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_bool_dtype, is_datetime64_any_dtype, is_numeric_dtype, is_timedelta64_dtype
+
+
+class FilterIndex(ABC):
+    """Index over a column of a pandas DataFrame that gives the row positions for a filter value without a full scan.
+
+    Row positions are only meaningful for the exact rows the index was built from, so `is_aligned` must be checked
+    before using an index to filter a DataFrame.
+    """
+
+    def __init__(self, series: pd.Series):
+        self.index = series.index
+        self.n_rows = len(series)
+        self._position_dtype = np.int32 if len(series) < np.iinfo(np.int32).max else np.int64
+
+    @staticmethod
+    @abstractmethod
+    def is_supported(series: pd.Series) -> bool:
+        """Whether lookups in the index give the same result as the equivalent pandas operation on `series`."""
+
+    def is_aligned(self, data_frame: pd.DataFrame) -> bool:
+        """Whether the rows of `data_frame` are exactly the rows this index was built from."""
+        return len(data_frame) == self.n_rows and data_frame.index.is_(self.index)
+
+
+FilterIndexType = TypeVar("FilterIndexType", bound=FilterIndex)
+
+
+class CategoryIndex(FilterIndex):
+    """Inverted index from each value of a column to the positions of the rows that contain it.
+
+    The positions of all rows are stored in a single array, sorted by value, so that the rows of each value are a
+    contiguous slice of it. A mask equivalent to `series.isin(values)` is then built from the slices of the selected
+    values only, rather than by scanning the whole column.
+    """
+
+    def __init__(self, series: pd.Series):
+        super().__init__(series)
+        codes, uniques = pd.factorize(series)
+        self.positions = np.argsort(codes, kind="stable").astype(self._position_dtype)
+
+        # Missing values are factorized to code -1 and so are not part of any slice.
+        sorted_codes = codes[self.positions]
+        all_codes = np.arange(len(uniques))
+        starts = np.searchsorted(sorted_codes, all_codes, side="left")
+        ends = np.searchsorted(sorted_codes, all_codes, side="right")
+        self._slices: Dict[Any, Tuple[int, int]] = dict(zip(uniques, zip(starts, ends)))
+
+    @staticmethod
+    def is_supported(series: pd.Series) -> bool:
+        """Whether lookups by value give the same result as `series.isin`.
+
+        `isin` converts e.g. strings to datetimes before comparing, which a lookup by value does not do.
+        """
+        return not (
+            is_datetime64_any_dtype(series) or is_timedelta64_dtype(series) or isinstance(series.dtype, pd.PeriodDtype)
+        )
+
+    @staticmethod
+    def can_lookup(values: Iterable[Any]) -> bool:
+        """Whether `values` can be looked up in the index.
+
+        `isin` distinguishes between different missing values (e.g. `None` and `NaN`) depending on the column dtype, so
+        missing values are not indexed.
+        """
+        return not any(pd.isna(value) for value in values)
+
+    def isin(self, values: Iterable[Any]) -> np.ndarray:
+        """Returns a boolean mask of the rows that contain any of `values`."""
+        mask = np.zeros(self.n_rows, dtype=bool)
+        for value in values:
+            start, end = self._slices.get(value, (0, 0))
+            mask[self.positions[start:end]] = True
+        return mask
+
+
+class SortedIndex(FilterIndex):
+    """Index of the positions of the rows of a numerical column sorted by value.
+
+    A mask equivalent to `series.between(low, high)` is built from the slice of positions between two binary searches
+    in the sorted values, rather than by comparing every value.
+    """
+
+    def __init__(self, series: pd.Series):
+        super().__init__(series)
+        values = series.to_numpy()
+        # Missing values are sorted last and so are never between two numbers.
+        self.positions = np.argsort(values, kind="stable").astype(self._position_dtype)
+        self.sorted_values = values[self.positions]
+
+    @staticmethod
+    def is_supported(series: pd.Series) -> bool:
+        """Whether the column is numerical and stored as a NumPy array that can be sorted and searched."""
+        return isinstance(series.dtype, np.dtype) and is_numeric_dtype(series) and not is_bool_dtype(series)
+
+    def between(self, low: float, high: float) -> np.ndarray:
+        """Returns a boolean mask of the rows with values between `low` and `high`, inclusive on both ends."""
+        start = np.searchsorted(self.sorted_values, low, side="left")
+        end = np.searchsorted(self.sorted_values, high, side="right")
+        mask = np.zeros(self.n_rows, dtype=bool)
+        mask[self.positions[start:end]] = True
+        return mask
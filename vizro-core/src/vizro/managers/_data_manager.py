@@ -1,9 +1,21 @@
 """The data manager handles access to all DataFrames used in a Vizro app."""
 
-from typing import Callable, Dict, Union
+import itertools
+import logging
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, List, NamedTuple, Optional, OrderedDict, Set, Tuple, Type, Union
 
+import numpy as np
 import pandas as pd
 
+from vizro.managers._data_index import FilterIndex, FilterIndexType
+from vizro.managers._data_metadata import DatasetMetadata
 from vizro.managers._managers_utils import _state_modifier
 
 # Really ComponentID and DatasetName should be NewType and not just aliases but then for a user's code to type check
@@ -12,6 +24,14 @@ ComponentID = str
 DatasetName = str
 pd_LazyDataFrame = Callable[[], pd.DataFrame]
 
+logger = logging.getLogger(__name__)
+
+
+class _CachedFilteredData(NamedTuple):
+    dataset_name: DatasetName
+    data: pd.DataFrame
+    size: int
+
 
 class DataManager:
     """Object to handle all data for the `vizro` application.
@@ -20,20 +40,68 @@ class DataManager:
         >>> import plotly.express as px
         >>> data_manager["iris"] = px.data.iris()
 
+    Attributes:
+        read_only (bool): If `True`, components receive zero-copy, read-only views of the original data instead of
+            full copies. Any attempt to modify the values of such a view in place raises a `ValueError`, so
+            custom charts and actions must not use in-place operations on their `data_frame`. Defaults to `False`.
+        memory_budget (Optional[int]): Maximum memory in bytes used by all datasets held in memory. When loading a
+            dataset exceeds the budget, the least recently used datasets are evicted: datasets added as a callable are
+            loaded again through the callable on their next use, and datasets added as a pandas DataFrame are spilled
+            to a local Parquet file that is memory-mapped on their next use (this requires `pyarrow`). Datasets that
+            cannot be written to Parquet, e.g. because a column mixes types, are kept in memory. Defaults to `None`,
+            which keeps all datasets in memory.
+        filtered_data_cache_size (Optional[int]): Maximum memory in bytes used to cache the results of filtering
+            datasets. When the same filters are applied to a dataset again, e.g. when several users look at the same
+            page, the cached result is used instead of filtering the dataset again. The least recently used results
+            are evicted first, and all results for a dataset are evicted when the dataset is loaded again. Defaults to
+            `None`, which disables the cache.
+        filter_indexes (bool): If `True`, indexes over the columns used by filters are built when the dashboard is
+            built, so that categorical filters and `RangeSlider` filters look up the selected rows rather than
+            comparing every row. Each index holds the row positions of its column, i.e. 4 or 8 bytes per row, and is
+            built again when its dataset is loaded again, e.g. after it has been refreshed. Defaults to `False`.
+
     """
 
     def __init__(self):
         self.__lazy_data: Dict[DatasetName, pd_LazyDataFrame] = {}
-        self.__original_data: Dict[DatasetName, pd.DataFrame] = {}
+        # Ordered from least to most recently used.
+        self.__original_data: OrderedDict[DatasetName, pd.DataFrame] = OrderedDict()
+        self.__data_sizes: Dict[DatasetName, int] = {}
+        self.__cache_lock = threading.Lock()
+        self.__spill_dir: Optional[tempfile.TemporaryDirectory[str]] = None
+        self.__spill_numbers = itertools.count()
+        self.__spilling: Set[DatasetName] = set()
+        self.__unspillable: Set[DatasetName] = set()
+        self.__filter_indexes: Dict[Tuple[DatasetName, str, Type[FilterIndex]], FilterIndex] = {}
+        self.__filter_indexes_lock = threading.Lock()
         self.__component_to_original: Dict[ComponentID, DatasetName] = {}
+        self.__refresh_intervals: Dict[DatasetName, float] = {}
+        self.__load_times: Dict[DatasetName, float] = {}
+        self.__refreshing: Set[DatasetName] = set()
+        self.__refresh_lock = threading.Lock()
+        self.__versions: Dict[DatasetName, int] = {}
+        self.__metadata: Dict[DatasetName, DatasetMetadata] = {}
+        # Ordered from least to most recently used.
+        self.__filtered_data: OrderedDict[Hashable, _CachedFilteredData] = OrderedDict()
+        self.__filtered_data_total_size = 0
+        self.__filtered_data_lock = threading.Lock()
         self._frozen_state = False
+        self.read_only = False
+        self.memory_budget: Optional[int] = None
+        self.filtered_data_cache_size: Optional[int] = None
+        self.filter_indexes = False
 
     @_state_modifier
-    def __setitem__(self, dataset_name: DatasetName, data: Union[pd.DataFrame, pd_LazyDataFrame]):
+    def __setitem__(self, dataset_name: DatasetName, data: Union[pd.DataFrame, pd_LazyDataFrame, Path]):
         """Adds `data` to the `DataManager` with key `dataset_name`.
 
         This is the only user-facing function when configuring a simple dashboard. Others are only used internally
         in Vizro or advanced users who write their own actions.
+
+        `data` can also be a `pathlib.Path` to a local Parquet (`.parquet`) or Arrow IPC/Feather (`.arrow`, `.feather`)
+        file, which is loaded lazily and memory-mapped. Arrow IPC files that are uncompressed and written as a single
+        record batch are not copied into memory at all, so that all processes serving the dashboard share the same
+        memory through the operating system's page cache. This requires `pyarrow` and `data_manager.read_only = True`.
         """
         if dataset_name in self.__original_data or dataset_name in self.__lazy_data:
             raise ValueError(f"Dataset {dataset_name} already exists.")
@@ -42,9 +110,12 @@ class DataManager:
             self.__lazy_data[dataset_name] = data
         elif isinstance(data, pd.DataFrame):
             self.__original_data[dataset_name] = data
+        elif isinstance(data, Path):
+            self.__lazy_data[dataset_name] = _get_data_file_loader(dataset_name, data)
         else:
             raise TypeError(
-                f"Dataset {dataset_name} must be a pandas DataFrame or callable that returns pandas DataFrame."
+                f"Dataset {dataset_name} must be a pandas DataFrame, callable that returns pandas DataFrame or path "
+                f"to a Parquet or Arrow IPC file."
             )
 
     @_state_modifier
@@ -61,31 +132,392 @@ class DataManager:
             )
         self.__component_to_original[component_id] = dataset_name
 
-    def _get_component_data(self, component_id: ComponentID) -> pd.DataFrame:
-        """Returns the original data for `component_id`."""
+    @_state_modifier
+    def set_refresh_interval(self, dataset_name: DatasetName, interval: Union[float, timedelta]):
+        """Sets how long the lazily loaded dataset `dataset_name` is used before it is reloaded.
+
+        Once `interval` (in seconds, or as a `timedelta`) has elapsed since the dataset was last loaded, the next access
+        starts reloading it in a background thread. Until the reload has finished, components continue to receive the
+        previous data, so that callbacks never wait on a reload. The new data then replaces the previous data in a
+        single step.
+
+        Args:
+            dataset_name: Name of a dataset that was added as a callable that returns a pandas DataFrame.
+            interval: Time after which the dataset is reloaded.
+
+        Examples:
+            >>> data_manager["iris"] = retrieve_iris
+            >>> data_manager.set_refresh_interval("iris", timedelta(hours=1))
+        """
+        if dataset_name not in self.__lazy_data:
+            if dataset_name in self.__original_data:
+                raise ValueError(
+                    f"Dataset {dataset_name} is a pandas DataFrame and cannot be refreshed. Add the dataset as a "
+                    f"callable that returns a pandas DataFrame instead."
+                )
+            raise KeyError(f"Dataset {dataset_name} does not exist.")
+
+        interval = interval.total_seconds() if isinstance(interval, timedelta) else interval
+        if interval <= 0:
+            raise ValueError(f"Refresh interval for dataset {dataset_name} must be positive.")
+        self.__refresh_intervals[dataset_name] = interval
+
+    def _load_lazy_data(self, dataset_name: DatasetName) -> pd.DataFrame:
+        """Calls the lazy data function of `dataset_name` and stores the result as its original data."""
+        data = self.__lazy_data[dataset_name]()
+        with self.__cache_lock:
+            # A single dictionary assignment, so that concurrent callbacks see either the previous or the new data.
+            self.__original_data[dataset_name] = data
+            self.__original_data.move_to_end(dataset_name)
+            self.__load_times[dataset_name] = time.monotonic()
+            self.__data_sizes.pop(dataset_name, None)
+            # Bumped only after the new data is in place, so that data filtered for a version is never older than it.
+            self.__versions[dataset_name] = self.__versions.get(dataset_name, 0) + 1
+            to_spill = self._evict(keep=dataset_name) if self.memory_budget is not None else []
+        self._spill(to_spill)
+        self._evict_filtered_data(dataset_name)
+        return data
+
+    def _load_lazy_datasets(self, workers: int) -> Dict[DatasetName, float]:
+        """Loads all lazy datasets used by components that have not been loaded yet concurrently on `workers` threads.
+
+        Returns:
+            Time in seconds that loading each dataset took.
+        """
+        dataset_names = sorted(
+            {
+                dataset_name
+                for dataset_name in self.__component_to_original.values()
+                if dataset_name in self.__lazy_data and dataset_name not in self.__original_data
+            }
+        )
+
+        def load(dataset_name: DatasetName) -> float:
+            start = time.perf_counter()
+            self._load_lazy_data(dataset_name)
+            return time.perf_counter() - start
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="vizro_data") as executor:
+            load_times = dict(zip(dataset_names, executor.map(load, dataset_names)))
+        for dataset_name, load_time in load_times.items():
+            logger.info("Loaded dataset %s in %.3fs", dataset_name, load_time)
+        return load_times
+
+    def _evict(self, keep: DatasetName) -> List[Tuple[DatasetName, pd.DataFrame]]:
+        """Evicts the least recently used datasets other than `keep` until the memory budget is met.
+
+        Must be called while holding `self.__cache_lock`. Lazy datasets are evicted straight away. Datasets added as a
+        pandas DataFrame must be spilled to disk first, which can take a while, so they are returned to be spilled with
+        `_spill` after releasing the lock.
+        """
+        for dataset_name, data in self.__original_data.items():
+            if dataset_name not in self.__data_sizes:
+                self.__data_sizes[dataset_name] = int(data.memory_usage(deep=True).sum())
+
+        total_size = sum(self.__data_sizes[dataset_name] for dataset_name in self.__original_data)
+        to_spill = []
+        for dataset_name in list(self.__original_data):
+            if total_size <= self.memory_budget:  # type: ignore[operator]
+                break
+            if dataset_name == keep or dataset_name in self.__spilling or dataset_name in self.__unspillable:
+                continue
+            if dataset_name in self.__lazy_data:
+                del self.__original_data[dataset_name]
+                total_size -= self.__data_sizes.pop(dataset_name)
+                logger.debug("Evicted dataset %s from memory", dataset_name)
+            else:
+                self.__spilling.add(dataset_name)
+                to_spill.append((dataset_name, self.__original_data[dataset_name]))
+                total_size -= self.__data_sizes[dataset_name]
+        return to_spill
+
+    def _spill(self, datasets: List[Tuple[DatasetName, pd.DataFrame]]):
+        """Writes each pandas DataFrame in `datasets` to a Parquet file that is read back as its lazy data.
+
+        Must be called without holding `self.__cache_lock`. A dataset is only evicted from memory once its file has been
+        written. If writing fails, e.g. because `pyarrow` is not installed or a column cannot be stored in Parquet, the
+        dataset is kept in memory and is not spilled again.
+        """
+        for dataset_name, data in datasets:
+            try:
+                path = self._write_spill_file(data)
+            except Exception as exc:
+                logger.warning("Dataset %s cannot be spilled to disk and is kept in memory: %r", dataset_name, exc)
+                with self.__cache_lock:
+                    self.__spilling.discard(dataset_name)
+                    self.__unspillable.add(dataset_name)
+                continue
+
+            with self.__cache_lock:
+                self.__spilling.discard(dataset_name)
+                # The dataset is gone if the data manager was cleared while its file was written.
+                if self.__original_data.get(dataset_name) is not data:
+                    continue
+                self.__lazy_data[dataset_name] = partial(_read_parquet_file, path)
+                del self.__original_data[dataset_name]
+                self.__data_sizes.pop(dataset_name, None)
+            logger.debug("Spilled dataset %s to %s", dataset_name, path)
+
+    def _write_spill_file(self, data: pd.DataFrame) -> Path:
+        """Writes `data` to a new Parquet file in a temporary directory that is removed with the `DataManager`."""
+        with self.__cache_lock:
+            if self.__spill_dir is None:
+                self.__spill_dir = tempfile.TemporaryDirectory(prefix="vizro_")
+            spill_dir = Path(self.__spill_dir.name)
+        # Dataset names are not necessarily valid file names, so number the files instead.
+        path = spill_dir / f"{next(self.__spill_numbers)}.parquet"
+        try:
+            data.to_parquet(path)
+        except Exception:
+            path.unlink(missing_ok=True)
+            raise
+        return path
+
+    def _refresh_lazy_data(self, dataset_name: DatasetName):
+        try:
+            self._load_lazy_data(dataset_name)
+            logger.debug("Refreshed dataset %s", dataset_name)
+        except Exception:
+            logger.exception("Refreshing dataset %s failed, keeping previous data.", dataset_name)
+        finally:
+            with self.__refresh_lock:
+                self.__refreshing.discard(dataset_name)
+
+    def _refresh_if_expired(self, dataset_name: DatasetName):
+        """Starts reloading `dataset_name` in a background thread if its refresh interval has elapsed."""
+        if dataset_name not in self.__refresh_intervals:
+            return
+        if time.monotonic() - self.__load_times[dataset_name] < self.__refresh_intervals[dataset_name]:
+            return
+
+        with self.__refresh_lock:
+            if dataset_name in self.__refreshing:
+                return
+            self.__refreshing.add(dataset_name)
+
+        threading.Thread(target=self._refresh_lazy_data, args=(dataset_name,), daemon=True).start()
+
+    def _get_original_data(self, dataset_name: DatasetName) -> pd.DataFrame:
+        """Returns the original data for `dataset_name`, which must not be modified."""
+        # Populate original data on first access only
+        data = self.__original_data.get(dataset_name)
+        if data is None:
+            data = self._load_lazy_data(dataset_name)
+        else:
+            self._refresh_if_expired(dataset_name)
+            if self.memory_budget is not None:
+                with self.__cache_lock:
+                    if dataset_name in self.__original_data:
+                        self.__original_data.move_to_end(dataset_name)
+        return data
+
+    def _get_component_dataset(self, component_id: ComponentID) -> DatasetName:
+        """Returns the name of the dataset used by `component_id`."""
         if component_id not in self.__component_to_original:
             raise KeyError(f"Component {component_id} does not exist. You need to call add_component first.")
-        dataset_name = self.__component_to_original[component_id]
+        return self.__component_to_original[component_id]
 
-        # Populate original data on first access only
-        if dataset_name not in self.__original_data:
-            self.__original_data[dataset_name] = self.__lazy_data[dataset_name]()
+    def _get_component_data(self, component_id: ComponentID) -> pd.DataFrame:
+        """Returns the original data for `component_id`."""
+        return self._copy_data(self._get_original_data(self._get_component_dataset(component_id)))
+
+    def _copy_data(self, data: pd.DataFrame) -> pd.DataFrame:
+        """Returns a copy of `data` that can be given to a component without it modifying data used elsewhere."""
+        if self.read_only:
+            return _read_only_view(data)
 
         # Return a copy so that the original data cannot be modified. This is not necessary if we are careful
         # to not do any inplace=True operations, but probably safest to leave it here.
-        return self.__original_data[dataset_name].copy()
+        return data.copy()
+
+    def _get_dataset_version(self, dataset_name: DatasetName) -> int:
+        """Returns a number that changes whenever `dataset_name` is loaded again, e.g. after it has been refreshed.
+
+        The version must be looked up before the data itself, so that it is never newer than the data.
+        """
+        return self.__versions.get(dataset_name, 0)
+
+    def _get_dataset_metadata(self, dataset_name: DatasetName) -> DatasetMetadata:
+        """Returns the metadata of the current version of `dataset_name`, computing it on first access.
+
+        The metadata is computed again whenever the dataset is loaded again, e.g. after it has been refreshed.
+        """
+        metadata = self.__metadata.get(dataset_name)
+        if metadata is None or metadata.version != self._get_dataset_version(dataset_name):
+            # Make sure lazy data is loaded before looking up the version, so that the metadata of the first load is
+            # not computed again on its next access.
+            self._get_original_data(dataset_name)
+            version = self._get_dataset_version(dataset_name)
+            metadata = DatasetMetadata(self._get_original_data(dataset_name), version)
+            self.__metadata[dataset_name] = metadata
+        return metadata
+
+    def _get_component_columns(self, component_id: ComponentID) -> List[Hashable]:
+        """Returns the columns of the original data for `component_id` without copying it."""
+        return self._get_dataset_metadata(self._get_component_dataset(component_id)).columns
+
+    def _get_component_dtype(self, component_id: ComponentID, column: str) -> Any:
+        """Returns the dtype of `column` of the original data for `component_id` without copying it."""
+        return self._get_dataset_metadata(self._get_component_dataset(component_id)).dtypes[column]
+
+    def _get_component_min_max(self, component_id: ComponentID, column: str) -> Tuple[Any, Any]:
+        """Returns the minimum and maximum of `column` of the original data for `component_id`."""
+        dataset_name = self._get_component_dataset(component_id)
+        return self._get_dataset_metadata(dataset_name).get_min_max(
+            column, partial(self._get_original_data, dataset_name)
+        )
+
+    def _get_component_unique_values(self, component_id: ComponentID, column: str) -> List[Any]:
+        """Returns the sorted unique values of `column` of the original data for `component_id`."""
+        dataset_name = self._get_component_dataset(component_id)
+        return self._get_dataset_metadata(dataset_name).get_unique_values(
+            column, partial(self._get_original_data, dataset_name)
+        )
+
+    def _get_cached_filtered_data(self, key: Hashable) -> Optional[pd.DataFrame]:
+        """Returns a copy of the filtered data cached with `key`, or None if there is none."""
+        if self.filtered_data_cache_size is None:
+            return None
+        with self.__filtered_data_lock:
+            cached_filtered_data = self.__filtered_data.get(key)
+            if cached_filtered_data is None:
+                return None
+            self.__filtered_data.move_to_end(key)
+        return self._copy_data(cached_filtered_data.data)
+
+    def _cache_filtered_data(self, key: Hashable, dataset_name: DatasetName, data: pd.DataFrame):
+        """Caches `data` filtered from `dataset_name` with `key`, which must include the version of the dataset.
+
+        `data` must not be modified afterwards, so callers should only hand out copies of it.
+        """
+        if self.filtered_data_cache_size is None:
+            return
+        size = int(data.memory_usage(deep=True).sum())
+        if size > self.filtered_data_cache_size:
+            return
+
+        with self.__filtered_data_lock:
+            if key in self.__filtered_data:
+                self.__filtered_data_total_size -= self.__filtered_data.pop(key).size
+            self.__filtered_data[key] = _CachedFilteredData(dataset_name, data, size)
+            self.__filtered_data_total_size += size
+            while self.__filtered_data_total_size > self.filtered_data_cache_size:
+                _, evicted = self.__filtered_data.popitem(last=False)
+                self.__filtered_data_total_size -= evicted.size
+
+    def _evict_filtered_data(self, dataset_name: DatasetName):
+        """Evicts all cached filtered data of `dataset_name`, which can no longer be used once it is loaded again."""
+        with self.__filtered_data_lock:
+            for key, cached_filtered_data in list(self.__filtered_data.items()):
+                if cached_filtered_data.dataset_name == dataset_name:
+                    del self.__filtered_data[key]
+                    self.__filtered_data_total_size -= cached_filtered_data.size
+
+    @_state_modifier
+    def _add_filter_index(self, component_id: ComponentID, column: str, index_type: Type[FilterIndex]):
+        """Builds an index of `index_type` over `column` of the original data for `component_id` if supported.
+
+        The index is shared by all components that use the same dataset and is rebuilt whenever the dataset is loaded
+        again, e.g. after it has been refreshed.
+        """
+        dataset_name = self.__component_to_original[component_id]
+        if (dataset_name, column, index_type) not in self.__filter_indexes:
+            series = self._get_original_data(dataset_name)[column]
+            if index_type.is_supported(series):
+                self.__filter_indexes[(dataset_name, column, index_type)] = index_type(series)
+
+    def _get_filter_index(
+        self, component_id: ComponentID, column: str, index_type: Type[FilterIndexType]
+    ) -> Optional[FilterIndexType]:
+        """Returns the index of `index_type` over `column` of the current original data if one was added.
+
+        Before using it, callers must check that the index `is_aligned` with the data they filter, since the data might
+        have been refreshed in the meantime.
+        """
+        dataset_name = self.__component_to_original[component_id]
+        key = (dataset_name, column, index_type)
+        filter_index = self.__filter_indexes.get(key)
+        data = self.__original_data.get(dataset_name)
+        if filter_index is None or data is None:
+            return None
+        if not filter_index.index.is_(data.index):
+            with self.__filter_indexes_lock:
+                # Another callback might have rebuilt the index while this one waited for the lock.
+                filter_index = self.__filter_indexes[key]
+                if not filter_index.index.is_(data.index):
+                    filter_index = index_type(data[column])
+                    self.__filter_indexes[key] = filter_index
+        return filter_index  # type: ignore[return-value]
 
     def _has_registered_data(self, component_id: ComponentID) -> bool:
-        try:
-            self._get_component_data(component_id)
-            return True
-        except KeyError:
-            return False
+        return component_id in self.__component_to_original
 
     def _clear(self):
         self.__init__()  # type: ignore[misc]
 
 
+def _read_arrow_file(path: Path) -> pd.DataFrame:
+    """Reads an Arrow IPC/Feather file memory-mapped, without copying its columns where possible."""
+    from pyarrow import feather
+
+    # split_blocks avoids consolidating columns into 2D blocks, which would copy them out of the memory map.
+    return feather.read_table(path, memory_map=True).to_pandas(split_blocks=True)
+
+
+def _read_parquet_file(path: Path) -> pd.DataFrame:
+    """Reads a Parquet file memory-mapped."""
+    return pd.read_parquet(path, memory_map=True)
+
+
+DATA_FILE_READERS: Dict[str, Callable[[Path], pd.DataFrame]] = {
+    ".arrow": _read_arrow_file,
+    ".feather": _read_arrow_file,
+    ".parquet": _read_parquet_file,
+}
+
+
+def _get_data_file_loader(dataset_name: DatasetName, path: Path) -> pd_LazyDataFrame:
+    if path.suffix not in DATA_FILE_READERS:
+        raise ValueError(
+            f"Dataset {dataset_name} must be a file with one of the suffixes {', '.join(DATA_FILE_READERS)}, "
+            f"got {path}."
+        )
+    return partial(DATA_FILE_READERS[path.suffix], path)
+
+
+def _is_copy_on_write_enabled() -> bool:
+    try:
+        return pd.get_option("mode.copy_on_write") is True
+    except KeyError:
+        # The option does not exist in pandas versions without copy-on-write.
+        return False
+
+
+def _read_only_view(data_frame: pd.DataFrame) -> pd.DataFrame:
+    """Returns a copy of `data_frame` that shares its memory but whose modification cannot change `data_frame`.
+
+    With pandas copy-on-write enabled, this is a shallow copy, which pandas copies lazily when it is modified. Otherwise
+    the copy is made of new NumPy array views of the same memory that are marked as non-writeable, so that writing
+    values into it raises a `ValueError` rather than silently changing the data of every other component. In both
+    cases `data_frame` itself stays writeable, and adding, replacing or dropping columns of the copy only affects the
+    copy itself. Extension arrays (e.g. categoricals) have no writeable flag and are not guarded without copy-on-write.
+    """
+    if _is_copy_on_write_enabled():
+        return data_frame.copy(deep=False)
+
+    columns = {}
+    for position, (_, series) in enumerate(data_frame.items()):
+        values = series.to_numpy() if isinstance(series.dtype, np.dtype) else series.array
+        if isinstance(values, np.ndarray):
+            values = values.view()
+            values.flags.writeable = False
+        columns[position] = values
+    # Columns are given by position and named afterwards, since column names need not be unique.
+    view = pd.DataFrame(columns, index=data_frame.index, copy=False)
+    view.columns = data_frame.columns
+    return view
+
+
 data_manager = DataManager()
 
 
@@ -0,0 +1,50 @@
+"""Metadata and statistics of the columns of datasets that are computed once per dataset rather than on every use."""
+
+from typing import Any, Callable, Dict, Hashable, List, Tuple
+
+import pandas as pd
+from pandas.api.types import is_numeric_dtype
+
+
+class DatasetMetadata:
+    """Columns, dtypes and statistics of the columns of one version of a dataset.
+
+    Columns and dtypes are read when the metadata is created, and the minimum and maximum of all numeric columns are
+    computed in a single vectorised pass over the data. Statistics of other columns and unique values are only computed
+    when first requested, since most columns are never filtered on and unique values are expensive to find for columns
+    with many of them. The metadata does not hold a reference to the data itself, so that the data can still be evicted
+    from memory.
+
+    Args:
+        data_frame: Data to compute metadata of.
+        version: Version of the dataset that `data_frame` is, see `DataManager._get_dataset_version`.
+    """
+
+    def __init__(self, data_frame: pd.DataFrame, version: int):
+        self.version = version
+        self.dtypes: Dict[Hashable, Any] = data_frame.dtypes.to_dict()
+        numeric_data = data_frame[[column for column, dtype in self.dtypes.items() if is_numeric_dtype(dtype)]]
+        self._min: Dict[Hashable, Any] = numeric_data.min().to_dict()
+        self._max: Dict[Hashable, Any] = numeric_data.max().to_dict()
+        self._unique_values: Dict[Hashable, List[Any]] = {}
+
+    @property
+    def columns(self) -> List[Hashable]:
+        return list(self.dtypes)
+
+    def get_min_max(self, column: Hashable, get_data: Callable[[], pd.DataFrame]) -> Tuple[Any, Any]:
+        """Returns the minimum and maximum of `column`, using `get_data` to compute them if they are not known yet."""
+        if column not in self._min:
+            series = get_data()[column]
+            self._min[column], self._max[column] = series.min(), series.max()
+        return self._min[column], self._max[column]
+
+    def get_unique_values(self, column: Hashable, get_data: Callable[[], pd.DataFrame]) -> List[Any]:
+        """Returns the sorted unique values of `column`, using `get_data` to find them if they are not known yet."""
+        if column not in self._unique_values:
+            self._unique_values[column] = sorted(set(get_data()[column].drop_duplicates()))
+        return self._unique_values[column]
+
+    def get_cardinality(self, column: Hashable, get_data: Callable[[], pd.DataFrame]) -> int:
+        """Returns the number of unique values of `column`."""
+        return len(self.get_unique_values(column, get_data))
@@ -0,0 +1,98 @@
+"""The figure cache holds figures built by actions, shared by all callbacks of a Vizro app."""
+
+import threading
+from typing import Any, Hashable, NamedTuple, Optional, OrderedDict
+
+import numpy as np
+
+
+class _CachedFigure(NamedTuple):
+    figure: Any
+    size: int
+
+
+class FigureCache:
+    """Least recently used cache of the figures that actions build for their targets.
+
+    Args:
+        maxsize: Maximum memory in bytes used by the figures held in the cache, as estimated by `_get_figure_size`.
+
+    Attributes:
+        hits (int): Number of lookups that found a cached figure.
+        misses (int): Number of lookups that did not find a cached figure.
+        total_size (int): Estimated memory in bytes used by the figures held in the cache.
+    """
+
+    def __init__(self, maxsize: int):
+        if maxsize <= 0:
+            raise ValueError("Figure cache size must be positive.")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.total_size = 0
+        # Ordered from least to most recently used.
+        self._figures: OrderedDict[Hashable, _CachedFigure] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._figures)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Returns the figure cached with `key`, or None if there is none."""
+        with self._lock:
+            cached_figure = self._figures.get(key)
+            if cached_figure is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._figures.move_to_end(key)
+            return cached_figure.figure
+
+    def set(self, key: Hashable, figure: Any):
+        """Caches `figure` with `key`, evicting the least recently used figures until the cache fits in `maxsize`.
+
+        `figure` must not be modified afterwards, since it is returned as it is for every lookup. A figure larger than
+        `maxsize` is not cached.
+        """
+        size = _get_figure_size(figure)
+        if size > self.maxsize:
+            return
+
+        with self._lock:
+            if key in self._figures:
+                self.total_size -= self._figures.pop(key).size
+            self._figures[key] = _CachedFigure(figure, size)
+            self.total_size += size
+            while self.total_size > self.maxsize:
+                _, evicted = self._figures.popitem(last=False)
+                self.total_size -= evicted.size
+
+    def clear(self):
+        """Removes all figures from the cache and resets the counters."""
+        with self._lock:
+            self._figures.clear()
+            self.total_size = 0
+            self.hits = 0
+            self.misses = 0
+
+
+def _get_figure_size(figure: Any) -> int:
+    """Roughly estimates the memory in bytes used by `figure`, counting the arrays, strings and numbers it contains.
+
+    Plotly figures and Dash components are measured through their JSON representation, which for a Plotly figure is a
+    copy, so this should only be used when a figure is not found in the cache and has just been built anyway.
+    """
+    if isinstance(figure, np.ndarray):
+        # Arrays of objects such as strings only hold references to them.
+        object_size = sum(_get_figure_size(item) for item in figure.flat) if figure.dtype == object else 0
+        return figure.nbytes + object_size
+    if isinstance(figure, (str, bytes)):
+        return len(figure)
+    if isinstance(figure, dict):
+        return sum(_get_figure_size(key) + _get_figure_size(value) for key, value in figure.items())
+    if isinstance(figure, (list, tuple)):
+        return sum(_get_figure_size(item) for item in figure)
+    if hasattr(figure, "to_plotly_json"):
+        return _get_figure_size(figure.to_plotly_json())
+    # Numbers, booleans and None.
+    return 8
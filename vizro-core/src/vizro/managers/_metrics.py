@@ -0,0 +1,193 @@
+"""Latency metrics of the stages of actions, exposed in the Prometheus text format."""
+
+import bisect
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+import flask
+
+from vizro.managers._figure_cache import FigureCache
+from vizro.managers._model_manager import ModelID
+
+# Upper bounds in seconds of the buckets of each histogram.
+METRICS_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_METRIC_NAME = "vizro_action_stage_duration_seconds"
+
+# Page and action that stages timed in the current context belong to.
+_action_labels: contextvars.ContextVar[Tuple[str, str]] = contextvars.ContextVar(
+    "vizro_action_labels", default=("", "")
+)
+
+# Metrics that stages timed in the current context are recorded in, if given explicitly to _time_action.
+_action_metrics: contextvars.ContextVar[Optional["Metrics"]] = contextvars.ContextVar(
+    "vizro_action_metrics", default=None
+)
+
+
+class _MetricLabels(NamedTuple):
+    stage: str
+    page: str
+    action: str
+    target: str
+
+
+class _Histogram:
+    def __init__(self, n_buckets: int):
+        # The last bucket counts durations above the largest bound.
+        self.bucket_counts = [0] * (n_buckets + 1)
+        self.sum = 0.0
+        self.count = 0
+
+
+class Metrics:
+    """Histograms of the time spent in each stage of actions, labelled by page, action and target.
+
+    Args:
+        buckets: Upper bounds in seconds of the buckets of each histogram. Defaults to `METRICS_BUCKETS`.
+    """
+
+    def __init__(self, buckets: Iterable[float] = METRICS_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._histograms: Dict[_MetricLabels, _Histogram] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, stage: str, duration: float, page: str = "", action: str = "", target: str = ""):
+        """Records that `stage` took `duration` seconds."""
+        labels = _MetricLabels(stage=stage, page=page, action=action, target=target)
+        bucket = bisect.bisect_left(self.buckets, duration)
+        with self._lock:
+            histogram = self._histograms.get(labels)
+            if histogram is None:
+                histogram = self._histograms[labels] = _Histogram(len(self.buckets))
+            histogram.bucket_counts[bucket] += 1
+            histogram.sum += duration
+            histogram.count += 1
+
+    def render(self) -> str:
+        """Returns all histograms in the Prometheus text format."""
+        lines: List[str] = [
+            f"# HELP {_METRIC_NAME} Time spent in each stage of Vizro actions.",
+            f"# TYPE {_METRIC_NAME} histogram",
+        ]
+        bounds = [repr(float(bound)) for bound in self.buckets] + ["+Inf"]
+        with self._lock:
+            for labels, histogram in sorted(self._histograms.items()):
+                label_text = ",".join(f'{name}="{_escape(value)}"' for name, value in labels._asdict().items())
+                cumulative_count = 0
+                for bound, count in zip(bounds, histogram.bucket_counts):
+                    cumulative_count += count
+                    lines.append(f'{_METRIC_NAME}_bucket{{{label_text},le="{bound}"}} {cumulative_count}')
+                lines.append(f"{_METRIC_NAME}_sum{{{label_text}}} {histogram.sum!r}")
+                lines.append(f"{_METRIC_NAME}_count{{{label_text}}} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def clear(self):
+        """Removes all recorded durations."""
+        with self._lock:
+            self._histograms.clear()
+
+
+def _escape(label_value: str) -> str:
+    return label_value.replace("\\", r"\\").replace('"', r"\"").replace("\n", r"\n")
+
+
+def _get_metrics() -> Optional[Metrics]:
+    """Returns the metrics if `Vizro(metrics=True)` is set, otherwise None.
+
+    Background actions run without a Flask app context, so the metrics given to `_time_action` are used if there are
+    any.
+    """
+    metrics = _action_metrics.get()
+    if metrics is not None:
+        return metrics
+    if not flask.has_app_context():
+        return None
+    return flask.current_app.extensions.get("vizro_metrics")
+
+
+@contextmanager
+def _time_stage(stage: str, target: str = "") -> Iterator[None]:
+    """Times the code run inside the context as `stage` of the current action."""
+    metrics = _get_metrics()
+    if metrics is None:
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        page, action = _action_labels.get()
+        metrics.observe(stage, time.perf_counter() - start, page=page, action=action, target=target)
+
+
+@contextmanager
+def _time_action(action_id: ModelID, metrics: Optional[Metrics] = None) -> Iterator[None]:
+    """Times the action `action_id` and labels all stages timed inside the context with the action and its page.
+
+    Args:
+        action_id: ID of the action that is timed.
+        metrics: Metrics to record the action and its stages in. Defaults to the metrics of the current Flask app, which
+            a background action does not have.
+    """
+    if metrics is None:
+        metrics = _get_metrics()
+    if metrics is None:
+        yield
+        return
+
+    from vizro.actions._callback_mapping._callback_mapping_utils import _get_triggered_page
+
+    page = _get_triggered_page(action_id=action_id)
+    labels = (str(page.id) if page is not None else "", str(action_id))
+    labels_token = _action_labels.set(labels)
+    metrics_token = _action_metrics.set(metrics)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        end = time.perf_counter()
+        _action_metrics.reset(metrics_token)
+        _action_labels.reset(labels_token)
+        metrics.observe("action", end - start, page=labels[0], action=labels[1])
+        # Dash serializes the outputs of the callback after the action has finished, see _observe_serialisation. A
+        # background action has no request whose serialisation could be timed.
+        if flask.has_request_context():
+            flask.g.vizro_action_end = (end, labels)
+
+
+def _observe_serialisation(response: flask.Response) -> flask.Response:
+    """Flask `after_request` function that times the serialisation of the outputs of the action that just ran."""
+    metrics = _get_metrics()
+    action_end = flask.g.pop("vizro_action_end", None)
+    if metrics is not None and action_end is not None:
+        end, (page, action) = action_end
+        metrics.observe("serialisation", time.perf_counter() - end, page=page, action=action)
+    return response
+
+
+def _render_figure_cache_metrics(figure_cache: FigureCache) -> str:
+    """Returns the lookups and size of the figure cache in the Prometheus text format."""
+    lines = []
+    for name, metric_type, help_text, value in [
+        ("hits_total", "counter", "Number of lookups that found a cached figure.", figure_cache.hits),
+        ("misses_total", "counter", "Number of lookups that did not find a cached figure.", figure_cache.misses),
+        ("size_bytes", "gauge", "Estimated memory used by the cached figures.", figure_cache.total_size),
+    ]:
+        lines.append(f"# HELP vizro_figure_cache_{name} {help_text}")
+        lines.append(f"# TYPE vizro_figure_cache_{name} {metric_type}")
+        lines.append(f"vizro_figure_cache_{name} {value}")
+    return "\n".join(lines) + "\n"
+
+
+def _serve_metrics() -> flask.Response:
+    """Flask view that serves all metrics in the Prometheus text format."""
+    text = flask.current_app.extensions["vizro_metrics"].render()
+    figure_cache = flask.current_app.extensions.get("vizro_figure_cache")
+    if figure_cache is not None:
+        text += _render_figure_cache_metrics(figure_cache)
+    return flask.Response(text, content_type="text/plain; version=0.0.4; charset=utf-8")
@@ -2,16 +2,17 @@
 
 from __future__ import annotations
 
-import secrets
+import random
 import uuid
-from typing import TYPE_CHECKING, Dict, Generator, NewType, Tuple, Type, TypeVar, cast
+from itertools import chain
+from typing import TYPE_CHECKING, Dict, Generator, NamedTuple, NewType, Optional, Tuple, Type, TypeVar, cast
 
 from vizro.managers._managers_utils import _state_modifier
 
 if TYPE_CHECKING:
-    from vizro.models import VizroBaseModel
+    from vizro.models import Page, VizroBaseModel
 
-rd = secrets.SystemRandom().Random(0)
+rd = random.Random(0)
 
 ModelID = NewType("ModelID", str)
 Model = TypeVar("Model", bound="VizroBaseModel")
@@ -21,11 +22,24 @@ class DuplicateIDError(ValueError):
     """Useful for providing a more explicit error message when a model has id set automatically, e.g. Page."""
 
 
+class _ModelRelations(NamedTuple):
+    # Page that each page, component and control is on.
+    model_pages: Dict[ModelID, Page]
+    # Page, component or control whose actions chains each action is part of.
+    action_models: Dict[ModelID, VizroBaseModel]
+    # Model whose underlying callable object (e.g. a `dash_table.DataTable`) has each ID.
+    callable_object_models: Dict[str, VizroBaseModel]
+
+
 class ModelManager:
     def __init__(self):
         """"""
 
         self.__models: Dict[ModelID, VizroBaseModel] = {}
+        # Models grouped by their exact type, so that models of a type can be found without checking every model.
+        self.__models_by_type: Dict[Type[VizroBaseModel], Dict[ModelID, VizroBaseModel]] = {}
+        # Found from the whole model tree on first use and found again after a model is added.
+        self.__relations: Optional[_ModelRelations] = None
         self._frozen_state = False
 
     @_state_modifier
@@ -39,6 +53,8 @@ class ModelManager:
                 f"use 'from vizro import Vizro; Vizro._reset()`."
             )
         self.__models[model_id] = model
+        self.__models_by_type.setdefault(type(model), {})[model_id] = model
+        self.__relations = None
 
     def __getitem__(self, model_id: ModelID) -> VizroBaseModel:
         """"""
@@ -55,9 +71,67 @@ class ModelManager:
 
     def _items_with_type(self, model_type: Type[Model]) -> Generator[Tuple[ModelID, Model], None, None]:
         """Iterates through all models of type `model_type` (including subclasses)."""
-        for model_id in self:
-            if isinstance(self[model_id], model_type):
-                yield model_id, cast(Model, self[model_id])
+        for indexed_type, models in self.__models_by_type.items():
+            if issubclass(indexed_type, model_type):
+                for model_id, model in models.items():
+                    yield model_id, cast(Model, model)
+
+    def _get_relations(self, refresh: bool = False) -> _ModelRelations:
+        """Returns the relations between models, finding them from the whole model tree if needed.
+
+        The relations are found again after a model is added, which covers most changes to the model tree since models
+        are usually added to it right after they are created. Other changes, e.g. setting the ID of the underlying
+        callable object of a `Table` in its `pre_build`, are only picked up with `refresh=True`.
+        """
+        relations = self.__relations
+        if relations is not None and not refresh:
+            return relations
+
+        from vizro.models import Page
+
+        relations = _ModelRelations(model_pages={}, action_models={}, callable_object_models={})
+        for _, page in self._items_with_type(Page):
+            for model in chain([page], page.components, page.controls):
+                relations.model_pages.setdefault(ModelID(str(model.id)), page)
+                # Controls only have actions once their selector has been set in pre_build.
+                selector = getattr(model, "selector", None)
+                actions_chains = selector.actions if selector is not None else getattr(model, "actions", [])
+                for actions_chain in actions_chains:
+                    for action in actions_chain.actions:
+                        relations.action_models.setdefault(ModelID(str(action.id)), model)
+        for model in self.__models.values():
+            callable_object_id = getattr(model, "_callable_object_id", None)
+            if callable_object_id is not None:
+                relations.callable_object_models.setdefault(callable_object_id, model)
+
+        self.__relations = relations
+        return relations
+
+    def _get_model_page(self, model_id: ModelID) -> Optional[Page]:
+        """Returns the page that the page, component or control `model_id` is on, or None if it is on no page."""
+        page = self._get_relations().model_pages.get(model_id)
+        if page is None:
+            page = self._get_relations(refresh=True).model_pages.get(model_id)
+        return page
+
+    def _get_action_model(self, action_id: ModelID) -> Optional[VizroBaseModel]:
+        """Returns the page, component or control that triggers the action `action_id`, or None if there is none."""
+        model = self._get_relations().action_models.get(action_id)
+        if model is None:
+            model = self._get_relations(refresh=True).action_models.get(action_id)
+        return model
+
+    def _get_action_page(self, action_id: ModelID) -> Optional[Page]:
+        """Returns the page that the action `action_id` is triggered on, or None if there is none."""
+        model = self._get_action_model(action_id)
+        return self._get_model_page(ModelID(str(model.id))) if model is not None else None
+
+    def _get_callable_object_model(self, callable_object_id: str) -> Optional[VizroBaseModel]:
+        """Returns the model whose underlying callable object has ID `callable_object_id`, or None if there is none."""
+        model = self._get_relations().callable_object_models.get(callable_object_id)
+        if model is None:
+            model = self._get_relations(refresh=True).callable_object_models.get(callable_object_id)
+        return model
 
     @staticmethod
     def _generate_id() -> ModelID:
@@ -1,10 +1,11 @@
 import importlib.util
+import inspect
 import logging
 from collections.abc import Collection, Mapping
 from pprint import pformat
-from typing import Any, Dict, List, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 
-from dash import Input, Output, State, callback, html
+from dash import Input, Output, State, callback, get_app, html
 
 try:
     from pydantic.v1 import Field, validator
@@ -12,6 +13,7 @@ except ImportError:  # pragma: no cov
     from pydantic import Field, validator
 
 import vizro.actions
+from vizro.managers._metrics import Metrics, _time_action
 from vizro.managers._model_manager import ModelID
 from vizro.models import VizroBaseModel
 from vizro.models._models_utils import _log_call
@@ -29,6 +31,12 @@ class Action(VizroBaseModel):
             Defaults to `[]`.
         outputs (List[str]): Outputs in the form `<component_id>.<property>` changed by the action function.
             Defaults to `[]`.
+        background (bool): Whether to run the action function as a background job rather than inside its callback.
+            This requires a `background_callback_manager` to be given to `Vizro`. Defaults to `False`.
+        progress (Optional[str]): Output in the form `<component_id>.<property>` set to the value the action function
+            passes to `set_progress`, its first argument, while running in the background. Defaults to `None`.
+        cancel (List[str]): Inputs in the form `<component_id>.<property>` that cancel the action function while it
+            runs in the background when they change. Defaults to `[]`.
     """
 
     function: CapturedCallable = Field(..., import_path=vizro.actions)
@@ -42,6 +50,31 @@ class Action(VizroBaseModel):
         description="Outputs in the form `<component_id>.<property>` changed by the action function.",
         regex="^[^.]+[.][^.]+$",
     )
+    background: bool = Field(False, description="Whether to run the action function as a background job.")
+    progress: Optional[str] = Field(
+        None,
+        description="Output in the form `<component_id>.<property>` set to the progress of a background action.",
+        regex="^[^.]+[.][^.]+$",
+    )
+    cancel: List[str] = Field(
+        [],
+        description="Inputs in the form `<component_id>.<property>` that cancel a background action.",
+        regex="^[^.]+[.][^.]+$",
+    )
+
+    @validator("progress", "cancel")
+    def validate_background(cls, value, values, field):
+        if value and not values.get("background"):
+            raise ValueError(f"`{field.name}` can only be set when `background` is True.")
+        return value
+
+    @validator("progress")
+    def validate_set_progress_argument(cls, progress, values):
+        if progress and "function" in values:
+            parameters = list(inspect.signature(values["function"]._function).parameters)
+            if parameters[:1] != ["set_progress"]:
+                raise ValueError("Action function must have `set_progress` as its first argument to report progress.")
+        return progress
 
     # TODO: Problem: generic Action model shouldn't depend on details of particular actions like export_data.
     # Possible solutions: make a generic mapping of action functions to validation functions or the imports they
@@ -52,13 +85,39 @@ class Action(VizroBaseModel):
     def validate_predefined_actions(cls, function):
         if function._function.__name__ == "export_data":
             file_format = function._arguments.get("file_format")
-            if file_format not in [None, "csv", "xlsx"]:
-                raise ValueError(f'Unknown "file_format": {file_format}.' f' Known file formats: "csv", "xlsx".')
+            if file_format not in [None, "csv", "xlsx", "parquet", "feather", "csv.gz", "csv.zst"]:
+                raise ValueError(
+                    f'Unknown "file_format": {file_format}.'
+                    ' Known file formats: "csv", "xlsx", "parquet", "feather", "csv.gz", "csv.zst".'
+                )
             if file_format == "xlsx":
                 if importlib.util.find_spec("openpyxl") is None and importlib.util.find_spec("xlsxwriter") is None:
                     raise ModuleNotFoundError(
                         "You must install either openpyxl or xlsxwriter to export to xlsx format."
                     )
+            if file_format == "parquet":
+                if importlib.util.find_spec("pyarrow") is None and importlib.util.find_spec("fastparquet") is None:
+                    raise ModuleNotFoundError(
+                        "You must install either pyarrow or fastparquet to export to parquet format."
+                    )
+            if file_format == "feather":
+                if importlib.util.find_spec("pyarrow") is None:
+                    raise ModuleNotFoundError("You must install pyarrow to export to feather format.")
+            if file_format == "csv.zst":
+                if importlib.util.find_spec("zstandard") is None:
+                    raise ModuleNotFoundError("You must install zstandard to export to csv.zst format.")
+        return function
+
+    @validator("function")
+    def validate_export_data_streaming(cls, function):
+        if function._function.__name__ == "export_data" and function._arguments.get("streaming"):
+            file_format = function._arguments.get("file_format")
+            if file_format == "xlsx":
+                raise ValueError(
+                    '"streaming" cannot be used with "file_format": xlsx, since xlsx files cannot be written in chunks.'
+                )
+            if file_format == "parquet" and importlib.util.find_spec("pyarrow") is None:
+                raise ModuleNotFoundError("You must install pyarrow to export to parquet format with streaming.")
         return function
 
     def _get_callback_mapping(self):
@@ -101,6 +160,7 @@ class Action(VizroBaseModel):
         self,
         inputs: Union[Dict[str, Any], List[Any]],
         outputs: Union[Dict[str, Output], List[Output], Output, None],
+        set_progress: Optional[Callable[[Any], None]] = None,
     ) -> Any:
         logger.debug(
             "===== Running action with id %s, function %s =====",
@@ -111,10 +171,13 @@ class Action(VizroBaseModel):
             logger.debug("Action inputs:\n%s", pformat(inputs, depth=2, width=200))
             logger.debug("Action outputs:\n%s", pformat(outputs, width=200))
 
+        # set_progress is only given to action functions that report progress while running in the background.
         if isinstance(inputs, Mapping):
-            return_value = self.function(**inputs)
+            progress_kwargs = {"set_progress": set_progress} if set_progress is not None else {}
+            return_value = self.function(**inputs, **progress_kwargs)
         else:
-            return_value = self.function(*inputs)
+            progress_args = [set_progress] if set_progress is not None else []
+            return_value = self.function(*progress_args, *inputs)
 
         # Delegate all handling of the return_value and mapping to appropriate outputs to Dash - we don't modify
         # return_value to reshape it in any way. All we do is do some error checking to raise clearer error messages.
@@ -147,6 +210,21 @@ class Action(VizroBaseModel):
         # This could be a list of outputs, dictionary of outputs or any single value including None.
         return return_value
 
+    def _get_callback_return_value(
+        self,
+        external: Union[List[Any], Dict[str, Any]],
+        callback_outputs: Dict[str, Any],
+        set_progress: Optional[Callable[[Any], None]] = None,
+        metrics: Optional[Metrics] = None,
+    ) -> Dict[str, Any]:
+        with _time_action(ModelID(str(self.id)), metrics=metrics):
+            return_value = self._action_callback_function(
+                inputs=external, outputs=callback_outputs.get("external"), set_progress=set_progress
+            )
+        if "external" in callback_outputs:
+            return {"internal": {"action_finished": None}, "external": return_value}
+        return {"internal": {"action_finished": None}}
+
     @_log_call
     def build(self):
         """Builds a callback for the Action model and returns required components for the callback.
@@ -159,6 +237,12 @@ class Action(VizroBaseModel):
             "external": external_callback_inputs,
             "internal": {"trigger": Input({"type": "action_trigger", "action_name": self.id}, "data")},
         }
+        if self.background:
+            # Dash identifies a background job by the source code of the callback function and its arguments, which
+            # would be the same for all actions with the same inputs. The ID of the trigger makes them unique.
+            callback_inputs["internal"]["action_id"] = State({"type": "action_trigger", "action_name": self.id}, "id")
+            # A background job runs without a Flask app context, so it cannot look up the metrics of the app itself.
+            metrics = get_app().server.extensions.get("vizro_metrics")
         callback_outputs = {
             "internal": {"action_finished": Output("action_finished", "data", allow_duplicate=True)},
         }
@@ -180,11 +264,43 @@ class Action(VizroBaseModel):
             logger.debug("Callback inputs:\n%s", pformat(callback_inputs["external"], width=200))
             logger.debug("Callback outputs:\n%s", pformat(callback_outputs.get("external"), width=200))
 
-        @callback(output=callback_outputs, inputs=callback_inputs, prevent_initial_call=True)
-        def callback_wrapper(external: Union[List[Any], Dict[str, Any]], internal: Dict[str, Any]) -> Dict[str, Any]:
-            return_value = self._action_callback_function(inputs=external, outputs=callback_outputs.get("external"))
-            if "external" in callback_outputs:
-                return {"internal": {"action_finished": None}, "external": return_value}
-            return {"internal": {"action_finished": None}}
+        if not self.background:
+
+            @callback(output=callback_outputs, inputs=callback_inputs, prevent_initial_call=True)
+            def callback_wrapper(
+                external: Union[List[Any], Dict[str, Any]], internal: Dict[str, Any]
+            ) -> Dict[str, Any]:
+                return self._get_callback_return_value(external, callback_outputs)
+
+        elif self.progress:
+
+            @callback(
+                output=callback_outputs,
+                inputs=callback_inputs,
+                prevent_initial_call=True,
+                background=True,
+                progress=Output(*self.progress.split(".")),
+                cancel=[Input(*cancel.split(".")) for cancel in self.cancel],
+            )
+            def background_callback_wrapper(
+                set_progress: Callable[[Any], None],
+                external: Union[List[Any], Dict[str, Any]],
+                internal: Dict[str, Any],
+            ) -> Dict[str, Any]:
+                return self._get_callback_return_value(external, callback_outputs, set_progress, metrics)
+
+        else:
+
+            @callback(
+                output=callback_outputs,
+                inputs=callback_inputs,
+                prevent_initial_call=True,
+                background=True,
+                cancel=[Input(*cancel.split(".")) for cancel in self.cancel],
+            )
+            def background_callback_wrapper(
+                external: Union[List[Any], Dict[str, Any]], internal: Dict[str, Any]
+            ) -> Dict[str, Any]:
+                return self._get_callback_return_value(external, callback_outputs, metrics=metrics)
 
         return html.Div(children=action_components, id=f"{self.id}_action_model_components_div", hidden=True)
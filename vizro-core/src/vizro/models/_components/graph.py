@@ -1,8 +1,11 @@
 import logging
-from typing import List, Literal
+from typing import Any, List, Literal, Optional
 
+import numpy as np
+import pandas as pd
 from dash import ctx, dcc
 from dash.exceptions import MissingCallbackContextException
+from pandas.api.types import is_bool_dtype, is_datetime64_dtype, is_numeric_dtype
 from plotly import graph_objects as go
 
 try:
@@ -21,6 +24,11 @@ from vizro.models.types import CapturedCallable
 
 logger = logging.getLogger(__name__)
 
+# Plotly express charts whose data can be thinned out with `Graph.max_points`.
+THINNABLE_CHARTS = ["scatter", "line"]
+# Arguments of these charts that split the data into separate traces, which are thinned out separately.
+TRACE_GROUP_ARGUMENTS = ["color", "symbol", "line_dash", "line_group", "facet_row", "facet_col", "animation_frame"]
+
 
 class Graph(VizroBaseModel):
     """Wrapper for `dcc.Graph` to visualize charts in dashboard.
@@ -29,11 +37,21 @@ class Graph(VizroBaseModel):
         type (Literal["graph"]): Defaults to `"graph"`.
         figure (CapturedCallable): See [`CapturedCallable`][vizro.models.types.CapturedCallable].
         actions (List[Action]): See [`Action`][vizro.models.Action]. Defaults to `[]`.
+        max_points (Optional[int]): Maximum number of rows of data used to draw the chart, which can only be set for
+            `px.scatter` and `px.line` charts that draw one point per row. Larger data is thinned out after it has
+            been filtered, so that filters and parameters still apply to the full data. If the chart's `x` and `y` are
+            numerical columns then one row is kept per cell of a grid over their range, which keeps outliers but not
+            the density of points. Otherwise evenly spaced rows are kept. Each trace, e.g. each line of a `px.line`
+            chart with `color`, is thinned out separately and keeps a share of `max_points` in proportion to its
+            number of rows. Defaults to `None`, which uses all rows.
     """
 
     type: Literal["graph"] = "graph"
     figure: CapturedCallable = Field(..., import_path=px)
     actions: List[Action] = []
+    max_points: Optional[int] = Field(
+        None, description="Maximum number of rows of data used to draw the chart. Larger data is thinned out.", gt=0
+    )
 
     # Component properties for actions and interactions
     _output_property: str = PrivateAttr("figure")
@@ -42,9 +60,33 @@ class Graph(VizroBaseModel):
     _set_actions = _action_validator_factory("clickData")
     _validate_callable = validator("figure", allow_reuse=True)(_process_callable_data_frame)
 
+    @validator("max_points")
+    def validate_max_points(cls, max_points, values):
+        # Charts that aggregate rows, e.g. histograms, bar and box charts, would show different values for thinned data.
+        if (
+            max_points is not None
+            and "figure" in values
+            and values["figure"]._function.__name__ not in THINNABLE_CHARTS
+        ):
+            raise ValueError(
+                f"`max_points` can only be set for charts that draw one point per row: {', '.join(THINNABLE_CHARTS)}."
+            )
+        return max_points
+
     # Convenience wrapper/syntactic sugar.
     def __call__(self, **kwargs):
         kwargs.setdefault("data_frame", data_manager._get_component_data(str(self.id)))
+        if self.max_points is not None and len(kwargs["data_frame"]) > self.max_points:
+            logger.debug("Thinning out data of Graph with id %s to %s rows", self.id, self.max_points)
+            kwargs["data_frame"] = _thin_data_frame(
+                kwargs["data_frame"],
+                max_points=self.max_points,
+                x=kwargs.get("x", self.figure._arguments.get("x")),
+                y=kwargs.get("y", self.figure._arguments.get("y")),
+                groups=[
+                    kwargs.get(argument, self.figure._arguments.get(argument)) for argument in TRACE_GROUP_ARGUMENTS
+                ],
+            )
         fig = self.figure(**kwargs)
 
         # Remove top margin if title is provided
@@ -104,3 +146,73 @@ class Graph(VizroBaseModel):
         # self.__call__ and in the update_graph_theme callback.
         fig["layout"]["template"] = themes.light if theme_selector else themes.dark
         return fig
+
+
+def _get_grid_cells(values: np.ndarray, n_cells: int) -> np.ndarray:
+    """Returns the cell of a regular grid that each value is in, as a float so that it is NaN for missing values."""
+    low, high = np.nanmin(values), np.nanmax(values)
+    if high == low:
+        return np.where(np.isnan(values), np.nan, 0.0)
+    return np.minimum(np.floor((values - low) / (high - low) * n_cells), n_cells - 1)
+
+
+def _get_continuous_values(data_frame: pd.DataFrame, column: Any) -> Optional[np.ndarray]:
+    """Returns the values of `column` as floats if it is a numerical or datetime column, otherwise None."""
+    if not isinstance(column, str) or column not in data_frame:
+        return None
+    series = data_frame[column]
+    if is_datetime64_dtype(series):
+        values = series.to_numpy().view(np.int64).astype(float)
+        values[series.isna().to_numpy()] = np.nan
+        return values
+    if is_numeric_dtype(series) and not is_bool_dtype(series):
+        return series.to_numpy(dtype=float, na_value=np.nan)
+    return None
+
+
+def _get_thinned_positions(data_frame: pd.DataFrame, max_points: int, x: Any, y: Any) -> np.ndarray:
+    """Returns the positions of at most `max_points` rows of `data_frame`, in their original order.
+
+    If `x` and `y` are numerical or datetime columns then the first row in each cell of a grid of at most `max_points`
+    cells over their range is kept, so that outliers and sparse regions are kept while dense regions are thinned out.
+    Rows with missing `x` or `y` are not drawn anyway and so are dropped. Otherwise evenly spaced rows are kept.
+    """
+    if len(data_frame) <= max_points:
+        return np.arange(len(data_frame))
+
+    x_values = _get_continuous_values(data_frame, x)
+    y_values = _get_continuous_values(data_frame, y)
+    if x_values is not None and y_values is not None and not np.isnan(x_values).all() and not np.isnan(y_values).all():
+        n_cells = int(np.sqrt(max_points))
+        cells = _get_grid_cells(x_values, n_cells) * n_cells + _get_grid_cells(y_values, n_cells)
+        valid_positions = np.flatnonzero(~np.isnan(cells))
+        _, first_positions = np.unique(cells[valid_positions], return_index=True)
+        return np.sort(valid_positions[first_positions])
+
+    return np.linspace(0, len(data_frame) - 1, max_points).astype(np.int64)
+
+
+def _thin_data_frame(
+    data_frame: pd.DataFrame, max_points: int, x: Any, y: Any, groups: Optional[List[Any]] = None
+) -> pd.DataFrame:
+    """Returns about `max_points` rows of `data_frame`, in their original order.
+
+    The rows of each group of the `groups` columns, i.e. of each trace of the chart, are thinned out separately with
+    `_get_thinned_positions`, so that every trace keeps a share of `max_points` in proportion to its number of rows and
+    at least one row. Arguments in `groups` that are not columns of `data_frame` are ignored.
+    """
+    if len(data_frame) <= max_points:
+        return data_frame
+
+    group_columns = list(
+        dict.fromkeys(group for group in groups or [] if isinstance(group, str) and group in data_frame)
+    )
+    if not group_columns:
+        return data_frame.iloc[_get_thinned_positions(data_frame, max_points, x, y)]
+
+    positions = []
+    for group_positions in data_frame.groupby(group_columns, sort=False, dropna=False).indices.values():
+        group_max_points = max(1, max_points * len(group_positions) // len(data_frame))
+        thinned_positions = _get_thinned_positions(data_frame.iloc[group_positions], group_max_points, x, y)
+        positions.append(group_positions[thinned_positions])
+    return data_frame.iloc[np.sort(np.concatenate(positions))]
@@ -1,8 +1,15 @@
 import logging
-from typing import List, Literal
+import math
+import re
+import threading
+from typing import Any, Dict, Hashable, List, Literal, Optional, OrderedDict, Tuple
 
-from dash import dash_table, dcc, html
+import numpy as np
+import pandas as pd
+from dash import ClientsideFunction, Input, Output, State, callback, clientside_callback, ctx, dash_table, dcc, html
+from dash.exceptions import MissingCallbackContextException
 from pandas import DataFrame
+from pandas.api.types import is_bool_dtype, is_numeric_dtype
 
 try:
     from pydantic.v1 import Field, PrivateAttr, validator
@@ -11,6 +18,7 @@ except ImportError:  # pragma: no cov
 
 import vizro.tables as vt
 from vizro.managers import data_manager
+from vizro.managers._model_manager import ModelID
 from vizro.models import Action, VizroBaseModel
 from vizro.models._action._actions_chain import _action_validator_factory
 from vizro.models._components._components_utils import _process_callable_data_frame
@@ -19,6 +27,10 @@ from vizro.models.types import CapturedCallable
 
 logger = logging.getLogger(__name__)
 
+# Maximum memory in bytes used by the sorted and filtered data kept per Table in paging mode, so that turning pages
+# does not filter and sort the data again.
+PAGING_CACHE_SIZE = 64 * 1024**2
+
 
 class Table(VizroBaseModel):
     """Wrapper for table components to visualize in dashboard.
@@ -29,14 +41,31 @@ class Table(VizroBaseModel):
             [`dash_table.DataTable`](https://dash.plotly.com/datatable).
         title (str): Title of the table. Defaults to `""`.
         actions (List[Action]): See [`Action`][vizro.models.Action]. Defaults to `[]`.
+        page_size (Optional[int]): If set, the table is paged, sorted and filtered on the server and only the rows of
+            the current page are sent to the browser. The rows of each page are taken from the filtered data rather than
+            from the table callable, so this requires the table to be created with
+            [`dash_data_table`][vizro.tables.dash_data_table] with an `id`. Defaults to `None`, which sends all rows to
+            the browser.
+        columnar_data (bool): If `True`, the data of the table is sent to the browser column by column, with repeated
+            values sent only once, rather than as one record per row. This is faster to build and smaller to send for
+            large tables. The table callable is then called with a data frame without rows, and the underlying
+            `dash_table.DataTable` must have an `id`. Defaults to `False`.
     """
 
     type: Literal["table"] = "table"
     figure: CapturedCallable = Field(..., import_path=vt, description="Table to be visualized on dashboard")
     title: str = Field("", description="Title of the table")
     actions: List[Action] = []
+    page_size: Optional[int] = Field(
+        None, description="Number of rows per page when paging the table on the server.", gt=0
+    )
+    columnar_data: bool = Field(False, description="Whether to send the data of the table column by column.")
 
     _callable_object_id: str = PrivateAttr()
+    # Ordered from least to most recently used.
+    _paging_cache: OrderedDict[Hashable, Tuple[pd.DataFrame, int]] = PrivateAttr(default_factory=OrderedDict)
+    _paging_cache_total_size: int = PrivateAttr(0)
+    _paging_cache_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
 
     # Component properties for actions and interactions
     _output_property: str = PrivateAttr("children")
@@ -48,7 +77,33 @@ class Table(VizroBaseModel):
     # Convenience wrapper/syntactic sugar.
     def __call__(self, **kwargs):
         kwargs.setdefault("data_frame", data_manager._get_component_data(self.id))
-        return self.figure(**kwargs)
+        if self.page_size is None and not self.columnar_data:
+            return self.figure(**kwargs)
+
+        # Only the rows that are sent to the browser are given to the table function, so that no other rows are ever
+        # serialized. In columnar mode, rows are sent separately from the table.
+        data_frame = kwargs.pop("data_frame")
+        sent_data_frame = data_frame if self.page_size is None else data_frame.iloc[: self.page_size]
+        table = self.figure(data_frame=sent_data_frame.iloc[:0] if self.columnar_data else sent_data_frame, **kwargs)
+        table_components = [table]
+
+        if self.page_size is not None:
+            # A DataTable without columns shows all columns of the data.
+            columns = [column["id"] for column in getattr(table, "columns", None) or []] or list(data_frame.columns)
+            paging_state = {**self._get_filter_state(), "columns": columns}
+            sent_data_frame = sent_data_frame[paging_state["columns"]]
+            table.page_action = table.sort_action = table.filter_action = "custom"
+            table.page_current = 0
+            table.page_size = self.page_size
+            table.page_count = _get_page_count(len(data_frame), self.page_size)
+            table_components.append(dcc.Store(id=f"{self.id}_paging_state", data=paging_state))
+
+        if self.columnar_data:
+            table.data = []
+            table_components.append(dcc.Store(id=f"{self.id}_columnar_data", data=_to_columnar_data(sent_data_frame)))
+        else:
+            table.data = sent_data_frame.to_dict("records")
+        return table_components
 
     # Convenience wrapper/syntactic sugar.
     def __getitem__(self, arg_name: str):
@@ -60,7 +115,7 @@ class Table(VizroBaseModel):
 
     @_log_call
     def pre_build(self):
-        if self.actions:
+        if self.actions or self.page_size is not None or self.columnar_data:
             kwargs = self.figure._arguments.copy()
 
             # This workaround is needed because the underlying table object requires a data_frame
@@ -74,17 +129,153 @@ class Table(VizroBaseModel):
                     "Underlying `Table` callable has no attribute 'id'. To enable actions triggered by the `Table`"
                     " a valid 'id' has to be provided to the `Table` callable."
                 )
+            if self.page_size is not None and self.figure._function is not vt.dash_data_table.__wrapped__:
+                raise ValueError(
+                    "`page_size` can only be set for a `Table` created with `dash_data_table`, since the rows of each "
+                    "page are taken from the filtered data and would not be changed by a custom table function."
+                )
+            if self.columnar_data and not isinstance(underlying_table_object, dash_table.DataTable):
+                raise ValueError(
+                    "Underlying `Table` callable must return a `dash_table.DataTable` to set `columnar_data`."
+                )
 
             self._callable_object_id = underlying_table_object.id
 
+    def _get_filter_state(self) -> Dict[str, Any]:
+        """Returns the filters and filter interactions that the data of the table was filtered by in this callback."""
+        try:
+            external = ctx.args_grouping.get("external", {})
+        except MissingCallbackContextException:
+            external = {}
+        return {"filters": external.get("filters", []), "filter_interaction": external.get("filter_interaction", [])}
+
+    def _cache_paging_data(self, key: Hashable, data: pd.DataFrame):
+        size = int(data.memory_usage(deep=True).sum())
+        if size > PAGING_CACHE_SIZE:
+            return
+
+        with self._paging_cache_lock:
+            if key in self._paging_cache:
+                self._paging_cache_total_size -= self._paging_cache.pop(key)[1]
+            self._paging_cache[key] = (data, size)
+            self._paging_cache_total_size += size
+            while self._paging_cache_total_size > PAGING_CACHE_SIZE:
+                _, (_, evicted_size) = self._paging_cache.popitem(last=False)
+                self._paging_cache_total_size -= evicted_size
+
+    def _get_paging_data(
+        self, paging_state: Dict[str, Any], sort_by: List[Dict[str, str]], filter_query: str
+    ) -> pd.DataFrame:
+        """Returns the data of the table filtered by `paging_state` and `filter_query` and sorted by `sort_by`.
+
+        The returned data is shared between callbacks and must not be modified.
+        """
+        from vizro.actions._actions_utils import (
+            _get_filtered_data,
+            _get_shared_filtered_data_key,
+            _get_target_filter_conditions,
+        )
+
+        dataset_name = data_manager._get_component_dataset(self.id)
+        filter_conditions = _get_target_filter_conditions(
+            target=ModelID(self.id),
+            ctds_filters=paging_state["filters"],
+            ctds_filter_interaction=paging_state["filter_interaction"],
+        )
+        if not (filter_conditions or filter_query or sort_by):
+            # Pages of the unfiltered data are sliced straight from the original data, so it is neither copied nor
+            # cached.
+            return data_manager._get_original_data(dataset_name)
+
+        # The data is cached by the values that it was filtered by rather than by the whole state of the filters, which
+        # also holds e.g. whether a filter triggered the callback. The version is looked up before the data, so that
+        # data cached for a version is never older than it.
+        filtered_data_key = _get_shared_filtered_data_key(ModelID(self.id), filter_conditions)
+        key = (
+            data_manager._get_dataset_version(dataset_name),
+            filtered_data_key,
+            tuple((column["column_id"], column["direction"]) for column in sort_by),
+            filter_query,
+            tuple(paging_state["columns"]),
+        )
+        with self._paging_cache_lock:
+            if filtered_data_key is not None and key in self._paging_cache:
+                self._paging_cache.move_to_end(key)
+                return self._paging_cache[key][0]
+
+        # The filtered data is only cached in this process, so it is filtered again e.g. when the callback is served by
+        # a different worker process.
+        data_frame = _get_filtered_data(
+            targets=[ModelID(self.id)],
+            ctds_filters=paging_state["filters"],
+            ctds_filter_interaction=paging_state["filter_interaction"],
+        )[ModelID(self.id)]
+        # Only the columns of the table are kept, since no other columns are ever sent to the browser.
+        data_frame = _apply_sort_by(_apply_filter_query(data_frame, filter_query), sort_by)[paging_state["columns"]]
+        if filtered_data_key is not None:
+            self._cache_paging_data(key, data_frame)
+        return data_frame
+
+    def _get_page(
+        self,
+        page_current: int,
+        page_size: int,
+        sort_by: Optional[List[Dict[str, str]]],
+        filter_query: Optional[str],
+        paging_state: Dict[str, Any],
+    ) -> Tuple[pd.DataFrame, int]:
+        """Returns the rows of the current page, restricted to the columns of the table, and the number of pages."""
+        data_frame = self._get_paging_data(paging_state, sort_by or [], filter_query or "")
+        page = data_frame.iloc[page_current * page_size : (page_current + 1) * page_size]
+        return page[paging_state["columns"]], _get_page_count(len(data_frame), page_size)
+
     def build(self):
+        if self.page_size is None and not self.columnar_data:
+            table = dash_table.DataTable(**({"id": self._callable_object_id} if self.actions else {}))
+        else:
+            table = [dash_table.DataTable(id=self._callable_object_id)]
+
+        if self.page_size is not None:
+            table[0] = dash_table.DataTable(
+                id=self._callable_object_id,
+                page_action="custom",
+                sort_action="custom",
+                filter_action="custom",
+                page_size=self.page_size,
+            )
+            table.append(dcc.Store(id=f"{self.id}_paging_state"))
+
+            @callback(
+                (
+                    Output(f"{self.id}_columnar_data", "data")
+                    if self.columnar_data
+                    else Output(self._callable_object_id, "data")
+                ),
+                Output(self._callable_object_id, "page_count"),
+                Input(self._callable_object_id, "page_current"),
+                Input(self._callable_object_id, "page_size"),
+                Input(self._callable_object_id, "sort_by"),
+                Input(self._callable_object_id, "filter_query"),
+                State(f"{self.id}_paging_state", "data"),
+                prevent_initial_call=True,
+            )
+            def update_table_page(page_current, page_size, sort_by, filter_query, paging_state):
+                page, page_count = self._get_page(page_current or 0, page_size, sort_by, filter_query, paging_state)
+                return _to_columnar_data(page) if self.columnar_data else page.to_dict("records"), page_count
+
+        if self.columnar_data:
+            table.append(dcc.Store(id=f"{self.id}_columnar_data"))
+            clientside_callback(
+                ClientsideFunction(namespace="clientside", function_name="expand_table_data"),
+                Output(self._callable_object_id, "data"),
+                Input(f"{self.id}_columnar_data", "data"),
+            )
+
         return dcc.Loading(
             html.Div(
                 [
                     html.H3(self.title, className="table-title") if self.title else None,
-                    html.Div(
-                        dash_table.DataTable(**({"id": self._callable_object_id} if self.actions else {})), id=self.id
-                    ),
+                    html.Div(table, id=self.id),
                 ],
                 className="table-container",
                 id=f"{self.id}_outer",
@@ -92,3 +283,105 @@ class Table(VizroBaseModel):
             color="grey",
             parent_className="loading-container",
         )
+
+
+def _to_columnar_data(data_frame: pd.DataFrame) -> Dict[str, Any]:
+    """Returns the data of `data_frame` column by column, as expanded to records by the clientside `expand_table_data`.
+
+    Numerical columns are sent as their NumPy arrays. Other columns are dictionary encoded if at most half their values
+    are distinct: each distinct value is then sent once, and each row refers to it by its position (or -1 if missing).
+    """
+    columns: Dict[Any, Any] = {}
+    for column, series in data_frame.items():
+        if isinstance(series.dtype, np.dtype) and (is_numeric_dtype(series) or is_bool_dtype(series)):
+            columns[column] = series.to_numpy()
+            continue
+        codes, values = pd.factorize(series)
+        if len(values) <= len(series) // 2:
+            columns[column] = {"codes": codes, "values": values.tolist()}
+        else:
+            columns[column] = series.to_numpy(dtype=object)
+    return {"columns": columns, "length": len(data_frame)}
+
+
+def _get_page_count(n_rows: int, page_size: int) -> int:
+    return max(math.ceil(n_rows / page_size), 1)
+
+
+# A filter query of a DataTable consists of expressions like `{column} operator value` joined by ` && `.
+_FILTER_EXPRESSION = re.compile(r"^\s*\{(?P<column>.+?)\}\s+(?P<operator>\S+)\s+(?P<value>.*?)\s*$")
+_COMPARISON_OPERATORS = {
+    "=": "eq",
+    "s=": "eq",
+    "i=": "eq",
+    "eq": "eq",
+    "!=": "ne",
+    "ne": "ne",
+    "<": "lt",
+    "lt": "lt",
+    "<=": "le",
+    "le": "le",
+    ">": "gt",
+    "gt": "gt",
+    ">=": "ge",
+    "ge": "ge",
+}
+
+
+def _unquote(value: str) -> str:
+    if len(value) > 1 and value[0] == value[-1] and value[0] in "'\"`":
+        return value[1:-1].replace("\\" + value[0], value[0])
+    return value
+
+
+def _apply_filter_query(data_frame: pd.DataFrame, filter_query: str) -> pd.DataFrame:
+    """Filters `data_frame` by the `filter_query` of a DataTable with `filter_action="custom"`.
+
+    Supports comparisons (e.g. `{pop} >= 1000`), `contains` and `datestartswith`. Expressions that cannot be parsed
+    or compared with the values of their column, e.g. because the column mixes numbers and strings, are ignored.
+    """
+    for expression in filter(None, filter_query.split(" && ")):
+        match = _FILTER_EXPRESSION.match(expression)
+        if match is None or match["column"] not in data_frame:
+            logger.debug("Ignoring table filter expression %s", expression)
+            continue
+
+        series = data_frame[match["column"]]
+        operator = match["operator"]
+        value = _unquote(match["value"])
+        if operator in _COMPARISON_OPERATORS:
+            operand: Any = value
+            if is_numeric_dtype(series):
+                try:
+                    operand = float(value)
+                except ValueError:
+                    continue
+            if operator == "i=" and isinstance(operand, str):
+                mask = series.astype(str).str.lower() == operand.lower()
+            else:
+                try:
+                    mask = getattr(series, _COMPARISON_OPERATORS[operator])(operand)
+                except TypeError:
+                    logger.debug("Ignoring table filter expression %s", expression)
+                    continue
+        elif operator in {"contains", "scontains", "icontains"}:
+            mask = series.astype(str).str.contains(value, case=operator != "icontains", regex=False)
+        elif operator == "datestartswith":
+            mask = series.astype(str).str.startswith(value)
+        else:
+            logger.debug("Ignoring table filter expression %s", expression)
+            continue
+        data_frame = data_frame[mask.to_numpy()]
+    return data_frame
+
+
+def _apply_sort_by(data_frame: pd.DataFrame, sort_by: List[Dict[str, str]]) -> pd.DataFrame:
+    """Sorts `data_frame` by the `sort_by` of a DataTable with `sort_action="custom"`."""
+    sort_by = [column for column in sort_by if column["column_id"] in data_frame]
+    if not sort_by:
+        return data_frame
+    return data_frame.sort_values(
+        by=[column["column_id"] for column in sort_by],
+        ascending=[column["direction"] == "asc" for column in sort_by],
+        kind="stable",
+    )
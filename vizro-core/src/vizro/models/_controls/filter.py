@@ -13,6 +13,7 @@ except ImportError:  # pragma: no cov
 from vizro._constants import FILTER_ACTION_PREFIX
 from vizro.actions import _filter
 from vizro.managers import data_manager, model_manager
+from vizro.managers._data_index import CategoryIndex, SortedIndex
 from vizro.models import Action, VizroBaseModel
 from vizro.models._components.form import (
     Checklist,
@@ -45,12 +46,12 @@ def _filter_isin(series: pd.Series, value: MultiValueType) -> pd.Series:
     return series.isin(value)
 
 
-def _get_component_page(component_id: str) -> Page:  # type: ignore[return]
-    from vizro.models import Page
+# Indexes built over the original data to speed up each filter function, see vizro.managers._data_index.
+FILTER_INDEXES = {_filter_isin: CategoryIndex, _filter_between: SortedIndex}
+
 
-    for page_id, page in model_manager._items_with_type(Page):
-        if any(control.id == component_id for control in page.controls):
-            return page
+def _get_component_page(component_id: str) -> Page:
+    return model_manager._get_model_page(ModelID(component_id))  # type: ignore[return-value]
 
 
 class Filter(VizroBaseModel):
@@ -91,6 +92,7 @@ class Filter(VizroBaseModel):
         self._set_slider_values()
         self._set_categorical_selectors_options()
         self._set_actions()
+        self._set_filter_indexes()
 
     @_log_call
     def build(self):
@@ -100,15 +102,13 @@ class Filter(VizroBaseModel):
         if not self.targets:
             for component in _get_component_page(str(self.id)).components:
                 if data_manager._has_registered_data(component.id):
-                    data_frame = data_manager._get_component_data(component.id)
-                    if self.column in data_frame.columns:
+                    if self.column in data_manager._get_component_columns(component.id):
                         self.targets.append(component.id)
             if not self.targets:
                 raise ValueError(f"Selected column {self.column} not found in any dataframe on this page.")
 
     def _set_column_type(self):
-        data_frame = data_manager._get_component_data(self.targets[0])
-        if isinstance(data_frame[self.column], pd.PeriodDtype) or is_numeric_dtype(data_frame[self.column]):
+        if is_numeric_dtype(data_manager._get_component_dtype(self.targets[0], self.column)):
             self._column_type = "numerical"
         else:
             self._column_type = "categorical"
@@ -127,9 +127,9 @@ class Filter(VizroBaseModel):
             min_values = []
             max_values = []
             for target_id in self.targets:
-                data_frame = data_manager._get_component_data(target_id)
-                min_values.append(data_frame[self.column].min())
-                max_values.append(data_frame[self.column].max())
+                min_value, max_value = data_manager._get_component_min_max(target_id, self.column)
+                min_values.append(min_value)
+                max_values.append(max_value)
             if not is_numeric_dtype(pd.Series(min_values)) or not is_numeric_dtype(pd.Series(max_values)):
                 raise ValueError(
                     f"Non-numeric values detected in the shared data column '{self.column}' for targeted charts. "
@@ -144,8 +144,7 @@ class Filter(VizroBaseModel):
         if isinstance(self.selector, SELECTORS["categorical"]) and not self.selector.options:
             options = set()
             for target_id in self.targets:
-                data_frame = data_manager._get_component_data(target_id)
-                options |= set(data_frame[self.column])
+                options.update(data_manager._get_component_unique_values(target_id, self.column))
 
             self.selector.options = sorted(options)
 
@@ -162,3 +161,14 @@ class Filter(VizroBaseModel):
                     id=f"{FILTER_ACTION_PREFIX}_{self.id}",
                 )
             ]
+
+    def _set_filter_indexes(self):
+        if not data_manager.filter_indexes:
+            return
+        for action in (action for actions_chain in self.selector.actions for action in actions_chain.actions):
+            if action.function._function.__name__ != "_filter":
+                continue
+            index_type = FILTER_INDEXES.get(action.function["filter_function"])
+            if index_type is not None:
+                for target_id in action.function["targets"]:
+                    data_manager._add_filter_index(target_id, action.function["filter_column"], index_type)
@@ -3,7 +3,7 @@ from __future__ import annotations
 import logging
 from functools import partial
 from pathlib import Path
-from typing import TYPE_CHECKING, List, Literal, TypedDict
+from typing import TYPE_CHECKING, Dict, List, Literal, Optional, Tuple, TypedDict
 
 import dash
 import dash_bootstrap_components as dbc
@@ -11,9 +11,9 @@ import dash_mantine_components as dmc
 from dash import ClientsideFunction, Input, Output, clientside_callback, get_asset_url, get_relative_path, html
 
 try:
-    from pydantic.v1 import Field, validator
+    from pydantic.v1 import Field, PrivateAttr, validator
 except ImportError:  # pragma: no cov
-    from pydantic import Field, validator
+    from pydantic import Field, PrivateAttr, validator
 
 from dash.development.base_component import Component
 
@@ -73,6 +73,9 @@ class Dashboard(VizroBaseModel):
     navigation: Navigation = None  # type: ignore[assignment]
     title: str = Field("", description="Dashboard title to appear on every page on top left-side.")
 
+    # Layout of each page built on its first visit, by page ID, together with the Dash hot reload hash at the time.
+    _page_layouts: Dict[str, Tuple[Optional[str], Component]] = PrivateAttr({})
+
     @validator("pages", always=True)
     def validate_pages(cls, pages):
         if not pages:
@@ -90,6 +93,7 @@ class Dashboard(VizroBaseModel):
 
     @_log_call
     def pre_build(self):
+        self._page_layouts.clear()
         meta_image = self._infer_image("app") or self._infer_image("logo")
 
         # Setting order here ensures that the pages in dash.page_registry preserves the order of the List[Page].
@@ -110,6 +114,7 @@ class Dashboard(VizroBaseModel):
 
     @_log_call
     def build(self):
+        self._page_layouts.clear()
         for page in self.pages:
             page.build()  # TODO: ideally remove, but necessary to register slider callbacks
 
@@ -190,8 +195,17 @@ class Dashboard(VizroBaseModel):
         return html.Div([page_header, page_main], id="page-container")
 
     def _make_page_layout(self, page: Page):
+        # Dash calls this on every visit to the page, but the layout only changes when the dashboard is built again or,
+        # with Dash hot reloading enabled, when the assets (e.g. the logo) change. Hot reloading then changes its hash.
+        hot_reload_hash = dash.get_app()._hot_reload.hash
+        cached_page_layout = self._page_layouts.get(page.id)
+        if cached_page_layout is not None and cached_page_layout[0] == hot_reload_hash:
+            return cached_page_layout[1]
+
         page_divs = self._get_page_divs(page=page)
-        return self._arrange_page_divs(page_divs=page_divs)
+        page_layout = self._arrange_page_divs(page_divs=page_divs)
+        self._page_layouts[page.id] = (hot_reload_hash, page_layout)
+        return page_layout
 
     @staticmethod
     def _make_page_404_layout():
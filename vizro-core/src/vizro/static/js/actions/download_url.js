@@ -0,0 +1,14 @@
+export function _download_url(url) {
+  if (!url) {
+    return dash_clientside.no_update;
+  }
+
+  const link = document.createElement("a");
+  link.href = url;
+  link.download = "";
+  document.body.appendChild(link);
+  link.click();
+  link.remove();
+  // Clear the URL so that the same file is not downloaded again, e.g. when the page is loaded again.
+  return true;
+}
@@ -0,0 +1,27 @@
+export function _expand_table_data(columnar_data) {
+  if (!columnar_data) {
+    return dash_clientside.no_update;
+  }
+
+  const names = Object.keys(columnar_data["columns"]);
+  const columns = names.map((name) => {
+    const column = columnar_data["columns"][name];
+    if (Array.isArray(column)) {
+      return column;
+    }
+    // Dictionary encoded column: codes refer to positions in values, with -1 for missing values.
+    return column["codes"].map((code) =>
+      code === -1 ? null : column["values"][code],
+    );
+  });
+
+  const records = new Array(columnar_data["length"]);
+  for (let row = 0; row < records.length; row++) {
+    const record = {};
+    for (let i = 0; i < names.length; i++) {
+      record[names[i]] = columns[i][row];
+    }
+    records[row] = record;
+  }
+  return records;
+}
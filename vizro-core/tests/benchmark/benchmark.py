@@ -0,0 +1,313 @@
+"""Benchmarks dashboard build and callback latency and peak memory for a grid of synthetic dashboards.
+
+Each point of the grid is a dashboard with a number of pages, each with a number of components and controls that all
+use one dataset with a number of rows. The models are pre-built, the dashboard is built with `Vizro().build` and its
+callbacks are run, all inside the app context of the Flask server as they would be when serving the dashboard. Results
+are written to a JSON file named after the current commit, so that runs on different commits can be compared, e.g.:
+
+    hatch run benchmark --pages 1 10 --rows 1000 100000
+    hatch run benchmark --compare tests/benchmark/results/<baseline commit>.json
+"""
+
+import argparse
+import itertools
+import json
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from importlib.metadata import version
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+import numpy as np
+import pandas as pd
+from dash._callback_context import context_value
+from dash._utils import AttributeDict
+
+import vizro
+import vizro.models as vm
+import vizro.plotly.express as px
+from vizro import Vizro
+from vizro.managers import data_manager
+from vizro.tables import dash_data_table
+
+RESULTS_DIR = Path(__file__).with_name("results")
+
+# Stages of building and running a dashboard that are measured for each point of the grid. The pre_build stage is
+# Vizro._pre_build, and the build stage is the rest of Vizro.build, e.g. compiling target plans and building the
+# dashboard.
+STAGES = ["pre_build", "build", "page_layout", "on_page_load", "filter"]
+
+# Columns of the synthetic dataset that controls filter on, in turn.
+FILTER_COLUMNS = ["category", "x", "group", "size"]
+
+
+class GridPoint(NamedTuple):
+    pages: int
+    components: int
+    controls: int
+    rows: int
+
+
+def _make_data(rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {
+            "category": rng.choice([f"category_{i}" for i in range(20)], size=rows),
+            "group": rng.choice([f"group_{i}" for i in range(5)], size=rows),
+            "x": rng.normal(size=rows),
+            "y": rng.normal(size=rows),
+            "size": rng.integers(0, 100, size=rows),
+        }
+    )
+
+
+def _make_component(index: int) -> vm.VizroBaseModel:
+    if index % 3 == 0:
+        return vm.Graph(figure=px.scatter("data", x="x", y="y", color="group"))
+    if index % 3 == 1:
+        return vm.Graph(figure=px.histogram("data", x="x", color="group"))
+    return vm.Table(figure=dash_data_table("data"))
+
+
+def _make_control(index: int) -> vm.Filter:
+    column = FILTER_COLUMNS[index % len(FILTER_COLUMNS)]
+    if column == "group":
+        return vm.Filter(column=column, selector=vm.Checklist())
+    return vm.Filter(column=column)
+
+
+def _make_dashboard(grid_point: GridPoint) -> vm.Dashboard:
+    pages = [
+        vm.Page(
+            title=f"Page {page_index}",
+            components=[_make_component(index) for index in range(grid_point.components)],
+            controls=[_make_control(index) for index in range(grid_point.controls)],
+        )
+        for page_index in range(grid_point.pages)
+    ]
+    return vm.Dashboard(pages=pages)
+
+
+def _get_selected_value(selector: vm.VizroBaseModel) -> Any:
+    """Returns a value of `selector` that selects about half of the data."""
+    if isinstance(selector, (vm.RangeSlider, vm.Slider)):
+        return [selector.min, (selector.min + selector.max) / 2]
+    return selector.options[: max(len(selector.options) // 2, 1)]
+
+
+def _set_callback_context(page: vm.Page):
+    """Sets the Dash callback context to that of a callback triggered on `page` with a value selected in each filter."""
+    filters = [
+        {
+            "id": control.selector.id,
+            "property": "value",
+            "value": _get_selected_value(control.selector),
+            "str_id": control.selector.id,
+            "triggered": False,
+        }
+        for control in page.controls
+    ]
+    theme_selector = {
+        "id": "theme_selector",
+        "property": "checked",
+        "value": False,
+        "str_id": "theme_selector",
+        "triggered": False,
+    }
+    context_value.set(
+        AttributeDict(
+            args_grouping={
+                "external": {
+                    "filters": filters,
+                    "filter_interaction": [],
+                    "parameters": [],
+                    "theme_selector": theme_selector,
+                }
+            }
+        )
+    )
+
+
+def _run_stages(
+    grid_point: GridPoint,
+    data: pd.DataFrame,
+    measure: Callable[[Callable[[], Any]], float],
+    vizro_kwargs: Dict[str, Any],
+):
+    """Builds and runs a dashboard for `grid_point`, and returns the result of `measure` for each stage."""
+    Vizro._reset()
+    data_manager["data"] = data
+    app = Vizro(**vizro_kwargs)
+    dashboard = _make_dashboard(grid_point)
+    results = {}
+
+    # Settings such as the target plans compiled by Vizro.build, the figure cache and metrics live in the Flask app.
+    with app.dash.server.app_context():
+        results["pre_build"] = measure(app._pre_build)
+        # The models are pre-built already, so Vizro.build must not pre-build them again.
+        app._pre_build = lambda: None
+        results["build"] = measure(lambda: app.build(dashboard))
+        results["page_layout"] = max(
+            measure(lambda page=page: dashboard._make_page_layout(page)) for page in dashboard.pages
+        )
+
+        # Callbacks are run for the first page, with a value selected in each filter.
+        page = dashboard.pages[0]
+        _set_callback_context(page)
+        results["on_page_load"] = measure(page.actions[0].actions[0].function)
+        results["filter"] = measure(page.controls[0].selector.actions[0].actions[0].function) if page.controls else None
+    return results
+
+
+def _time(function: Callable[[], Any]) -> float:
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def _peak_memory(function: Callable[[], Any]) -> float:
+    """Returns the peak memory in bytes allocated by `function` on top of what was allocated before it ran."""
+    tracemalloc.reset_peak()
+    memory_before, _ = tracemalloc.get_traced_memory()
+    function()
+    _, peak_memory = tracemalloc.get_traced_memory()
+    return peak_memory - memory_before
+
+
+def measure_import_time(repeat: int) -> float:
+    """Returns the shortest time in seconds that importing vizro took in a new Python process."""
+    code = "import time; start = time.perf_counter(); import vizro; print(time.perf_counter() - start)"
+    return min(
+        float(subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout)
+        for _ in range(repeat)
+    )
+
+
+def run_benchmark(
+    grid_points: List[GridPoint], repeat: int, vizro_kwargs: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """Measures the time and peak memory of each stage for each point of the grid.
+
+    Times are the shortest of `repeat` runs, since longer times are mostly caused by other processes. Peak memory is
+    measured in a separate run since tracing memory allocations slows everything down. `vizro_kwargs` are passed to
+    `Vizro`, e.g. to enable the figure cache or metrics.
+    """
+    vizro_kwargs = vizro_kwargs or {}
+    results = []
+    for grid_point in grid_points:
+        data = _make_data(grid_point.rows)
+        times = [_run_stages(grid_point, data, _time, vizro_kwargs) for _ in range(repeat)]
+
+        tracemalloc.start()
+        try:
+            peak_memory = _run_stages(grid_point, data, _peak_memory, vizro_kwargs)
+        finally:
+            tracemalloc.stop()
+
+        results.append(
+            {
+                **grid_point._asdict(),
+                "time": {
+                    stage: None if times[0][stage] is None else min(run[stage] for run in times) for stage in STAGES
+                },
+                "peak_memory": peak_memory,
+            }
+        )
+        times_text = ", ".join(f"{stage}={_format_time(results[-1]['time'][stage])}" for stage in STAGES)
+        print(f"{grid_point}: {times_text}")  # noqa: T201
+    Vizro._reset()
+
+    return {
+        "commit": _get_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "versions": {"vizro": vizro.__version__, "dash": version("dash"), "pandas": pd.__version__},
+        "vizro_kwargs": vizro_kwargs,
+        "import_time": measure_import_time(repeat),
+        "results": results,
+    }
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any]) -> List[str]:
+    """Returns lines of a table that compares the time of each stage in `current` to `baseline`."""
+    baseline_results = {GridPoint(**_get_grid_point(result)): result for result in baseline["results"]}
+    lines = [f"import_time: {_format_change(baseline['import_time'], current['import_time'])}"]
+    for result in current["results"]:
+        grid_point = GridPoint(**_get_grid_point(result))
+        if grid_point not in baseline_results:
+            continue
+        changes = ", ".join(
+            f"{stage}={_format_change(baseline_results[grid_point]['time'][stage], result['time'][stage])}"
+            for stage in STAGES
+        )
+        lines.append(f"{grid_point}: {changes}")
+    return lines
+
+
+def _get_grid_point(result: Dict[str, Any]) -> Dict[str, int]:
+    return {field: result[field] for field in GridPoint._fields}
+
+
+def _format_time(seconds: Optional[float]) -> str:
+    # Stages that do not exist for a grid point, e.g. filter callbacks without controls, have no time.
+    return "-" if seconds is None else f"{seconds:.4f}s"
+
+
+def _format_change(baseline: Optional[float], current: Optional[float]) -> str:
+    if not baseline or current is None:
+        return _format_time(current)
+    return f"{_format_time(current)} ({(current - baseline) / baseline:+.0%})"
+
+
+def _get_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], check=True, capture_output=True, text=True, cwd=Path(__file__).parent
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(args: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, nargs="+", default=[1, 10], help="Numbers of pages.")
+    parser.add_argument("--components", type=int, nargs="+", default=[3, 12], help="Numbers of components per page.")
+    parser.add_argument("--controls", type=int, nargs="+", default=[1, 4], help="Numbers of controls per page.")
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000, 100_000], help="Numbers of rows of data.")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of runs to take the shortest time of.")
+    parser.add_argument("--figure-cache-size", type=int, help="Passed to Vizro to enable the figure cache.")
+    parser.add_argument("--figure-workers", type=int, help="Passed to Vizro to build figures concurrently.")
+    parser.add_argument("--metrics", action="store_true", help="Passed to Vizro to time the stages of actions.")
+    parser.add_argument("--output", type=Path, help="File to write results to. Defaults to results/<commit>.json.")
+    parser.add_argument("--compare", type=Path, help="Results file of a previous run to compare results to.")
+    parsed_args = parser.parse_args(args)
+
+    grid_points = [
+        GridPoint(*values)
+        for values in itertools.product(
+            parsed_args.pages, parsed_args.components, parsed_args.controls, parsed_args.rows
+        )
+    ]
+    vizro_kwargs = {
+        "figure_cache_size": parsed_args.figure_cache_size,
+        "figure_workers": parsed_args.figure_workers,
+        "metrics": parsed_args.metrics,
+    }
+    results = run_benchmark(grid_points, repeat=parsed_args.repeat, vizro_kwargs=vizro_kwargs)
+
+    output = parsed_args.output or RESULTS_DIR / f"{results['commit'] or 'results'}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, indent=2))
+    print(f"Results written to {output}")  # noqa: T201
+
+    if parsed_args.compare:
+        print("\n".join(compare(json.loads(parsed_args.compare.read_text()), results)))  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
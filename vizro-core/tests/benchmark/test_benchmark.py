@@ -0,0 +1,38 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+BENCHMARK = Path(__file__).with_name("benchmark.py")
+
+
+def test_benchmark(tmp_path):
+    """Runs the smallest benchmark so that the benchmark suite keeps working as vizro changes."""
+    args = ["--pages", "1", "--components", "3", "--controls", "0", "2", "--rows", "100", "--repeat", "1"]
+    subprocess.run([sys.executable, BENCHMARK, *args, "--output", tmp_path / "baseline.json"], check=True)
+    completed = subprocess.run(
+        [
+            sys.executable,
+            BENCHMARK,
+            *args,
+            "--output",
+            tmp_path / "current.json",
+            "--compare",
+            tmp_path / "baseline.json",
+            "--figure-cache-size",
+            "100000000",
+            "--metrics",
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    results = json.loads((tmp_path / "current.json").read_text())
+
+    assert [(result["controls"], result["rows"]) for result in results["results"]] == [(0, 100), (2, 100)]
+    assert results["results"][0]["time"]["filter"] is None
+    assert results["results"][1]["time"]["filter"] > 0
+    assert results["results"][1]["peak_memory"]["build"] > 0
+    assert results["import_time"] > 0
+    assert results["vizro_kwargs"] == {"figure_cache_size": 100000000, "figure_workers": None, "metrics": True}
+    assert "GridPoint(pages=1, components=3, controls=2, rows=100): pre_build=" in completed.stdout
@@ -0,0 +1,17 @@
+import { _download_url } from "../../../src/vizro/static/js/actions/download_url.js";
+
+beforeEach(() => {
+  global.dash_clientside = { no_update: "no_update" };
+});
+
+test("no download without url", () => {
+  expect(_download_url(null)).toBe("no_update");
+});
+
+test("url is downloaded and cleared", () => {
+  const click = jest.spyOn(HTMLAnchorElement.prototype, "click").mockImplementation(() => {});
+  expect(_download_url("/vizro-download/abc.csv/data.csv")).toBe(true);
+  expect(click).toHaveBeenCalledTimes(1);
+  expect(document.querySelectorAll("a")).toHaveLength(0);
+  click.mockRestore();
+});
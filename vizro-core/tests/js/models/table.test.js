@@ -0,0 +1,20 @@
+import { _expand_table_data } from "../../../src/vizro/static/js/models/table.js";
+
+test("columnar data is expanded to records", () => {
+  const columnar_data = {
+    columns: {
+      country: ["Albania", "Algeria", "Zambia"],
+      continent: { codes: [0, 0, -1], values: ["Europe"] },
+    },
+    length: 3,
+  };
+  expect(_expand_table_data(columnar_data)).toEqual([
+    { country: "Albania", continent: "Europe" },
+    { country: "Algeria", continent: "Europe" },
+    { country: "Zambia", continent: null },
+  ]);
+});
+
+test("empty columnar data is expanded to no records", () => {
+  expect(_expand_table_data({ columns: {}, length: 0 })).toEqual([]);
+});
@@ -0,0 +1,33 @@
+"""Unit tests for vizro.actions._action_loop._action_loop file."""
+
+import vizro.models as vm
+import vizro.plotly.express as px
+from vizro import Vizro
+from vizro.actions import export_data
+from vizro.actions._action_loop._action_loop import ActionLoop
+from vizro.managers import model_manager
+from vizro.managers._model_manager import _ModelRelations
+
+
+class TestBuildActionsModels:
+    def test_relations_found_once(self, vizro_app, gapminder, mocker):
+        vm.Dashboard(
+            pages=[
+                vm.Page(
+                    title="Test page",
+                    components=[
+                        vm.Graph(figure=px.scatter(gapminder, x="gdpPercap", y="lifeExp")),
+                        vm.Button(actions=[vm.Action(function=export_data())]),
+                    ],
+                    controls=[vm.Filter(column="continent")],
+                )
+            ]
+        )
+        Vizro._pre_build()
+        # Relations found before the actions are built might be out of date, so they are found again exactly once.
+        model_manager._get_relations()
+        model_relations = mocker.patch("vizro.managers._model_manager._ModelRelations", wraps=_ModelRelations)
+
+        ActionLoop._build_actions_models()
+
+        model_relations.assert_called_once()
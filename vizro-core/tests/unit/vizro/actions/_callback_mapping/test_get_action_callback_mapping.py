@@ -11,6 +11,7 @@ import vizro.plotly.express as px
 from vizro import Vizro
 from vizro.actions import export_data, filter_interaction
 from vizro.actions._callback_mapping._get_action_callback_mapping import _get_action_callback_mapping
+from vizro.managers import model_manager
 from vizro.models.types import capture
 
 
@@ -353,3 +354,22 @@ class TestCallbackMapping:
             argument=argument,
         )
         assert result == expected
+
+    @pytest.mark.parametrize(
+        "action_id",
+        [
+            "filter_action_filter_continent",
+            "filter_interaction_action",
+            "table_filter_interaction_action",
+            "parameter_action_parameter_x",
+            "on_page_load_action_action_test_page",
+            "export_data_action",
+        ],
+    )
+    @pytest.mark.parametrize("argument", ["inputs", "outputs"])
+    def test_action_callback_mapping_uses_model_relations(self, action_id, argument, mocker):
+        model_manager._get_relations()
+        get_relations = mocker.spy(model_manager, "_get_relations")
+        _get_action_callback_mapping(action_id=action_id, argument=argument)
+        # The relations between actions and pages are found once and not searched for again for each action.
+        assert all(not call.kwargs.get("refresh") for call in get_relations.call_args_list)
@@ -1,6 +1,30 @@
+import threading
+from types import SimpleNamespace
+
+import pandas as pd
 import pytest
+from dash import no_update
 
-from vizro.actions._actions_utils import _create_target_arg_mapping, _update_nested_graph_properties
+import vizro.actions._actions_utils
+import vizro.models as vm
+from vizro import Vizro
+from vizro.actions._actions_utils import (
+    FilterCondition,
+    _apply_filter_conditions,
+    _compile_target_plans,
+    _create_target_arg_mapping,
+    _estimate_selectivity,
+    _get_filtered_data,
+    _get_modified_page_figures,
+    _get_shared_filtered_data_key,
+    _get_target_filter_conditions,
+    _get_target_plan,
+    _TargetPlan,
+    _update_nested_graph_properties,
+)
+from vizro.managers import data_manager
+from vizro.managers._data_index import CategoryIndex, SortedIndex
+from vizro.models._controls.filter import _filter_between, _filter_isin
 
 
 class TestUpdateNestedGraphProperties:
@@ -94,3 +118,296 @@ class TestCreateTargetArgMapping:
         input_strings = ["component1.argument1.extra", "component2.argument2.extra"]
         expected = {"component1": ["argument1.extra"], "component2": ["argument2.extra"]}
         assert _create_target_arg_mapping(input_strings) == expected
+
+
+class TestApplyFilterConditions:
+    @pytest.fixture
+    def data_frame(self):
+        return pd.DataFrame(
+            {
+                "category": ["a", "b", "c", "a", "b", "c", "a", "b"],
+                "number": [1, 2, 3, 4, 5, 6, 7, 8],
+            }
+        )
+
+    @pytest.fixture
+    def target(self, data_frame):
+        data_manager["data"] = data_frame
+        data_manager._add_component("target", "data")
+        return "target"
+
+    def test_no_conditions(self, data_frame, target):
+        result = _apply_filter_conditions(data_frame, target, [])
+        pd.testing.assert_frame_equal(result, data_frame)
+
+    @pytest.mark.parametrize(
+        "filter_conditions, expected_numbers",
+        [
+            ([FilterCondition("category", _filter_isin, ["a"])], [1, 4, 7]),
+            ([FilterCondition("number", _filter_between, [2, 5])], [2, 3, 4, 5]),
+            (
+                [FilterCondition("number", _filter_between, [2, 7]), FilterCondition("category", _filter_isin, ["a"])],
+                [4, 7],
+            ),
+            (
+                [
+                    FilterCondition("category", _filter_isin, ["a", "b"]),
+                    FilterCondition("category", _filter_isin, ["b"]),
+                    FilterCondition("number", _filter_between, [3, 8]),
+                ],
+                [5, 8],
+            ),
+            ([FilterCondition("category", _filter_isin, ["d"])], []),
+        ],
+    )
+    def test_conditions_combined(self, data_frame, target, filter_conditions, expected_numbers):
+        result = _apply_filter_conditions(data_frame, target, filter_conditions)
+        assert result["number"].tolist() == expected_numbers
+
+    def test_conditions_with_indexes(self, data_frame, target):
+        data_manager._add_filter_index(target, "category", CategoryIndex)
+        data_manager._add_filter_index(target, "number", SortedIndex)
+        filter_conditions = [
+            FilterCondition("number", _filter_between, [2, 7]),
+            FilterCondition("category", _filter_isin, ["a"]),
+        ]
+        result = _apply_filter_conditions(data_manager._get_component_data(target), target, filter_conditions)
+        assert result["number"].tolist() == [4, 7]
+
+    @pytest.mark.parametrize(
+        "filter_conditions, expected_numbers",
+        [
+            ([FilterCondition("nullable", _filter_between, [2, 7])], [2, 4, 5, 7]),
+            (
+                [
+                    FilterCondition("nullable", _filter_between, [2, 7]),
+                    FilterCondition("category", _filter_isin, ["a"]),
+                ],
+                [4, 7],
+            ),
+            (
+                [
+                    FilterCondition("nullable", _filter_between, [2, 7]),
+                    FilterCondition("category", _filter_isin, ["a", "b"]),
+                ],
+                [2, 4, 5, 7],
+            ),
+        ],
+    )
+    def test_conditions_on_nullable_column(self, data_frame, target, filter_conditions, expected_numbers):
+        data_frame["nullable"] = pd.array([1, 2, None, 4, 5, None, 7, 8], dtype="Int64")
+        result = _apply_filter_conditions(data_frame, target, filter_conditions)
+        assert result["number"].tolist() == expected_numbers
+
+    def test_estimate_selectivity(self):
+        conditions = [
+            FilterCondition("number", _filter_between, [2, 7]),
+            FilterCondition("category", _filter_isin, ["a", "b"]),
+            FilterCondition("category", _filter_isin, ["a"]),
+        ]
+        assert sorted(conditions, key=_estimate_selectivity) == conditions[::-1]
+
+
+class TestGetFilteredData:
+    @pytest.fixture(autouse=True)
+    def targets(self):
+        data_manager["data_1"] = pd.DataFrame({"col1": [1, 2, 3]})
+        data_manager["data_2"] = pd.DataFrame({"col1": [4, 5, 6]})
+        data_manager._add_component("target_1", "data_1")
+        data_manager._add_component("target_2", "data_1")
+        data_manager._add_component("target_3", "data_2")
+
+    def test_targets_with_same_dataset_filtered_once(self, mocker):
+        spy = mocker.spy(vizro.actions._actions_utils, "_apply_filter_conditions")
+        filtered_data = _get_filtered_data(["target_1", "target_2", "target_3"], [], [])
+        assert spy.call_count == 2
+        pd.testing.assert_frame_equal(filtered_data["target_1"], filtered_data["target_2"])
+        assert filtered_data["target_1"] is not filtered_data["target_2"]
+        assert filtered_data["target_3"]["col1"].tolist() == [4, 5, 6]
+
+    def test_shared_filtered_data_cannot_be_modified(self):
+        filtered_data = _get_filtered_data(["target_1", "target_2"], [], [])
+        filtered_data["target_1"].loc[0, "col1"] = 100
+        assert filtered_data["target_2"]["col1"].tolist() == [1, 2, 3]
+
+    def test_filtered_data_cached_across_calls(self, mocker):
+        data_manager.filtered_data_cache_size = 10**6
+        spy = mocker.spy(vizro.actions._actions_utils, "_apply_filter_conditions")
+        mocker.patch.object(
+            vizro.actions._actions_utils,
+            "_get_filter_conditions",
+            return_value=[FilterCondition("col1", _filter_isin, [1, 2])],
+        )
+        for _ in range(2):
+            filtered_data = _get_filtered_data(["target_1", "target_3"], [], [])
+            assert filtered_data["target_1"]["col1"].tolist() == [1, 2]
+            assert filtered_data["target_3"]["col1"].tolist() == []
+        assert spy.call_count == 2
+
+        filtered_data["target_1"].loc[0, "col1"] = 100
+        assert _get_filtered_data(["target_1"], [], [])["target_1"]["col1"].tolist() == [1, 2]
+        assert spy.call_count == 2
+
+    def test_shared_key_unhashable_value(self):
+        assert _get_shared_filtered_data_key("target_1", [FilterCondition("col1", _filter_isin, [[1, 2]])]) is None
+
+
+class TestTargetPlans:
+    @pytest.fixture
+    def page(self, box_chart, scatter_chart):
+        return vm.Page(
+            id="test_page",
+            title="Test page",
+            components=[vm.Graph(id="box_chart", figure=box_chart), vm.Graph(id="scatter_chart", figure=scatter_chart)],
+            controls=[
+                vm.Filter(column="continent", selector=vm.Dropdown(id="filter_selector")),
+                vm.Filter(column="pop", targets=["scatter_chart"], selector=vm.RangeSlider(id="range_slider")),
+                vm.Parameter(
+                    targets=["scatter_chart.x", "scatter_chart.title", "box_chart.title"],
+                    selector=vm.RadioItems(id="parameter_selector", options=["lifeExp", "pop"]),
+                ),
+            ],
+        )
+
+    @pytest.mark.usefixtures("vizro_app", "page")
+    def test_compile_target_plans(self):
+        Vizro._pre_build()
+        assert _compile_target_plans() == {
+            "box_chart": _TargetPlan(
+                filters={"filter_selector": [("continent", _filter_isin)]},
+                parameters={"parameter_selector": ["title"]},
+            ),
+            "scatter_chart": _TargetPlan(
+                filters={"filter_selector": [("continent", _filter_isin)], "range_slider": [("pop", _filter_between)]},
+                parameters={"parameter_selector": ["x", "title"]},
+            ),
+        }
+
+    def test_target_plan_compiled_at_build(self, vizro_app, page, mocker):
+        vizro_app.build(vm.Dashboard(pages=[page]))
+        spy = mocker.spy(vizro.actions._actions_utils, "_compile_target_plans")
+        ctds_filters = [
+            {"id": "filter_selector", "property": "value", "value": ["Europe"], "str_id": "", "triggered": False},
+            {"id": "range_slider", "property": "value", "value": [0, 10**6], "str_id": "", "triggered": False},
+        ]
+        with vizro_app.dash.server.app_context():
+            assert _get_target_plan("box_chart").filters == {"filter_selector": [("continent", _filter_isin)]}
+            assert _get_target_filter_conditions("scatter_chart", ctds_filters, []) == [
+                FilterCondition("continent", _filter_isin, ["Europe"]),
+                FilterCondition("pop", _filter_between, [0, 10**6]),
+            ]
+        spy.assert_not_called()
+
+    def test_target_plan_used_without_app_context(self, vizro_app, page, mocker):
+        # Actions that run as background jobs have no app context.
+        vizro_app.build(vm.Dashboard(pages=[page]))
+        spy = mocker.spy(vizro.actions._actions_utils, "_compile_target_plans")
+        assert _get_target_plan("box_chart").parameters == {"parameter_selector": ["title"]}
+        spy.assert_not_called()
+
+    def test_target_plans_discarded_on_reset(self, vizro_app, page, mocker):
+        vizro_app.build(vm.Dashboard(pages=[page]))
+        Vizro._reset()
+        spy = mocker.spy(vizro.actions._actions_utils, "_compile_target_plans")
+        assert _get_target_plan("box_chart") == _TargetPlan(filters={}, parameters={})
+        spy.assert_called_once()
+
+
+class TestGetModifiedPageFigures:
+    @pytest.fixture(autouse=True)
+    def targets(self, mocker):
+        data_manager["data"] = pd.DataFrame({"col1": [1, 2, 3]})
+        data_manager._add_component("target_1", "data")
+        data_manager._add_component("target_2", "data")
+
+        def build_figure(data_frame):
+            return threading.current_thread().name, data_frame["col1"].tolist()
+
+        def build_failing_figure(data_frame):
+            raise ValueError("Failed to build figure.")
+
+        # Targets need a `figure` to be parametrized but are otherwise only called to build the figure.
+        build_figure.figure = build_failing_figure.figure = SimpleNamespace(_arguments={"data_frame": "data"})
+        mocker.patch.object(
+            vizro.actions._actions_utils,
+            "model_manager",
+            {"target_1": build_figure, "target_2": build_figure, "target_3": build_failing_figure},
+        )
+        data_manager._add_component("target_3", "data")
+
+    @pytest.fixture
+    def figure_workers(self, vizro_app):
+        vizro_app.dash.server.config["VIZRO_FIGURE_WORKERS"] = 2
+        with vizro_app.dash.server.app_context():
+            yield
+
+    def test_figures_built_serially_by_default(self):
+        outputs = _get_modified_page_figures([], [], [], targets=["target_1", "target_2"])
+        assert outputs == {
+            "target_1": (threading.current_thread().name, [1, 2, 3]),
+            "target_2": (threading.current_thread().name, [1, 2, 3]),
+        }
+
+    @pytest.mark.usefixtures("figure_workers")
+    def test_figures_built_concurrently(self):
+        outputs = _get_modified_page_figures([], [], [], targets=["target_1", "target_2"])
+        assert list(outputs) == ["target_1", "target_2"]
+        for thread_name, values in outputs.values():
+            assert thread_name.startswith("vizro_figure")
+            assert values == [1, 2, 3]
+
+    @pytest.mark.usefixtures("figure_workers")
+    def test_failing_figure_isolated(self, caplog):
+        outputs = _get_modified_page_figures([], [], [], targets=["target_1", "target_3"])
+        assert outputs["target_1"][1] == [1, 2, 3]
+        assert outputs["target_3"] is no_update
+        assert "Building figure for target target_3 failed." in caplog.text
+
+
+@pytest.mark.usefixtures("managers_one_page_two_graphs_one_button")
+class TestGetModifiedPageFiguresCache:
+    @pytest.fixture(autouse=True)
+    def figure_cache(self):
+        app = Vizro(figure_cache_size=10 * 1024**2)
+        with app.dash.server.app_context():
+            yield app.dash.server.extensions["vizro_figure_cache"]
+
+    def test_figures_cached(self, mocker, figure_cache):
+        spy = mocker.spy(vizro.actions._actions_utils, "_apply_filter_conditions")
+        first_outputs = _get_modified_page_figures([], [], [], targets=["box_chart", "scatter_chart"])
+        second_outputs = _get_modified_page_figures([], [], [], targets=["box_chart", "scatter_chart"])
+        # Both graphs share their filtered data, which is not filtered again when the figures are cached.
+        assert spy.call_count == 1
+        assert second_outputs["box_chart"] is first_outputs["box_chart"]
+        assert second_outputs["scatter_chart"] is first_outputs["scatter_chart"]
+        assert (figure_cache.hits, figure_cache.misses) == (2, 2)
+
+    def test_figure_rebuilt_for_different_filters(self, mocker, figure_cache):
+        first_outputs = _get_modified_page_figures([], [], [], targets=["box_chart"])
+        mocker.patch.object(
+            vizro.actions._actions_utils,
+            "_get_filter_conditions",
+            return_value=[FilterCondition("continent", _filter_isin, ["Europe"])],
+        )
+        second_outputs = _get_modified_page_figures([], [], [], targets=["box_chart"])
+        assert second_outputs["box_chart"] is not first_outputs["box_chart"]
+        assert (figure_cache.hits, figure_cache.misses) == (0, 2)
+
+
+@pytest.mark.usefixtures("managers_one_page_two_graphs_one_button")
+class TestGetModifiedPageFiguresMetrics:
+    def test_stages_timed(self):
+        app = Vizro(metrics=True)
+        with app.dash.server.app_context():
+            _get_modified_page_figures([], [], [], targets=["box_chart", "scatter_chart"])
+        rendered = app.dash.server.extensions["vizro_metrics"].render()
+
+        assert (
+            'vizro_action_stage_duration_seconds_count{stage="parametrized_config",page="",action="",target=""} 1'
+            in (rendered)
+        )
+        # Both graphs share their filtered data, so it is only loaded and filtered for the first one.
+        for stage, target in [("data_load", "box_chart"), ("filter", "box_chart")]:
+            assert f'count{{stage="{stage}",page="",action="",target="{target}"}} 1' in rendered
+        for target in ["box_chart", "scatter_chart"]:
+            assert f'count{{stage="figure_build",page="",action="",target="{target}"}} 1' in rendered
@@ -1,7 +1,14 @@
+import base64
+import io
+import zipfile
+
+import pandas as pd
 import pytest
+from dash import no_update
 from dash._callback_context import context_value
 from dash._utils import AttributeDict
 
+import vizro.actions._export_utils
 import vizro.models as vm
 from vizro import Vizro
 from vizro.actions import export_data, filter_interaction
@@ -381,3 +388,112 @@ class TestExportData:
         }
 
         assert result == expected
+
+    @pytest.mark.usefixtures("vizro_app", "managers_one_page_two_graphs_one_button")
+    @pytest.mark.parametrize("ctx_export_data", [(["scatter_chart"], None, None, None)], indirect=True)
+    def test_streaming(self, ctx_export_data, gapminder_2007, tmp_path, monkeypatch):
+        monkeypatch.setattr("vizro.actions._export_utils.EXPORT_DIR", tmp_path)
+        model_manager["button"].actions = [
+            vm.Action(id="test_action", function=export_data(targets=["scatter_chart"], streaming=True))
+        ]
+
+        result = model_manager["test_action"].function()
+        url = result["download_dataframe_scatter_chart"]
+        _, prefix, export_file, filename = url.split("/")
+
+        assert prefix == "vizro-download"
+        assert filename == "scatter_chart.csv"
+        assert (tmp_path / export_file).read_text() == gapminder_2007.to_csv(index=False)
+
+    @pytest.mark.usefixtures("vizro_app", "managers_one_page_two_graphs_one_button")
+    @pytest.mark.parametrize("ctx_export_data", [(["scatter_chart"], None, None, None)], indirect=True)
+    @pytest.mark.parametrize(
+        "file_format, reader",
+        [
+            ("parquet", pd.read_parquet),
+            ("feather", pd.read_feather),
+            ("csv.gz", lambda file: pd.read_csv(file, compression="gzip")),
+        ],
+    )
+    def test_streaming_file_formats_in_chunks(
+        self, ctx_export_data, file_format, reader, gapminder_2007, tmp_path, mocker
+    ):
+        mocker.patch("vizro.actions._export_utils.EXPORT_DIR", tmp_path)
+        mocker.patch("vizro.actions._export_utils.EXPORT_CHUNK_SIZE", 50)
+        write_data_frame = mocker.spy(vizro.actions._export_utils, "_write_data_frame")
+        model_manager["button"].actions = [
+            vm.Action(
+                id="test_action",
+                function=export_data(targets=["scatter_chart"], file_format=file_format, streaming=True),
+            )
+        ]
+
+        result = model_manager["test_action"].function()
+        _, _, export_file, filename = result["download_dataframe_scatter_chart"].split("/")
+
+        assert filename == f"scatter_chart.{file_format}"
+        pd.testing.assert_frame_equal(reader(tmp_path / export_file), gapminder_2007.reset_index(drop=True))
+        # The data is never written as a whole.
+        write_data_frame.assert_not_called()
+
+    @pytest.mark.usefixtures("managers_one_page_two_graphs_one_button")
+    @pytest.mark.parametrize("ctx_export_data", [(["scatter_chart"], None, None, None)], indirect=True)
+    @pytest.mark.parametrize(
+        "file_format, reader",
+        [
+            ("parquet", pd.read_parquet),
+            ("feather", pd.read_feather),
+            ("csv.gz", lambda file: pd.read_csv(file, compression="gzip")),
+        ],
+    )
+    def test_binary_file_formats(self, ctx_export_data, file_format, reader, gapminder_2007):
+        model_manager["button"].actions = [
+            vm.Action(id="test_action", function=export_data(targets=["scatter_chart"], file_format=file_format))
+        ]
+
+        result = model_manager["test_action"].function()["download_dataframe_scatter_chart"]
+        expected = gapminder_2007.reset_index(drop=True)
+
+        assert result["filename"] == f"scatter_chart.{file_format}"
+        assert result["base64"]
+        pd.testing.assert_frame_equal(reader(io.BytesIO(base64.b64decode(result["content"]))), expected)
+
+    @pytest.mark.usefixtures("managers_one_page_two_graphs_one_button")
+    @pytest.mark.parametrize("ctx_export_data", [(["scatter_chart", "box_chart"], None, None, None)], indirect=True)
+    def test_bundle(self, ctx_export_data, gapminder_2007):
+        model_manager["button"].actions = [
+            vm.Action(id="test_action", function=export_data(targets=["scatter_chart", "box_chart"], bundle=True))
+        ]
+
+        result = model_manager["test_action"].function()
+        download = result["download_dataframe_scatter_chart"]
+        zip_file = zipfile.ZipFile(io.BytesIO(base64.b64decode(download["content"])))
+
+        assert result["download_dataframe_box_chart"] is no_update
+        assert download["filename"] == "data.zip"
+        assert zip_file.namelist() == ["scatter_chart.csv", "box_chart.csv"]
+        assert zip_file.read("box_chart.csv").decode() == gapminder_2007.to_csv(index=False)
+
+    @pytest.mark.usefixtures("vizro_app", "managers_one_page_two_graphs_one_button")
+    @pytest.mark.parametrize("ctx_export_data", [(["scatter_chart", "box_chart"], None, None, None)], indirect=True)
+    def test_bundle_streaming(self, ctx_export_data, gapminder_2007, tmp_path, monkeypatch):
+        monkeypatch.setattr("vizro.actions._export_utils.EXPORT_DIR", tmp_path)
+        model_manager["button"].actions = [
+            vm.Action(
+                id="test_action",
+                function=export_data(
+                    targets=["scatter_chart", "box_chart"], file_format="parquet", streaming=True, bundle=True
+                ),
+            )
+        ]
+
+        result = model_manager["test_action"].function()
+        _, _, export_file, filename = result["download_dataframe_scatter_chart"].split("/")
+        zip_file = zipfile.ZipFile(tmp_path / export_file)
+
+        assert result["download_dataframe_box_chart"] is no_update
+        assert filename == "data.zip"
+        assert zip_file.namelist() == ["scatter_chart.parquet", "box_chart.parquet"]
+        pd.testing.assert_frame_equal(
+            pd.read_parquet(io.BytesIO(zip_file.read("scatter_chart.parquet"))), gapminder_2007.reset_index(drop=True)
+        )
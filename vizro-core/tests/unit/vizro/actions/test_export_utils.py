@@ -0,0 +1,78 @@
+import os
+import time
+
+import pandas as pd
+import pytest
+
+from vizro import Vizro
+from vizro.actions._export_utils import _export_to_file
+
+
+@pytest.fixture
+def export_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr("vizro.actions._export_utils.EXPORT_DIR", tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def client(vizro_app):
+    return vizro_app.dash.server.test_client()
+
+
+@pytest.mark.usefixtures("vizro_app")
+class TestExportToFile:
+    @pytest.mark.parametrize("n_rows", [0, 1, 5, 6])
+    def test_csv_in_chunks(self, n_rows, export_dir, monkeypatch):
+        monkeypatch.setattr("vizro.actions._export_utils.EXPORT_CHUNK_SIZE", 2)
+        data_frame = pd.DataFrame({"a": range(n_rows), "b": [f"x{i}" for i in range(n_rows)]})
+
+        url = _export_to_file(data_frame, file_format="csv", filename="data.csv")
+        export_file = url.split("/")[2]
+
+        assert (export_dir / export_file).read_text() == data_frame.to_csv(index=False)
+
+    def test_expired_exports_removed(self, export_dir):
+        expired_file = export_dir / "expired.csv"
+        expired_file.write_text("a\n1\n")
+        os.utime(expired_file, (time.time() - 3600, time.time() - 3600))
+
+        _export_to_file(pd.DataFrame({"a": [1]}), file_format="csv", filename="data.csv")
+
+        assert not expired_file.exists()
+        assert len(list(export_dir.iterdir())) == 1
+
+    def test_configured_export_dir(self, tmp_path):
+        export_dir = tmp_path / "exports"
+        Vizro(export_dir=export_dir)
+
+        url = _export_to_file(pd.DataFrame({"a": [1]}), file_format="csv", filename="data.csv")
+
+        assert (export_dir / url.split("/")[2]).exists()
+        assert export_dir.stat().st_mode & 0o777 == 0o700
+
+    @pytest.mark.skipif(not hasattr(os, "getuid"), reason="File permissions are only checked on POSIX systems.")
+    def test_export_dir_accessible_to_others(self, export_dir):
+        export_dir.chmod(0o755)
+        with pytest.raises(PermissionError, match="must be owned by and only accessible to the user"):
+            _export_to_file(pd.DataFrame({"a": [1]}), file_format="csv", filename="data.csv")
+
+
+class TestServeExport:
+    def test_download(self, export_dir, client):
+        url = _export_to_file(pd.DataFrame({"a": [1, 2]}), file_format="csv", filename="data.csv")
+
+        with client.get(url) as response:
+            assert response.status_code == 200
+            assert response.data == b"a\n1\n2\n"
+            assert response.headers["Content-Disposition"] == "attachment; filename=data.csv"
+
+    @pytest.mark.parametrize("export_file", ["missing.csv", "..", "a b.csv"])
+    def test_invalid_export_file(self, export_file, export_dir, client):
+        assert client.get(f"/vizro-download/{export_file}/data.csv").status_code == 404
+
+    def test_expired_export_file(self, export_dir, client):
+        url = _export_to_file(pd.DataFrame({"a": [1, 2]}), file_format="csv", filename="data.csv")
+        export_file = export_dir / url.split("/")[2]
+        os.utime(export_file, (time.time() - 3600, time.time() - 3600))
+
+        assert client.get(url).status_code == 404
@@ -0,0 +1,95 @@
+"""Unit tests for vizro.managers._data_index."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from vizro.managers._data_index import CategoryIndex, FilterIndex, SortedIndex
+
+
+def test_filter_index_is_abstract():
+    with pytest.raises(TypeError, match="abstract"):
+        FilterIndex(pd.Series([1, 2, 3]))
+
+
+class TestCategoryIndex:
+    @pytest.mark.parametrize(
+        "data, values",
+        [
+            (["a", "b", "a", "c"], ["a"]),
+            (["a", "b", "a", "c"], ["a", "c"]),
+            (["a", "b", "a", "c"], ["d"]),
+            (["a", "b", "a", "c"], []),
+            (["a", None, "a", np.nan], ["a"]),
+            ([1, 2, 2, 3], [2, 3]),
+            ([1.0, 2.0, np.nan, 3.0], [2, 3]),
+            ([True, False, True], [True]),
+            (pd.Categorical(["x", "y", "x"]), ["x"]),
+            ([1, "1", 1.0], ["1"]),
+        ],
+    )
+    def test_isin(self, data, values):
+        series = pd.Series(data)
+        category_index = CategoryIndex(series)
+        np.testing.assert_array_equal(category_index.isin(values), series.isin(values).to_numpy())
+
+    @pytest.mark.parametrize("values, expected", [(["a", "b"], True), (["a", None], False), ([np.nan], False)])
+    def test_can_lookup(self, values, expected):
+        assert CategoryIndex.can_lookup(values) == expected
+
+    @pytest.mark.parametrize(
+        "series, expected",
+        [
+            (pd.Series(["a"]), True),
+            (pd.Series([1.0]), True),
+            (pd.Series(pd.to_datetime(["2020-01-01"])), False),
+            (pd.Series(pd.to_timedelta(["1 day"])), False),
+            (pd.Series(pd.period_range("2020-01", periods=1, freq="M")), False),
+        ],
+    )
+    def test_is_supported(self, series, expected):
+        assert CategoryIndex.is_supported(series) == expected
+
+    def test_is_aligned(self):
+        data_frame = pd.DataFrame({"col1": ["a", "b", "c"]})
+        category_index = CategoryIndex(data_frame["col1"])
+        assert category_index.is_aligned(data_frame)
+        assert category_index.is_aligned(data_frame.copy())
+        assert not category_index.is_aligned(data_frame[data_frame["col1"] != "b"])
+        assert not category_index.is_aligned(pd.DataFrame({"col1": ["a", "b", "c"]}))
+
+
+class TestSortedIndex:
+    @pytest.mark.parametrize(
+        "data, low, high",
+        [
+            ([3, 1, 2, 5, 4], 2, 4),
+            ([3, 1, 2, 5, 4], 2.5, 3.5),
+            ([3, 1, 2, 5, 4], 1, 5),
+            ([3, 1, 2, 5, 4], 4, 2),
+            ([3, 1, 2, 5, 4], 6, 7),
+            ([1.1, np.nan, 2.2, 3.3, np.nan], 1, 3),
+            ([1.1, np.nan, 2.2, 3.3, np.nan], 0, np.inf),
+            ([2, 2, 2, 1, 3], 2, 2),
+            ([], 2, 4),
+        ],
+    )
+    def test_between(self, data, low, high):
+        series = pd.Series(data, dtype=float if not data else None)
+        sorted_index = SortedIndex(series)
+        np.testing.assert_array_equal(
+            sorted_index.between(low, high), series.between(low, high, inclusive="both").to_numpy()
+        )
+
+    @pytest.mark.parametrize(
+        "series, expected",
+        [
+            (pd.Series([1, 2]), True),
+            (pd.Series([1.0, np.nan]), True),
+            (pd.Series([True, False]), False),
+            (pd.Series([1, None], dtype="Int64"), False),
+            (pd.Series(["a"]), False),
+        ],
+    )
+    def test_is_supported(self, series, expected):
+        assert SortedIndex.is_supported(series) == expected
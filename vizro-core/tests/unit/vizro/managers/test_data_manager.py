@@ -1,8 +1,15 @@
 """Unit tests for vizro.managers.data_manager."""
 
+import threading
+import time
+from datetime import timedelta
+from functools import partial
+
+import numpy as np
 import pandas as pd
 import pytest
 
+from vizro.managers._data_index import CategoryIndex, SortedIndex
 from vizro.managers._data_manager import DataManager
 
 
@@ -61,3 +68,445 @@ class TestDataManager:
         self.data_manager[dataset_name] = self.data
         with pytest.raises(KeyError):
             self.data_manager._get_component_data(nonexistent_component)
+
+    def test_get_component_data_returns_copy(self):
+        self.data_manager["test_dataset"] = self.data
+        self.data_manager._add_component("component_id", "test_dataset")
+        data_frame = self.data_manager._get_component_data("component_id")
+        data_frame.loc[0, "col1"] = 100
+        assert self.data_manager._get_component_data("component_id").equals(self.data)
+
+    def test_get_component_dataset(self):
+        self.data_manager["test_dataset"] = self.data
+        self.data_manager._add_component("component_id", "test_dataset")
+        assert self.data_manager._get_component_dataset("component_id") == "test_dataset"
+        with pytest.raises(KeyError, match="Component nonexistent_component does not exist"):
+            self.data_manager._get_component_dataset("nonexistent_component")
+
+    def test_has_registered_data(self):
+        self.data_manager["test_dataset"] = self.data
+        self.data_manager._add_component("component_id", "test_dataset")
+        assert self.data_manager._has_registered_data("component_id")
+        assert not self.data_manager._has_registered_data("nonexistent_component")
+
+
+class TestDataManagerReadOnly:
+    def setup_method(self):
+        self.data_manager = DataManager()
+        self.data_manager.read_only = True
+        self.data = pd.DataFrame({"col1": [1, 2, 3], "col2": [4, 5, 6]})
+        self.data_manager["test_dataset"] = self.data
+        self.data_manager._add_component("component_id", "test_dataset")
+
+    def test_get_component_data_shares_memory(self):
+        data_frame = self.data_manager._get_component_data("component_id")
+        assert data_frame.equals(self.data)
+        assert np.shares_memory(data_frame["col1"].to_numpy(), self.data["col1"].to_numpy())
+
+    def test_inplace_value_modification_raises(self):
+        data_frame = self.data_manager._get_component_data("component_id")
+        with pytest.raises(ValueError, match="read-only"):
+            data_frame.loc[0, "col1"] = 100
+        assert self.data_manager._get_component_data("component_id").equals(self.data)
+
+    def test_original_data_stays_writeable(self):
+        self.data_manager._get_component_data("component_id")
+        self.data.loc[0, "col1"] = 100
+        assert self.data.loc[0, "col1"] == 100
+
+    def test_column_modification_does_not_affect_original(self):
+        data_frame = self.data_manager._get_component_data("component_id")
+        data_frame["col3"] = data_frame["col1"] * 2
+        data_frame.drop(columns="col1", inplace=True)
+        assert self.data_manager._get_component_data("component_id").equals(self.data)
+
+    def test_duplicate_column_names_and_mixed_dtypes(self):
+        data = pd.DataFrame([[1, "a", 1.5], [2, "b", 2.5]], columns=["col1", "col1", "col2"])
+        self.data_manager["test_duplicate_dataset"] = data
+        self.data_manager._add_component("duplicate_component_id", "test_duplicate_dataset")
+        data_frame = self.data_manager._get_component_data("duplicate_component_id")
+        assert data_frame.equals(data)
+        assert list(data_frame.columns) == ["col1", "col1", "col2"]
+        with pytest.raises(ValueError, match="read-only"):
+            data_frame.iloc[0, 2] = 100.0
+
+    def test_copy_on_write(self):
+        with pd.option_context("mode.copy_on_write", True):
+            data_frame = self.data_manager._get_component_data("component_id")
+            assert np.shares_memory(data_frame["col1"].to_numpy(), self.data["col1"].to_numpy())
+            data_frame.loc[0, "col1"] = 100
+            assert data_frame.loc[0, "col1"] == 100
+            assert self.data_manager._get_component_data("component_id").equals(self.data)
+
+    def test_lazy_data(self):
+        self.data_manager["test_lazy_dataset"] = lambda: pd.DataFrame({"col1": [1, 2, 3]})
+        self.data_manager._add_component("lazy_component_id", "test_lazy_dataset")
+        data_frame = self.data_manager._get_component_data("lazy_component_id")
+        with pytest.raises(ValueError, match="read-only"):
+            data_frame.iloc[0, 0] = 100
+
+
+class TestDataManagerRefresh:
+    def setup_method(self):
+        self.data_manager = DataManager()
+        self.load_count = 0
+
+        def lazy_data():
+            self.load_count += 1
+            return pd.DataFrame({"col1": [self.load_count]})
+
+        self.data_manager["test_lazy_dataset"] = lazy_data
+        self.data_manager._add_component("component_id", "test_lazy_dataset")
+
+    def _wait_for_refresh(self, expected_value):
+        for _ in range(100):
+            if self.data_manager._get_component_data("component_id")["col1"][0] == expected_value:
+                return
+            time.sleep(0.01)
+        raise AssertionError("Dataset was not refreshed.")
+
+    def test_no_refresh_by_default(self):
+        self.data_manager._get_component_data("component_id")
+        self.data_manager._get_component_data("component_id")
+        assert self.load_count == 1
+
+    @pytest.mark.parametrize("interval", [0.01, timedelta(seconds=0.01)])
+    def test_refresh_after_interval(self, interval):
+        self.data_manager.set_refresh_interval("test_lazy_dataset", interval)
+        assert self.data_manager._get_component_data("component_id")["col1"][0] == 1
+        time.sleep(0.02)
+        # The expired data is still returned while the refresh happens in the background.
+        assert self.data_manager._get_component_data("component_id")["col1"][0] == 1
+        self._wait_for_refresh(expected_value=2)
+
+    def test_no_refresh_before_interval(self):
+        self.data_manager.set_refresh_interval("test_lazy_dataset", 3600)
+        self.data_manager._get_component_data("component_id")
+        self.data_manager._get_component_data("component_id")
+        assert self.load_count == 1
+
+    def test_failed_refresh_keeps_previous_data(self):
+        def failing_lazy_data():
+            raise RuntimeError("Source unavailable.")
+
+        self.data_manager.set_refresh_interval("test_lazy_dataset", 0.01)
+        self.data_manager._get_component_data("component_id")
+        self.data_manager._DataManager__lazy_data["test_lazy_dataset"] = failing_lazy_data
+        time.sleep(0.02)
+        self.data_manager._get_component_data("component_id")
+        time.sleep(0.05)
+        assert self.data_manager._get_component_data("component_id")["col1"][0] == 1
+
+    def test_refresh_eager_dataset(self):
+        self.data_manager["test_dataset"] = pd.DataFrame({"col1": [1]})
+        with pytest.raises(ValueError, match="cannot be refreshed"):
+            self.data_manager.set_refresh_interval("test_dataset", 10)
+
+    def test_refresh_nonexistent_dataset(self):
+        with pytest.raises(KeyError, match="does not exist"):
+            self.data_manager.set_refresh_interval("nonexistent_dataset", 10)
+
+    def test_refresh_invalid_interval(self):
+        with pytest.raises(ValueError, match="must be positive"):
+            self.data_manager.set_refresh_interval("test_lazy_dataset", 0)
+
+
+class TestDataManagerLoadLazyDatasets:
+    def setup_method(self):
+        self.data_manager = DataManager()
+        self.data = pd.DataFrame({"col1": [1, 2, 3]})
+
+    def test_datasets_loaded_concurrently(self):
+        # Each loader only returns once both are running at the same time.
+        barrier = threading.Barrier(2, timeout=5)
+
+        def load_data():
+            barrier.wait()
+            return self.data
+
+        self.data_manager["test_lazy_dataset_a"] = load_data
+        self.data_manager["test_lazy_dataset_b"] = load_data
+        self.data_manager._add_component("component_id_a", "test_lazy_dataset_a")
+        self.data_manager._add_component("component_id_b", "test_lazy_dataset_b")
+        load_times = self.data_manager._load_lazy_datasets(workers=2)
+        assert list(load_times) == ["test_lazy_dataset_a", "test_lazy_dataset_b"]
+        assert self.data_manager._get_dataset_version("test_lazy_dataset_a") == 1
+        assert self.data_manager._get_dataset_version("test_lazy_dataset_b") == 1
+
+    def test_only_unloaded_datasets_used_by_components_loaded(self):
+        self.data_manager["test_dataset"] = self.data
+        self.data_manager["test_lazy_dataset_loaded"] = lambda: self.data
+        self.data_manager["test_lazy_dataset_unused"] = lambda: self.data
+        self.data_manager["test_lazy_dataset"] = lambda: self.data
+        for dataset_name in ["test_dataset", "test_lazy_dataset_loaded", "test_lazy_dataset"]:
+            self.data_manager._add_component(f"{dataset_name}_component_id", dataset_name)
+        self.data_manager._get_original_data("test_lazy_dataset_loaded")
+        assert list(self.data_manager._load_lazy_datasets(workers=2)) == ["test_lazy_dataset"]
+        assert self.data_manager._get_dataset_version("test_lazy_dataset_unused") == 0
+
+    def test_failed_load_raises(self):
+        def load_data():
+            raise RuntimeError("Failed to load.")
+
+        self.data_manager["test_lazy_dataset"] = load_data
+        self.data_manager._add_component("component_id", "test_lazy_dataset")
+        with pytest.raises(RuntimeError, match="Failed to load."):
+            self.data_manager._load_lazy_datasets(workers=2)
+
+
+class TestDataManagerMemoryBudget:
+    def setup_method(self):
+        self.data_manager = DataManager()
+        self.load_counts = {"a": 0, "b": 0}
+
+        def lazy_data(name):
+            self.load_counts[name] += 1
+            return pd.DataFrame({"col1": range(100)})
+
+        for name in self.load_counts:
+            self.data_manager[f"lazy_dataset_{name}"] = partial(lazy_data, name)
+            self.data_manager._add_component(f"component_id_{name}", f"lazy_dataset_{name}")
+
+        self.data_size = pd.DataFrame({"col1": range(100)}).memory_usage(deep=True).sum()
+
+    def test_no_eviction_without_budget(self):
+        for component_id in ["component_id_a", "component_id_b", "component_id_a"]:
+            self.data_manager._get_component_data(component_id)
+        assert self.load_counts == {"a": 1, "b": 1}
+
+    def test_no_eviction_within_budget(self):
+        self.data_manager.memory_budget = 2 * self.data_size
+        for component_id in ["component_id_a", "component_id_b", "component_id_a"]:
+            self.data_manager._get_component_data(component_id)
+        assert self.load_counts == {"a": 1, "b": 1}
+
+    def test_lazy_data_evicted_and_reloaded(self):
+        self.data_manager.memory_budget = self.data_size
+        for component_id in ["component_id_a", "component_id_b", "component_id_a"]:
+            self.data_manager._get_component_data(component_id)
+        assert self.load_counts == {"a": 2, "b": 1}
+
+    def test_least_recently_used_evicted(self):
+        self.data_manager["lazy_dataset_c"] = lambda: pd.DataFrame({"col1": range(100)})
+        self.data_manager._add_component("component_id_c", "lazy_dataset_c")
+        self.data_manager.memory_budget = 2 * self.data_size
+        for component_id in ["component_id_a", "component_id_b", "component_id_a", "component_id_c"]:
+            self.data_manager._get_component_data(component_id)
+        self.data_manager._get_component_data("component_id_a")
+        self.data_manager._get_component_data("component_id_b")
+        assert self.load_counts == {"a": 1, "b": 2}
+
+    def test_dataframe_spilled_to_disk(self):
+        data = pd.DataFrame({"col1": range(100), "col2": ["a"] * 100}, index=range(100, 200))
+        self.data_manager["dataset"] = data
+        self.data_manager._add_component("component_id", "dataset")
+        self.data_manager.memory_budget = self.data_size
+        self.data_manager._get_component_data("component_id_a")
+        assert "dataset" in self.data_manager._DataManager__lazy_data
+        pd.testing.assert_frame_equal(self.data_manager._get_component_data("component_id"), data)
+
+    def test_dataframe_spilled_without_holding_lock(self, mocker):
+        self.data_manager["dataset"] = pd.DataFrame({"col1": range(100)})
+        self.data_manager._add_component("component_id", "dataset")
+        self.data_manager.memory_budget = self.data_size
+        cache_lock = self.data_manager._DataManager__cache_lock
+        lock_held = []
+        mocker.patch.object(pd.DataFrame, "to_parquet", side_effect=lambda path: lock_held.append(cache_lock.locked()))
+        self.data_manager._get_component_data("component_id_a")
+        assert lock_held == [False]
+        assert "dataset" in self.data_manager._DataManager__lazy_data
+
+    def test_dataframe_that_cannot_be_spilled_kept_in_memory(self, caplog):
+        data = pd.DataFrame({"col1": [1, "a"] * 50})
+        self.data_manager["dataset"] = data
+        self.data_manager._add_component("component_id", "dataset")
+        self.data_manager.memory_budget = self.data_size
+        for component_id in ["component_id_a", "component_id_b"]:
+            pd.testing.assert_frame_equal(
+                self.data_manager._get_component_data(component_id), pd.DataFrame({"col1": range(100)})
+            )
+        assert "dataset" not in self.data_manager._DataManager__lazy_data
+        pd.testing.assert_frame_equal(self.data_manager._get_component_data("component_id"), data)
+        assert caplog.text.count("Dataset dataset cannot be spilled to disk and is kept in memory") == 1
+
+
+class TestDataManagerDataFiles:
+    def setup_method(self):
+        self.data_manager = DataManager()
+        self.data = pd.DataFrame({"col1": [1, 2, 3], "col2": [4.0, 5.0, 6.0], "col3": ["a", "b", "c"]})
+
+    @pytest.mark.parametrize("suffix", [".arrow", ".feather"])
+    def test_arrow_file(self, tmp_path, suffix):
+        path = tmp_path / f"data{suffix}"
+        self.data.to_feather(path, compression="uncompressed")
+        self.data_manager["dataset"] = path
+        self.data_manager._add_component("component_id", "dataset")
+        pd.testing.assert_frame_equal(self.data_manager._get_component_data("component_id"), self.data)
+
+    def test_arrow_file_memory_mapped(self, tmp_path):
+        path = tmp_path / "data.arrow"
+        self.data.to_feather(path, compression="uncompressed")
+        self.data_manager.read_only = True
+        self.data_manager["dataset"] = path
+        self.data_manager._add_component("component_id", "dataset")
+        data_frame = self.data_manager._get_component_data("component_id")
+        pd.testing.assert_frame_equal(data_frame, self.data)
+        # Columns point directly into the memory-mapped file rather than to memory owned by pandas.
+        assert not data_frame["col1"].to_numpy().flags.owndata
+        with pytest.raises(ValueError, match="read-only"):
+            data_frame.loc[0, "col1"] = 100
+
+    def test_parquet_file(self, tmp_path):
+        path = tmp_path / "data.parquet"
+        self.data.to_parquet(path)
+        self.data_manager["dataset"] = path
+        self.data_manager._add_component("component_id", "dataset")
+        pd.testing.assert_frame_equal(self.data_manager._get_component_data("component_id"), self.data)
+
+    def test_invalid_file_suffix(self, tmp_path):
+        with pytest.raises(ValueError, match="must be a file with one of the suffixes"):
+            self.data_manager["dataset"] = tmp_path / "data.csv"
+
+
+class TestDataManagerFilterIndex:
+    def setup_method(self):
+        self.data_manager = DataManager()
+        self.data = pd.DataFrame({"col1": ["a", "b", "a"], "col2": pd.to_datetime(["2020", "2021", "2022"])})
+        self.data_manager["test_dataset"] = self.data
+        self.data_manager._add_component("component_id_a", "test_dataset")
+        self.data_manager._add_component("component_id_b", "test_dataset")
+
+    def test_no_filter_index_by_default(self):
+        assert self.data_manager._get_filter_index("component_id_a", "col1", CategoryIndex) is None
+
+    def test_add_filter_index(self):
+        self.data_manager._add_filter_index("component_id_a", "col1", CategoryIndex)
+        category_index = self.data_manager._get_filter_index("component_id_a", "col1", CategoryIndex)
+        assert category_index.is_aligned(self.data_manager._get_component_data("component_id_a"))
+        np.testing.assert_array_equal(category_index.isin(["a"]), [True, False, True])
+        # The index is shared between components that use the same dataset.
+        assert self.data_manager._get_filter_index("component_id_b", "col1", CategoryIndex) is category_index
+        assert self.data_manager._get_filter_index("component_id_a", "col1", SortedIndex) is None
+
+    def test_add_filter_index_unsupported_column(self):
+        self.data_manager._add_filter_index("component_id_a", "col2", CategoryIndex)
+        assert self.data_manager._get_filter_index("component_id_a", "col2", CategoryIndex) is None
+
+    def test_filter_index_rebuilt_after_refresh(self):
+        self.data_manager["test_lazy_dataset"] = lambda: pd.DataFrame({"col1": ["a", "b", "a"]})
+        self.data_manager._add_component("lazy_component_id", "test_lazy_dataset")
+        self.data_manager._add_filter_index("lazy_component_id", "col1", CategoryIndex)
+        category_index = self.data_manager._get_filter_index("lazy_component_id", "col1", CategoryIndex)
+        self.data_manager._load_lazy_data("test_lazy_dataset")
+        new_category_index = self.data_manager._get_filter_index("lazy_component_id", "col1", CategoryIndex)
+        assert new_category_index is not category_index
+        assert new_category_index.is_aligned(self.data_manager._get_component_data("lazy_component_id"))
+
+    def test_filter_index_rebuilt_once_by_concurrent_callbacks(self, mocker):
+        self.data_manager["test_lazy_dataset"] = lambda: pd.DataFrame({"col1": ["a", "b", "a"]})
+        self.data_manager._add_component("lazy_component_id", "test_lazy_dataset")
+        self.data_manager._add_filter_index("lazy_component_id", "col1", CategoryIndex)
+        self.data_manager._load_lazy_data("test_lazy_dataset")
+        category_index_init = CategoryIndex.__init__
+
+        def slow_category_index_init(category_index, series):
+            time.sleep(0.05)
+            category_index_init(category_index, series)
+
+        init_spy = mocker.patch.object(CategoryIndex, "__init__", autospec=True, side_effect=slow_category_index_init)
+        barrier = threading.Barrier(4)
+        category_indexes = []
+
+        def get_filter_index():
+            barrier.wait()
+            category_indexes.append(self.data_manager._get_filter_index("lazy_component_id", "col1", CategoryIndex))
+
+        threads = [threading.Thread(target=get_filter_index) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert init_spy.call_count == 1
+        assert all(category_index is category_indexes[0] for category_index in category_indexes)
+
+
+class TestDataManagerMetadata:
+    def setup_method(self):
+        self.data_manager = DataManager()
+        self.data = pd.DataFrame({"col1": [3, 1, 2, 1], "col2": ["b", "a", "c", "a"], "col3": [0.5, np.nan, 1.5, 1.0]})
+        self.data_manager["test_dataset"] = self.data
+        self.data_manager._add_component("component_id_a", "test_dataset")
+        self.data_manager._add_component("component_id_b", "test_dataset")
+
+    def test_columns_and_dtypes(self):
+        assert self.data_manager._get_component_columns("component_id_a") == ["col1", "col2", "col3"]
+        assert self.data_manager._get_component_dtype("component_id_a", "col1") == np.dtype("int64")
+        assert self.data_manager._get_component_dtype("component_id_a", "col2") == np.dtype("object")
+
+    @pytest.mark.parametrize("column, expected", [("col1", (1, 3)), ("col2", ("a", "c")), ("col3", (0.5, 1.5))])
+    def test_min_max(self, column, expected):
+        assert self.data_manager._get_component_min_max("component_id_a", column) == expected
+
+    def test_unique_values(self):
+        assert self.data_manager._get_component_unique_values("component_id_a", "col1") == [1, 2, 3]
+        assert self.data_manager._get_component_unique_values("component_id_a", "col2") == ["a", "b", "c"]
+        metadata = self.data_manager._get_dataset_metadata("test_dataset")
+        assert metadata.get_cardinality("col2", lambda: self.data) == 3
+
+    def test_metadata_shared_between_components(self):
+        self.data_manager._get_component_unique_values("component_id_a", "col2")
+        metadata = self.data_manager._get_dataset_metadata("test_dataset")
+        # Statistics already computed are not computed from the data again.
+        assert metadata.get_unique_values("col2", lambda: pytest.fail("Data was used again.")) == ["a", "b", "c"]
+        assert metadata.get_min_max("col1", lambda: pytest.fail("Data was used again.")) == (1, 3)
+
+    def test_metadata_computed_again_after_refresh(self):
+        self.data_manager["test_lazy_dataset"] = lambda: pd.DataFrame({"col1": [1, 2, 3]})
+        self.data_manager._add_component("lazy_component_id", "test_lazy_dataset")
+        metadata = self.data_manager._get_dataset_metadata("test_lazy_dataset")
+        assert self.data_manager._get_dataset_metadata("test_lazy_dataset") is metadata
+        self.data_manager._load_lazy_data("test_lazy_dataset")
+        assert self.data_manager._get_dataset_metadata("test_lazy_dataset") is not metadata
+
+
+class TestDataManagerFilteredDataCache:
+    def setup_method(self):
+        self.data_manager = DataManager()
+        self.data_manager["test_lazy_dataset"] = lambda: pd.DataFrame({"col1": [1, 2, 3]})
+        self.data = pd.DataFrame({"col1": [1, 2, 3]})
+        self.size = int(self.data.memory_usage(deep=True).sum())
+        self.data_manager.filtered_data_cache_size = 2 * self.size
+
+    def test_no_cache_by_default(self):
+        self.data_manager.filtered_data_cache_size = None
+        self.data_manager._cache_filtered_data("key", "test_lazy_dataset", self.data)
+        assert self.data_manager._get_cached_filtered_data("key") is None
+
+    def test_cached_filtered_data_cannot_be_modified(self):
+        self.data_manager._cache_filtered_data("key", "test_lazy_dataset", self.data)
+        cached_data = self.data_manager._get_cached_filtered_data("key")
+        pd.testing.assert_frame_equal(cached_data, self.data)
+        cached_data.loc[0, "col1"] = 100
+        assert self.data_manager._get_cached_filtered_data("key")["col1"].tolist() == [1, 2, 3]
+
+    def test_least_recently_used_evicted(self):
+        self.data_manager._cache_filtered_data("key_1", "test_lazy_dataset", self.data)
+        self.data_manager._cache_filtered_data("key_2", "test_lazy_dataset", self.data)
+        self.data_manager._get_cached_filtered_data("key_1")
+        self.data_manager._cache_filtered_data("key_3", "test_lazy_dataset", self.data)
+        assert self.data_manager._get_cached_filtered_data("key_1") is not None
+        assert self.data_manager._get_cached_filtered_data("key_2") is None
+        assert self.data_manager._get_cached_filtered_data("key_3") is not None
+
+    def test_data_larger_than_cache_not_cached(self):
+        self.data_manager.filtered_data_cache_size = self.size - 1
+        self.data_manager._cache_filtered_data("key", "test_lazy_dataset", self.data)
+        assert self.data_manager._get_cached_filtered_data("key") is None
+
+    def test_dataset_loaded_again(self):
+        self.data_manager._load_lazy_data("test_lazy_dataset")
+        version = self.data_manager._get_dataset_version("test_lazy_dataset")
+        self.data_manager._cache_filtered_data("key", "test_lazy_dataset", self.data)
+        self.data_manager._load_lazy_data("test_lazy_dataset")
+        assert self.data_manager._get_dataset_version("test_lazy_dataset") == version + 1
+        assert self.data_manager._get_cached_filtered_data("key") is None
@@ -0,0 +1,60 @@
+import numpy as np
+import plotly.graph_objects as go
+import pytest
+from dash import html
+
+from vizro.managers._figure_cache import FigureCache, _get_figure_size
+
+
+class TestFigureCache:
+    def test_invalid_maxsize(self):
+        with pytest.raises(ValueError, match="Figure cache size must be positive."):
+            FigureCache(maxsize=0)
+
+    def test_get_set(self):
+        figure_cache = FigureCache(maxsize=16)
+        assert figure_cache.get("key") is None
+        figure_cache.set("key", "figure")
+        assert figure_cache.get("key") == "figure"
+        assert (figure_cache.hits, figure_cache.misses) == (1, 1)
+        assert figure_cache.total_size == len("figure")
+
+    def test_least_recently_used_evicted(self):
+        # Each figure is estimated to use 8 bytes, so two of them fit in the cache.
+        figure_cache = FigureCache(maxsize=16)
+        figure_cache.set("key_1", "figure_1")
+        figure_cache.set("key_2", "figure_2")
+        figure_cache.get("key_1")
+        figure_cache.set("key_3", "figure_3")
+        assert len(figure_cache) == 2
+        assert figure_cache.total_size == 16
+        assert figure_cache.get("key_1") == "figure_1"
+        assert figure_cache.get("key_2") is None
+
+    def test_figure_larger_than_cache_not_cached(self):
+        figure_cache = FigureCache(maxsize=16)
+        figure_cache.set("key", np.zeros(3))
+        assert figure_cache.get("key") is None
+        assert figure_cache.total_size == 0
+
+    def test_clear(self):
+        figure_cache = FigureCache(maxsize=16)
+        figure_cache.set("key", "figure")
+        figure_cache.get("key")
+        figure_cache.clear()
+        assert len(figure_cache) == 0
+        assert figure_cache.total_size == 0
+        assert (figure_cache.hits, figure_cache.misses) == (0, 0)
+
+
+class TestGetFigureSize:
+    def test_array(self):
+        assert _get_figure_size(np.zeros(1000)) == 8000
+
+    def test_plotly_figure_grows_with_data(self):
+        small_figure = go.Figure(go.Scatter(x=np.arange(10), y=np.arange(10)))
+        large_figure = go.Figure(go.Scatter(x=np.arange(10_000), y=np.arange(10_000)))
+        assert _get_figure_size(large_figure) - _get_figure_size(small_figure) == 2 * 8 * (10_000 - 10)
+
+    def test_dash_component(self):
+        assert _get_figure_size(html.Div([html.P("a" * 1000)])) > 1000
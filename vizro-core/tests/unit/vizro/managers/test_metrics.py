@@ -0,0 +1,110 @@
+import pytest
+
+import vizro.models as vm
+from vizro import Vizro
+from vizro.managers._metrics import Metrics, _get_metrics, _time_action, _time_stage
+from vizro.models.types import capture
+
+
+@pytest.fixture
+def metrics_app():
+    return Vizro(metrics=True)
+
+
+class TestMetrics:
+    def test_render(self):
+        metrics = Metrics(buckets=[0.1, 1])
+        metrics.observe("filter", 0.05, page="page", action="action", target="target")
+        metrics.observe("filter", 0.5, page="page", action="action", target="target")
+        metrics.observe("filter", 5, page="page", action="action", target="target")
+        labels = 'stage="filter",page="page",action="action",target="target"'
+        assert metrics.render().splitlines() == [
+            "# HELP vizro_action_stage_duration_seconds Time spent in each stage of Vizro actions.",
+            "# TYPE vizro_action_stage_duration_seconds histogram",
+            f'vizro_action_stage_duration_seconds_bucket{{{labels},le="0.1"}} 1',
+            f'vizro_action_stage_duration_seconds_bucket{{{labels},le="1.0"}} 2',
+            f'vizro_action_stage_duration_seconds_bucket{{{labels},le="+Inf"}} 3',
+            f"vizro_action_stage_duration_seconds_sum{{{labels}}} 5.55",
+            f"vizro_action_stage_duration_seconds_count{{{labels}}} 3",
+        ]
+
+    def test_render_escapes_label_values(self):
+        metrics = Metrics(buckets=[])
+        metrics.observe("filter", 1, target='a"b\\c\nd')
+        assert 'target="a\\"b\\\\c\\nd"' in metrics.render()
+
+    def test_clear(self):
+        metrics = Metrics()
+        metrics.observe("filter", 1)
+        metrics.clear()
+        assert "vizro_action_stage_duration_seconds_count" not in metrics.render()
+
+
+class TestTimers:
+    def test_disabled_without_metrics(self):
+        with Vizro().dash.server.app_context():
+            assert _get_metrics() is None
+            with _time_stage("filter"):
+                pass
+
+    def test_stages_labelled_by_action(self, metrics_app):
+        @capture("action")
+        def action_function():
+            pass
+
+        vm.Page(
+            id="test_page",
+            title="Test page",
+            components=[vm.Button(actions=[vm.Action(id="test_action", function=action_function())])],
+        )
+        with metrics_app.dash.server.test_request_context():
+            with _time_action("test_action"):
+                with _time_stage("filter", target="target"):
+                    pass
+            rendered = _get_metrics().render()
+
+        assert 'stage="filter",page="test_page",action="test_action",target="target",le="+Inf"} 1' in rendered
+        assert 'stage="action",page="test_page",action="test_action",target="",le="+Inf"} 1' in rendered
+
+
+class TestMetricsRoute:
+    def test_metrics_route(self, metrics_app):
+        metrics_app.dash.server.extensions["vizro_metrics"].observe("filter", 1)
+        response = metrics_app.dash.server.test_client().get("/vizro-metrics")
+        assert response.status_code == 200
+        assert response.content_type == "text/plain; version=0.0.4; charset=utf-8"
+        assert (
+            'vizro_action_stage_duration_seconds_count{stage="filter",page="",action="",target=""} 1' in response.text
+        )
+
+    def test_figure_cache_metrics(self):
+        app = Vizro(metrics=True, figure_cache_size=1024)
+        figure_cache = app.dash.server.extensions["vizro_figure_cache"]
+        figure_cache.set("key", "figure")
+        figure_cache.get("key")
+        figure_cache.get("other_key")
+        response = app.dash.server.test_client().get("/vizro-metrics")
+        assert "# TYPE vizro_figure_cache_hits_total counter\nvizro_figure_cache_hits_total 1\n" in response.text
+        assert "vizro_figure_cache_misses_total 1\n" in response.text
+        assert "vizro_figure_cache_size_bytes 6\n" in response.text
+
+    def test_no_figure_cache_metrics_by_default(self, metrics_app):
+        response = metrics_app.dash.server.test_client().get("/vizro-metrics")
+        assert "vizro_figure_cache" not in response.text
+
+    def test_no_metrics_route_by_default(self):
+        # Dash serves its index page for any route it does not know.
+        response = Vizro().dash.server.test_client().get("/vizro-metrics")
+        assert "vizro_action_stage_duration_seconds" not in response.text
+
+    def test_serialisation_timed(self, metrics_app):
+        server = metrics_app.dash.server
+
+        @server.route("/test_action")
+        def run_action():
+            with _time_action("test_action"):
+                pass
+            return "done"
+
+        server.test_client().get("/test_action")
+        assert 'stage="serialisation",page="",action="test_action"' in server.extensions["vizro_metrics"].render()
@@ -0,0 +1,63 @@
+"""Unit tests for vizro.managers.model_manager."""
+
+import pytest
+
+import vizro.models as vm
+from vizro.actions import export_data
+from vizro.managers import model_manager
+from vizro.tables import dash_data_table
+
+
+@pytest.fixture
+def page(gapminder):
+    return vm.Page(
+        id="test_page",
+        title="Test page",
+        components=[
+            vm.Button(id="button", actions=[vm.Action(id="button_action", function=export_data())]),
+            vm.Table(id="table", figure=dash_data_table(id="underlying_table_id", data_frame=gapminder)),
+        ],
+        controls=[vm.Filter(id="filter", column="continent")],
+    )
+
+
+class TestItemsWithType:
+    def test_items_with_type(self, page):
+        assert list(model_manager._items_with_type(vm.Page)) == [("test_page", page)]
+        assert [model_id for model_id, _ in model_manager._items_with_type(vm.Button)] == ["button"]
+
+    def test_items_with_subclass(self, page):
+        class CustomButton(vm.Button):
+            pass
+
+        custom_button = CustomButton(id="custom_button")
+        assert list(model_manager._items_with_type(CustomButton)) == [("custom_button", custom_button)]
+        assert [model_id for model_id, _ in model_manager._items_with_type(vm.Button)] == ["button", "custom_button"]
+
+
+class TestRelations:
+    def test_get_model_page(self, page):
+        assert model_manager._get_model_page("test_page") is page
+        assert model_manager._get_model_page("button") is page
+        assert model_manager._get_model_page("filter") is page
+        assert model_manager._get_model_page("nonexistent") is None
+
+    def test_get_action_model_and_page(self, page):
+        assert model_manager._get_action_model("button_action") is page.components[0]
+        assert model_manager._get_action_page("button_action") is page
+        assert model_manager._get_action_model("nonexistent") is None
+        assert model_manager._get_action_page("nonexistent") is None
+
+    def test_relations_found_again_after_model_added(self, page):
+        model_manager._get_relations()
+        page.components[0].actions = [vm.Action(id="new_action", function=export_data())]
+        assert model_manager._get_action_model("new_action") is page.components[0]
+
+    @pytest.mark.usefixtures("vizro_app")
+    def test_get_callable_object_model(self, page):
+        table = page.components[1]
+        table.actions = [vm.Action(function=export_data())]
+        # The ID of the underlying callable object is only known once the table has been pre-built.
+        table.pre_build()
+        assert model_manager._get_callable_object_model("underlying_table_id") is table
+        assert model_manager._get_callable_object_model("nonexistent") is None
@@ -1,12 +1,14 @@
 """Unit tests for vizro.models.Action."""
 
 import json
+import re
 import sys
 
+import dash
 import pandas as pd
 import plotly
 import pytest
-from dash import Output, State, html
+from dash import Input, Output, State, html
 
 try:
     from pydantic.v1 import ValidationError
@@ -31,6 +33,16 @@ def custom_action_function_mock_return(request):
     return _custom_action_function_mock_return
 
 
+@pytest.fixture
+def progress_action_function():
+    @capture("action")
+    def _progress_action_function(set_progress, arg=None):
+        set_progress(arg)
+        return arg
+
+    return _progress_action_function
+
+
 @pytest.fixture
 def custom_action_build_expected():
     return html.Div(
@@ -113,7 +125,7 @@ class TestActionInstantiation:
         with pytest.raises(ValidationError, match="string does not match regex"):
             Action(function=identity_action_function(), inputs=[], outputs=outputs)
 
-    @pytest.mark.parametrize("file_format", [None, "csv", "xlsx"])
+    @pytest.mark.parametrize("file_format", [None, "csv", "xlsx", "parquet", "feather", "csv.gz"])
     def test_export_data_file_format_valid(self, file_format):
         action = Action(id="action_test", function=export_data(file_format=file_format))
         assert action.id == "action_test"
@@ -122,10 +134,18 @@ class TestActionInstantiation:
 
     def test_export_data_file_format_invalid(self):
         with pytest.raises(
-            ValueError, match='Unknown "file_format": invalid_file_format.' ' Known file formats: "csv", "xlsx".'
+            ValueError,
+            match=re.escape(
+                'Unknown "file_format": invalid_file_format.'
+                ' Known file formats: "csv", "xlsx", "parquet", "feather", "csv.gz", "csv.zst".'
+            ),
         ):
             Action(function=export_data(file_format="invalid_file_format"))
 
+    def test_export_data_streaming_xlsx_invalid(self):
+        with pytest.raises(ValueError, match='"streaming" cannot be used with "file_format": xlsx'):
+            Action(function=export_data(file_format="xlsx", streaming=True))
+
     def test_export_data_xlsx_without_required_libs_installed(self, monkeypatch):
         monkeypatch.setitem(sys.modules, "openpyxl", None)
         monkeypatch.setitem(sys.modules, "xlswriter", None)
@@ -135,6 +155,45 @@ class TestActionInstantiation:
         ):
             Action(function=export_data(file_format="xlsx"))
 
+    @pytest.mark.parametrize(
+        "file_format, required_libs, message",
+        [
+            ("parquet", ["pyarrow", "fastparquet"], "You must install either pyarrow or fastparquet"),
+            ("feather", ["pyarrow"], "You must install pyarrow"),
+            ("csv.zst", ["zstandard"], "You must install zstandard"),
+        ],
+    )
+    def test_export_data_without_required_libs_installed(self, file_format, required_libs, message, monkeypatch):
+        for required_lib in required_libs:
+            monkeypatch.setitem(sys.modules, required_lib, None)
+
+        with pytest.raises(ModuleNotFoundError, match=f"{message} to export to {file_format} format."):
+            Action(function=export_data(file_format=file_format))
+
+    def test_background_valid(self, progress_action_function):
+        action = Action(
+            function=progress_action_function(),
+            background=True,
+            progress="progress_text.children",
+            cancel=["cancel_button.n_clicks"],
+        )
+        assert action.background is True
+        assert action.progress == "progress_text.children"
+        assert action.cancel == ["cancel_button.n_clicks"]
+
+    @pytest.mark.parametrize(
+        "field, value", [("progress", "progress_text.children"), ("cancel", ["cancel_button.n_clicks"])]
+    )
+    def test_background_fields_without_background(self, field, value, progress_action_function):
+        with pytest.raises(ValidationError, match=f"`{field}` can only be set when `background` is True."):
+            Action(function=progress_action_function(), **{field: value})
+
+    def test_progress_without_set_progress_argument(self, identity_action_function):
+        with pytest.raises(
+            ValidationError, match="Action function must have `set_progress` as its first argument to report progress."
+        ):
+            Action(function=identity_action_function(), background=True, progress="progress_text.children")
+
 
 @pytest.fixture
 def managers_one_page_without_graphs_one_button():
@@ -168,6 +227,54 @@ class TestActionBuild:
         expected = json.loads(json.dumps(predefined_action_build_expected, cls=plotly.utils.PlotlyJSONEncoder))
         assert result == expected
 
+    @pytest.mark.usefixtures("vizro_app")
+    def test_background_action_build(self, progress_action_function):
+        action = Action(
+            id="action_test",
+            function=progress_action_function(),
+            background=True,
+            progress="progress_text.children",
+            cancel=["cancel_button.n_clicks"],
+        )
+        action.build()
+        callback_spec = dash._callback.GLOBAL_CALLBACK_LIST[-1]
+        callback = dash._callback.GLOBAL_CALLBACK_MAP[callback_spec["output"]]
+
+        assert callback["long"]["progress"] == [Output("progress_text", "children")]
+        assert callback["long"]["cancel_inputs"] == [Input("cancel_button", "n_clicks")]
+        assert State({"type": "action_trigger", "action_name": "action_test"}, "id").to_dict() in callback_spec["state"]
+
+    def test_background_action_metrics(self, identity_action_function):
+        app = Vizro(metrics=True)
+        vm.Page(
+            id="test_page",
+            title="Test page",
+            components=[
+                vm.Button(actions=[vm.Action(id="action_test", function=identity_action_function(), background=True)])
+            ],
+        )
+        model_manager["action_test"].build()
+        callback_spec = dash._callback.GLOBAL_CALLBACK_LIST[-1]
+        background_callback = dash._callback.GLOBAL_CALLBACK_MAP[callback_spec["output"]]["callback"].__wrapped__
+
+        # A background job runs in a worker without a Flask app context.
+        background_callback(external=[], internal={"trigger": None, "action_id": None})
+
+        rendered = app.dash.server.extensions["vizro_metrics"].render()
+        assert 'stage="action",page="test_page",action="action_test",target="",le="+Inf"} 1' in rendered
+
+    def test_background_action_without_manager(self, progress_action_function):
+        dashboard = vm.Dashboard(
+            pages=[
+                vm.Page(
+                    title="Test page",
+                    components=[vm.Button(actions=[vm.Action(function=progress_action_function(), background=True)])],
+                )
+            ]
+        )
+        with pytest.raises(ValueError, match="Actions with `background=True` require a background callback manager"):
+            Vizro().build(dashboard)
+
 
 class TestActionPrivateMethods:
     """Test action private methods."""
@@ -212,6 +319,16 @@ class TestActionPrivateMethods:
         action = Action(function=identity_action_function())
         assert action._action_callback_function(inputs=inputs, outputs=Output("component", "property")) == "value"
 
+    @pytest.mark.parametrize("inputs", [["value"], {"arg": "value"}])
+    def test_action_callback_function_set_progress(self, progress_action_function, inputs):
+        progress = []
+        action = Action(function=progress_action_function(), background=True, progress="progress_text.children")
+        result = action._action_callback_function(
+            inputs=inputs, outputs=Output("component", "property"), set_progress=progress.append
+        )
+        assert result == "value"
+        assert progress == ["value"]
+
     @pytest.mark.parametrize(
         "custom_action_function_mock_return, callback_outputs",
         [
@@ -2,6 +2,8 @@
 
 import json
 
+import numpy as np
+import pandas as pd
 import plotly
 import plotly.graph_objects as go
 import pytest
@@ -19,6 +21,7 @@ import vizro.plotly.express as px
 from vizro.actions._actions_utils import CallbackTriggerDict
 from vizro.managers import data_manager
 from vizro.models._action._action import Action
+from vizro.models._components.graph import _thin_data_frame
 
 
 @pytest.fixture
@@ -134,6 +137,70 @@ class TestDunderMethodsGraph:
         assert actions_chain.trigger.component_property == "clickData"
 
 
+class TestGraphMaxPoints:
+    def test_invalid_max_points(self, standard_px_chart):
+        with pytest.raises(ValidationError, match="ensure this value is greater than 0"):
+            vm.Graph(figure=standard_px_chart, max_points=0)
+
+    @pytest.mark.parametrize("chart", [px.histogram, px.bar, px.box])
+    def test_max_points_aggregating_chart(self, gapminder, chart):
+        with pytest.raises(
+            ValidationError, match="`max_points` can only be set for charts that draw one point per row"
+        ):
+            vm.Graph(figure=chart(data_frame=gapminder, x="continent", y="lifeExp"), max_points=100)
+
+    def test_max_points_line(self, gapminder):
+        graph = vm.Graph(figure=px.line(data_frame=gapminder, x="year", y="lifeExp"), max_points=100)
+        fig = graph.__call__()
+        assert 0 < len(fig.data[0].x) <= 100
+
+    def test_max_points(self, gapminder):
+        graph = vm.Graph(figure=px.scatter(data_frame=gapminder, x="gdpPercap", y="lifeExp"), max_points=100)
+        fig = graph.__call__()
+        assert 0 < len(fig.data[0].x) <= 100
+
+    def test_max_points_not_exceeded(self, gapminder):
+        graph = vm.Graph(figure=px.scatter(data_frame=gapminder, x="gdpPercap", y="lifeExp"), max_points=10**6)
+        fig = graph.__call__()
+        assert len(fig.data[0].x) == len(gapminder)
+
+    def test_max_points_line_traces_thinned_separately(self, gapminder):
+        graph = vm.Graph(figure=px.line(data_frame=gapminder, x="year", y="lifeExp", color="continent"), max_points=100)
+        fig = graph.__call__()
+        for trace in fig.data:
+            n_rows = (gapminder["continent"] == trace.name).sum()
+            assert 0 < len(trace.x) <= max(1, 100 * n_rows // len(gapminder))
+
+
+class TestThinDataFrame:
+    def test_grid_keeps_outliers(self):
+        data_frame = pd.DataFrame({"x": np.r_[np.zeros(1000), 100.0], "y": np.r_[np.zeros(1000), 100.0]})
+        result = _thin_data_frame(data_frame, max_points=4, x="x", y="y")
+        assert result.index.tolist() == [0, 1000]
+
+    def test_grid_drops_missing_values(self):
+        data_frame = pd.DataFrame({"x": [np.nan, 0.0, 1.0, 1.0, 1.0], "y": [0.0, 0.0, 1.0, 1.0, 1.0]})
+        result = _thin_data_frame(data_frame, max_points=4, x="x", y="y")
+        assert result.index.tolist() == [1, 2]
+
+    def test_grid_datetime_column(self):
+        data_frame = pd.DataFrame({"x": pd.date_range("2020", periods=100, freq="D"), "y": np.arange(100)})
+        result = _thin_data_frame(data_frame, max_points=25, x="x", y="y")
+        assert 0 < len(result) <= 25
+        assert result.index.is_monotonic_increasing
+
+    def test_groups_thinned_separately(self):
+        data_frame = pd.DataFrame({"group": ["a"] * 90 + ["b"] * 10, "x": range(100), "y": range(100)})
+        result = _thin_data_frame(data_frame, max_points=10, x="category", y="y", groups=["group", None, "group"])
+        assert result.index.tolist() == [*np.linspace(0, 89, 9).astype(int), 90]
+
+    @pytest.mark.parametrize("x, y", [("category", "y"), (None, "y"), (["x", "y"], None)])
+    def test_evenly_spaced_rows(self, x, y):
+        data_frame = pd.DataFrame({"category": ["a"] * 101, "x": range(101), "y": range(101)})
+        result = _thin_data_frame(data_frame, max_points=11, x=x, y=y)
+        assert result.index.tolist() == list(range(0, 101, 10))
+
+
 class TestProcessFigureDataFrame:
     def test_process_figure_data_frame_str_df(self, standard_px_chart_with_str_dataframe, gapminder):
         data_manager["gapminder"] = gapminder
@@ -2,6 +2,8 @@
 
 import json
 
+import numpy as np
+import pandas as pd
 import plotly
 import pytest
 from dash import dash_table, dcc, html
@@ -12,10 +14,13 @@ except ImportError:  # pragma: no cov
     from pydantic import ValidationError
 
 import vizro.models as vm
+import vizro.models._components.table
 import vizro.plotly.express as px
 from vizro.actions import filter_interaction
 from vizro.managers import data_manager
 from vizro.models._action._action import Action
+from vizro.models._components.table import _apply_filter_query, _apply_sort_by, _to_columnar_data
+from vizro.models.types import capture
 from vizro.tables import dash_data_table
 
 
@@ -195,3 +200,198 @@ class TestBuildTable:
         result = json.loads(json.dumps(table.build(), cls=plotly.utils.PlotlyJSONEncoder))
         expected = json.loads(json.dumps(expected_table_with_id, cls=plotly.utils.PlotlyJSONEncoder))
         assert result == expected
+
+
+class TestTablePaging:
+    @pytest.fixture
+    def paged_table(self):
+        data_frame = pd.DataFrame({"country": ["c", "a", "b", "d", "e"], "pop": [3, 1, 2, 4, 5]})
+        table = vm.Table(
+            id="text_table", figure=dash_data_table(data_frame=data_frame, id="underlying_table_id"), page_size=2
+        )
+        table.pre_build()
+        return table
+
+    def test_invalid_page_size(self, standard_dash_table):
+        with pytest.raises(ValidationError, match="ensure this value is greater than 0"):
+            vm.Table(figure=standard_dash_table, page_size=0)
+
+    def test_pre_build_no_underlying_table_id_exception(self, standard_dash_table):
+        table = vm.Table(id="text_table", figure=standard_dash_table, page_size=10)
+        with pytest.raises(ValueError, match="Underlying `Table` callable has no attribute 'id'"):
+            table.pre_build()
+
+    def test_table_build(self, paged_table):
+        table, paging_state = paged_table.build().children.children[1].children
+        assert (table.id, table.page_action, table.sort_action, table.filter_action, table.page_size) == (
+            "underlying_table_id",
+            "custom",
+            "custom",
+            "custom",
+            2,
+        )
+        assert paging_state.id == "text_table_paging_state"
+
+    def test_table_call_first_page_only(self, paged_table):
+        table, paging_state = paged_table.__call__()
+        assert table.data == [{"country": "c", "pop": 3}, {"country": "a", "pop": 1}]
+        assert (table.page_current, table.page_size, table.page_count) == (0, 2, 3)
+        assert paging_state.data == {"filters": [], "filter_interaction": [], "columns": ["country", "pop"]}
+
+    def test_get_page(self, paged_table):
+        _, paging_state = paged_table.__call__()
+        paging_state.data["columns"] = ["country"]
+        page, page_count = paged_table._get_page(
+            1, 2, [{"column_id": "pop", "direction": "desc"}], "{pop} > 1", paging_state.data
+        )
+        assert page.to_dict("records") == [{"country": "c"}, {"country": "b"}]
+        assert page_count == 2
+
+    def test_unfiltered_data_not_copied_or_cached(self, paged_table):
+        _, paging_state = paged_table.__call__()
+        data_frame = paged_table._get_paging_data(paging_state.data, [], "")
+        assert data_frame is data_manager._get_original_data(data_manager._get_component_dataset("text_table"))
+        assert not paged_table._paging_cache
+
+    def test_paging_data_cached(self, paged_table, mocker):
+        _, paging_state = paged_table.__call__()
+        spy = mocker.spy(vizro.models._components.table, "_apply_sort_by")
+        sort_by = [{"column_id": "pop", "direction": "desc"}]
+        first = paged_table._get_paging_data(paging_state.data, sort_by, "")
+        assert paged_table._get_paging_data(paging_state.data, sort_by, "") is first
+        assert spy.call_count == 1
+        assert paged_table._paging_cache_total_size == first.memory_usage(deep=True).sum()
+
+    def test_paging_cache_bounded_by_size(self, paged_table, monkeypatch):
+        _, paging_state = paged_table.__call__()
+        sort_by = [{"column_id": "pop", "direction": "desc"}]
+        size = paged_table._get_paging_data(paging_state.data, sort_by, "").memory_usage(deep=True).sum()
+        paged_table._paging_cache.clear()
+        paged_table._paging_cache_total_size = 0
+        monkeypatch.setattr(vizro.models._components.table, "PAGING_CACHE_SIZE", 2 * size)
+        for filter_query in ["{pop} > 0", "{pop} > -1", "{pop} > -2"]:
+            paged_table._get_paging_data(paging_state.data, sort_by, filter_query)
+        assert len(paged_table._paging_cache) == 2
+        assert paged_table._paging_cache_total_size == 2 * size
+
+    def test_custom_table_function_exception(self):
+        @capture("table")
+        def custom_table(data_frame):
+            return dash_table.DataTable(id="underlying_table_id", data=data_frame.head(1).to_dict("records"))
+
+        table = vm.Table(id="text_table", figure=custom_table(data_frame=pd.DataFrame({"pop": [1]})), page_size=2)
+        with pytest.raises(
+            ValueError, match="`page_size` can only be set for a `Table` created with `dash_data_table`"
+        ):
+            table.pre_build()
+
+    def test_table_without_columns(self):
+        data_frame = pd.DataFrame({"country": ["c", "a", "b"], "pop": [3, 1, 2]})
+        table = vm.Table(
+            id="text_table",
+            figure=dash_data_table(data_frame=data_frame, id="underlying_table_id", columns=[]),
+            page_size=2,
+        )
+        table.pre_build()
+        _, paging_state = table.__call__()
+        assert paging_state.data["columns"] == ["country", "pop"]
+
+    def test_paging_data_cached_by_filter_values(self, paged_table):
+        page = vm.Page(
+            title="Test page",
+            components=[paged_table],
+            controls=[vm.Filter(column="country", selector=vm.Checklist(id="country_checklist"))],
+        )
+        page.controls[0].pre_build()
+        _, paging_state = paged_table.__call__()
+        ctd_filter = {
+            "id": "country_checklist",
+            "property": "value",
+            "value": ["a", "b"],
+            "str_id": "country_checklist",
+        }
+        first = paged_table._get_paging_data(
+            {**paging_state.data, "filters": [{**ctd_filter, "triggered": True}]}, [], ""
+        )
+        second = paged_table._get_paging_data(
+            {**paging_state.data, "filters": [{**ctd_filter, "triggered": False}]}, [], ""
+        )
+        assert first.to_dict("records") == [{"country": "a", "pop": 1}, {"country": "b", "pop": 2}]
+        assert second is first
+
+
+class TestTableColumnarData:
+    @pytest.fixture
+    def data_frame(self):
+        return pd.DataFrame(
+            {"country": ["a", "b", "c", "d"], "continent": ["x", "x", None, "x"], "pop": [1.0, float("nan"), 3.0, 4.0]}
+        )
+
+    def test_to_columnar_data(self, data_frame):
+        columnar_data = _to_columnar_data(data_frame)
+        assert columnar_data["length"] == 4
+        assert columnar_data["columns"]["country"].tolist() == ["a", "b", "c", "d"]
+        assert columnar_data["columns"]["continent"]["codes"].tolist() == [0, 0, -1, 0]
+        assert columnar_data["columns"]["continent"]["values"] == ["x"]
+        np.testing.assert_array_equal(columnar_data["columns"]["pop"], data_frame["pop"].to_numpy())
+
+    def test_to_columnar_data_serialized(self, data_frame):
+        serialized = json.loads(json.dumps(_to_columnar_data(data_frame), cls=plotly.utils.PlotlyJSONEncoder))
+        assert serialized["columns"]["pop"] == [1.0, None, 3.0, 4.0]
+
+    def test_table_call(self, data_frame):
+        table = vm.Table(
+            id="text_table", figure=dash_data_table(data_frame=data_frame, id="underlying_table_id"), columnar_data=True
+        )
+        table.pre_build()
+        underlying_table, columnar_data = table.__call__()
+        assert underlying_table.data == []
+        assert [column["id"] for column in underlying_table.columns] == ["country", "continent", "pop"]
+        assert columnar_data.id == "text_table_columnar_data"
+        assert columnar_data.data["length"] == 4
+
+    def test_table_build(self, data_frame):
+        table = vm.Table(
+            id="text_table",
+            figure=dash_data_table(data_frame=data_frame, id="underlying_table_id"),
+            columnar_data=True,
+            page_size=2,
+        )
+        table.pre_build()
+        underlying_table, _, columnar_data = table.build().children.children[1].children
+        assert underlying_table.id == "underlying_table_id"
+        assert columnar_data.id == "text_table_columnar_data"
+
+
+class TestApplyFilterQuery:
+    @pytest.fixture
+    def data_frame(self):
+        return pd.DataFrame({"country": ["Albania", "Algeria", "Zambia"], "pop": [3.0, 1.0, 2.0]})
+
+    @pytest.mark.parametrize(
+        "filter_query, expected",
+        [
+            ("", ["Albania", "Algeria", "Zambia"]),
+            ("{pop} >= 2", ["Albania", "Zambia"]),
+            ("{pop} ge 2 && {pop} lt 3", ["Zambia"]),
+            ("{pop} = 1", ["Algeria"]),
+            ('{country} = "Zambia"', ["Zambia"]),
+            ("{country} i= zambia", ["Zambia"]),
+            ("{country} contains Al", ["Albania", "Algeria"]),
+            ("{country} icontains al", ["Albania", "Algeria"]),
+            ("{country} datestartswith Z", ["Zambia"]),
+            ("{pop} > text", ["Albania", "Algeria", "Zambia"]),
+            ("{unknown} > 1", ["Albania", "Algeria", "Zambia"]),
+            ("{pop} unknown 1", ["Albania", "Algeria", "Zambia"]),
+        ],
+    )
+    def test_apply_filter_query(self, data_frame, filter_query, expected):
+        assert _apply_filter_query(data_frame, filter_query)["country"].tolist() == expected
+
+    def test_apply_filter_query_mixed_types(self):
+        data_frame = pd.DataFrame({"country": ["Albania", "Algeria", "Zambia"], "code": [1, "b", 3]})
+        assert _apply_filter_query(data_frame, "{code} > a")["country"].tolist() == ["Albania", "Algeria", "Zambia"]
+
+    def test_apply_sort_by(self, data_frame):
+        sort_by = [{"column_id": "pop", "direction": "asc"}, {"column_id": "unknown", "direction": "asc"}]
+        assert _apply_sort_by(data_frame, sort_by)["country"].tolist() == ["Algeria", "Zambia", "Albania"]
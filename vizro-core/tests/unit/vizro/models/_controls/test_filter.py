@@ -2,7 +2,8 @@ import pandas as pd
 import pytest
 
 import vizro.models as vm
-from vizro.managers import model_manager
+from vizro.managers import data_manager, model_manager
+from vizro.managers._data_index import CategoryIndex, SortedIndex
 from vizro.models._action._actions_chain import ActionsChain
 from vizro.models._controls.filter import Filter, _filter_between, _filter_isin
 from vizro.models.types import CapturedCallable
@@ -172,6 +173,13 @@ class TestPreBuildMethod:
         filter.pre_build()
         assert filter.selector.options == ["Africa", "Europe"]
 
+    def test_pre_build_does_not_copy_data(self, managers_one_page_two_graphs, mocker):
+        filter = vm.Filter(column="continent")
+        model_manager["test_page"].controls = [filter]
+        get_component_data = mocker.spy(data_manager, "_get_component_data")
+        filter.pre_build()
+        get_component_data.assert_not_called()
+
     @pytest.mark.parametrize("test_input", ["country", "year", "lifeExp"])
     def test_set_actions(self, test_input, managers_one_page_two_graphs):
         filter = vm.Filter(column=test_input)
@@ -182,6 +190,30 @@ class TestPreBuildMethod:
         assert isinstance(default_action.actions[0].function, CapturedCallable)
         assert default_action.actions[0].id == f"filter_action_{filter.id}"
 
+    @pytest.mark.parametrize(
+        "test_column, test_selector, expected_index_type",
+        [
+            ("continent", vm.Dropdown(), CategoryIndex),
+            ("pop", vm.Slider(), CategoryIndex),
+            ("pop", vm.RangeSlider(), SortedIndex),
+        ],
+    )
+    def test_set_filter_indexes(self, test_column, test_selector, expected_index_type, managers_one_page_two_graphs):
+        data_manager.filter_indexes = True
+        filter = vm.Filter(column=test_column, selector=test_selector)
+        model_manager["test_page"].controls = [filter]
+        filter.pre_build()
+        for target in ["scatter_chart", "bar_chart"]:
+            assert isinstance(
+                data_manager._get_filter_index(target, test_column, expected_index_type), expected_index_type
+            )
+
+    def test_no_filter_indexes_by_default(self, managers_one_page_two_graphs):
+        filter = vm.Filter(column="continent")
+        model_manager["test_page"].controls = [filter]
+        filter.pre_build()
+        assert data_manager._get_filter_index("scatter_chart", "continent", CategoryIndex) is None
+
 
 @pytest.mark.usefixtures("managers_one_page_two_graphs")
 class TestFilterBuild:
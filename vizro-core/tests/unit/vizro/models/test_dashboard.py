@@ -15,8 +15,10 @@ except ImportError:  # pragma: no cov
 
 import vizro
 import vizro.models as vm
+import vizro.plotly.express as px
 from vizro import Vizro
 from vizro.actions._action_loop._action_loop import ActionLoop
+from vizro.managers import data_manager
 from vizro.models._dashboard import _all_hidden
 
 
@@ -219,6 +221,51 @@ class TestDashboardBuild:
         expected = json.loads(json.dumps(dashboard_container, cls=plotly.utils.PlotlyJSONEncoder))
         assert result == expected
 
+    def test_build_with_data_workers(self, gapminder, mocker):
+        data_manager["gapminder"] = lambda: gapminder
+        dashboard = vm.Dashboard(
+            pages=[
+                vm.Page(
+                    title="Test page",
+                    components=[vm.Graph(figure=px.scatter("gapminder", x="gdpPercap", y="lifeExp"))],
+                    controls=[vm.Filter(column="continent")],
+                )
+            ]
+        )
+        load_lazy_datasets = mocker.spy(data_manager, "_load_lazy_datasets")
+        Vizro(data_workers=2).build(dashboard)
+        load_lazy_datasets.assert_called_once_with(workers=2)
+        # The dataset is not loaded again by pre_build.
+        assert data_manager._get_dataset_version("gapminder") == 1
+
+
+class TestDashboardPageLayout:
+    """Tests that page layouts are only built again when needed."""
+
+    @pytest.fixture
+    def dashboard(self, vizro_app, page_1, page_2):
+        dashboard = vm.Dashboard(pages=[page_1, page_2])
+        Vizro._pre_build()
+        return dashboard
+
+    def test_page_layout_cached(self, dashboard, page_1, page_2, mocker):
+        get_page_divs = mocker.spy(vm.Dashboard, "_get_page_divs")
+        page_1_layout = dashboard._make_page_layout(page_1)
+        assert dashboard._make_page_layout(page_1) is page_1_layout
+        assert dashboard._make_page_layout(page_2) is not page_1_layout
+        assert get_page_divs.call_count == 2
+
+    def test_page_layout_built_again_after_assets_change(self, vizro_app, dashboard, page_1):
+        page_1_layout = dashboard._make_page_layout(page_1)
+        # Dash hot reloading changes its hash whenever the assets change.
+        vizro_app.dash._hot_reload.hash = "new_hash"
+        assert dashboard._make_page_layout(page_1) is not page_1_layout
+
+    def test_page_layout_built_again_after_dashboard_built_again(self, dashboard, page_1):
+        page_1_layout = dashboard._make_page_layout(page_1)
+        dashboard.build()
+        assert dashboard._make_page_layout(page_1) is not page_1_layout
+
 
 @pytest.mark.parametrize(
     "components, expected",